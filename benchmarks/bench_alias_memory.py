@@ -0,0 +1,65 @@
+"""
+Benchmark for the memory saved by sharing zones between aliases.
+
+This loads every available key with :func:`pytz_deprecation_shim.timezone`,
+with and without ``set_alias_deduplication``, and reports the memory
+allocated for the zones (as measured by ``tracemalloc``), the time taken and
+the number of distinct underlying zones.
+
+Run from the repository root with ``python benchmarks/bench_alias_memory.py``.
+"""
+import gc
+import time
+import tracemalloc
+import zoneinfo
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _sources
+
+
+def run(keys, enabled):
+    pds.set_alias_deduplication(enabled)
+    pds.clear_cache()
+    zoneinfo.ZoneInfo.clear_cache()
+    gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    zones = [pds.timezone(key) for key in keys]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    distinct = len({id(zone.unwrap_shim()) for zone in zones})
+    print(
+        "%-14s %10.1f kB %8.0f ms %8d zones"
+        % (
+            "shared" if enabled else "separate",
+            allocated / 1024,
+            elapsed * 1000,
+            distinct,
+        )
+    )
+
+    return allocated
+
+
+def main():
+    keys = sorted(key for key in _sources.available_keys() if key != "UTC")
+    links = sum(_sources.get_link_target(key) is not None for key in keys)
+    print("%d keys, %d of which are links" % (len(keys), links))
+
+    separate = run(keys, False)
+    shared = run(keys, True)
+    print(
+        "Saved %.1f kB (%.0f%%)"
+        % ((separate - shared) / 1024, 100 * (separate - shared) / separate)
+    )
+
+    pds.set_alias_deduplication(False)
+    pds.clear_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark of ``ambiguous_mask`` and ``imaginary_mask`` against checking each
+wall time with ``is_ambiguous`` and ``is_imaginary``.
+
+The input is a column of ten million random wall times (in nanoseconds) over
+several decades, some of which fall in DST gaps or folds. The per-value loop is
+timed on a sample of the column and scaled up.
+
+Run from the repository root with ``python benchmarks/bench_array_masks.py``
+(requires NumPy).
+"""
+import timeit
+
+import numpy as np
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _compat
+
+KEY = "America/New_York"
+ROWS = 10000000
+SAMPLE = 100000
+REPEAT = 3
+
+
+def _inputs():
+    rng = np.random.default_rng(0)
+    start = np.datetime64("1990-01-01", "ns").astype(np.int64)
+    end = np.datetime64("2030-01-01", "ns").astype(np.int64)
+
+    return rng.integers(start, end, ROWS).view("M8[ns]")
+
+
+def _scalar_loop(zone, dts):
+    is_ambiguous = _compat.is_ambiguous
+    is_imaginary = _compat.is_imaginary
+    ambiguous = []
+    imaginary = []
+    for dt in dts:
+        dt = dt.replace(tzinfo=zone)
+        ambiguous.append(is_ambiguous(dt))
+        imaginary.append(is_imaginary(dt))
+
+    return ambiguous, imaginary
+
+
+def _masks(zone, values):
+    return zone.ambiguous_mask(values), zone.imaginary_mask(values)
+
+
+def main():
+    zone = pds.timezone(KEY)
+    values = _inputs()
+    sample = values[:SAMPLE].astype("M8[us]").astype(object)
+
+    ambiguous, imaginary = _masks(zone, values[:SAMPLE])
+    assert (ambiguous.tolist(), imaginary.tolist()) == _scalar_loop(
+        zone, sample
+    )
+
+    baseline = min(
+        timeit.repeat(
+            lambda: _scalar_loop(zone, sample), number=1, repeat=REPEAT
+        )
+    )
+    candidate = min(
+        timeit.repeat(lambda: _masks(zone, values), number=1, repeat=REPEAT)
+    )
+
+    print("%d rows" % len(values))
+    print("checks per row: %8.1f ns/row" % (baseline / SAMPLE * 1e9))
+    print("masks:          %8.1f ns/row" % (candidate / len(values) * 1e9))
+    print("speedup:        %8.1fx" % (baseline / SAMPLE / candidate * ROWS))
+
+
+if __name__ == "__main__":
+    main()
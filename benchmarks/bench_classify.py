@@ -0,0 +1,112 @@
+"""
+Benchmark of ``classify`` and ``localize`` on fold- and gap-heavy inputs.
+
+Each input set holds one wall time per year in a DST gap or fold of the zone
+(or well away from both), so every call in the gap and fold sets needs both
+candidate offsets. Zones loaded with ``timezone`` resolve these using their
+transition table; zones built from a file object have no table, and fall back
+to querying the zone for each fold.
+
+Run from the repository root with ``python benchmarks/bench_classify.py``.
+"""
+import datetime
+import timeit
+import warnings
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _sources
+
+KEY = "America/New_York"
+YEARS = range(1970, 2030)
+REPEAT = 5
+
+
+def _get_zones():
+    with_table = pds.timezone(KEY)
+    with open(_sources.find_zone_file(KEY), "rb") as f:
+        without_table = pds.build_tzinfo(KEY, f)
+
+    assert with_table._get_transition_table() is not None
+    assert without_table._get_transition_table() is None
+
+    return with_table, without_table
+
+
+def _inputs(zone):
+    # The transitions at 02:00 (or 01:00) local time in the spring and fall
+    inputs = {"normal": [], "gap": [], "fold": []}
+    for year in YEARS:
+        inputs["normal"].append(datetime.datetime(year, 7, 1, 12))
+        for month in range(1, 13):
+            for day in range(1, 32):
+                try:
+                    dt = datetime.datetime(year, month, day, 1, 30)
+                except ValueError:
+                    continue
+
+                for hour in (1, 2):
+                    kind = zone.classify(dt.replace(hour=hour)).kind
+                    if kind == "imaginary":
+                        inputs["gap"].append(dt.replace(hour=hour))
+                    elif kind == "ambiguous":
+                        inputs["fold"].append(dt.replace(hour=hour))
+
+    return inputs
+
+
+def _time(func, dts):
+    def run():
+        for dt in dts:
+            func(dt)
+
+    number = max(1, 20000 // len(dts))
+    best = min(timeit.repeat(run, number=number, repeat=REPEAT))
+
+    return best / (number * len(dts)) * 1e9
+
+
+def _localize(zone, is_dst):
+    def localize(dt):
+        try:
+            return zone.localize(dt, is_dst=is_dst)
+        except pds.InvalidTimeError:
+            return None
+
+    return localize
+
+
+def main():
+    warnings.simplefilter("ignore", pds.PytzUsageWarning)
+
+    with_table, without_table = _get_zones()
+    inputs = _inputs(with_table)
+
+    operations = [
+        ("classify", lambda zone: zone.classify),
+        ("localize(is_dst=True)", lambda zone: _localize(zone, True)),
+        ("localize(is_dst=None)", lambda zone: _localize(zone, None)),
+    ]
+
+    print(
+        "%-22s %-7s %6s %13s %13s %8s"
+        % ("operation", "inputs", "count", "no table", "table", "speedup")
+    )
+    for name, get_func in operations:
+        for kind, dts in sorted(inputs.items()):
+            without_time = _time(get_func(without_table), dts)
+            with_time = _time(get_func(with_table), dts)
+            print(
+                "%-22s %-7s %6d %10.1f ns %10.1f ns %7.2fx"
+                % (
+                    name,
+                    kind,
+                    len(dts),
+                    without_time,
+                    with_time,
+                    without_time / with_time,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark for the memory shared between pre-forked worker processes.
+
+For each scenario, a fresh parent process imports the shim, optionally warms
+it up, and then forks a number of workers (like a pre-forking server). Every
+worker looks up all available zones, uses each of them once, runs a full
+garbage collection and reports its private memory (``Private_Clean`` plus
+``Private_Dirty`` from ``/proc/self/smaps_rollup``), i.e. the memory that is
+not shared with the parent. The scenarios are:
+
+- ``lazy``: the parent loads nothing, so each worker loads every zone itself.
+- ``preload``: the parent calls ``preload()`` before forking.
+- ``prepare_for_fork``: the parent calls ``prepare_for_fork()``, which also
+  freezes the loaded objects with ``gc.freeze()``.
+
+This only runs on Linux. Run from the repository root with
+``python benchmarks/bench_fork_memory.py``.
+"""
+import datetime
+import gc
+import os
+import subprocess
+import sys
+
+SCENARIOS = ("lazy", "preload", "prepare_for_fork")
+WORKERS = 4
+
+
+def private_memory_kb():
+    total = 0
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def worker(keys, write_fd):
+    import pytz_deprecation_shim as pds
+
+    gc.enable()
+    dt = datetime.datetime(2020, 6, 1)
+    for key in keys:
+        dt.replace(tzinfo=pds.timezone(key)).utcoffset()
+    gc.collect()
+
+    os.write(write_fd, ("%d\n" % private_memory_kb()).encode())
+
+
+def run_scenario(scenario):
+    gc.disable()
+
+    import pytz_deprecation_shim as pds
+    from pytz_deprecation_shim import _sources
+
+    keys = sorted(_sources.available_keys())
+    if scenario == "preload":
+        pds.preload(keys)
+    elif scenario == "prepare_for_fork":
+        pds.prepare_for_fork(keys)
+
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(WORKERS):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                worker(keys, write_fd)
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    for pid in pids:
+        os.waitpid(pid, 0)
+    os.close(write_fd)
+
+    with os.fdopen(read_fd) as f:
+        sizes = [int(line) for line in f]
+
+    print("%d %d" % (len(keys), sum(sizes) // len(sizes)))
+
+
+def main():
+    if len(sys.argv) > 1:
+        run_scenario(sys.argv[1])
+        return
+
+    print("%-18s %8s %22s" % ("scenario", "zones", "private kB per worker"))
+    for scenario in SCENARIOS:
+        output = subprocess.check_output(
+            [sys.executable, __file__, scenario]
+        ).decode()
+        n_keys, private_kb = output.split()
+        print("%-18s %8s %22s" % (scenario, n_keys, private_kb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of ``fromutc_array`` against ``datetime.fromtimestamp`` per value.
+
+The input is a column of ten million random UTC instants (as integer epoch
+seconds) over several decades. The per-value loop is timed on a sample of the
+column and scaled up.
+
+Run from the repository root with ``python benchmarks/bench_fromutc_array.py``
+(requires NumPy).
+"""
+import datetime
+import timeit
+
+import numpy as np
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+ROWS = 10000000
+SAMPLE = 100000
+REPEAT = 3
+
+
+def _inputs():
+    rng = np.random.default_rng(0)
+    return rng.integers(631152000, 1893456000, ROWS)
+
+
+def _fromtimestamp_loop(zone, timestamps):
+    fromtimestamp = datetime.datetime.fromtimestamp
+    return [fromtimestamp(ts, zone) for ts in timestamps]
+
+
+def main():
+    zone = pds.timezone(KEY)
+    timestamps = _inputs()
+    sample = timestamps[:SAMPLE].tolist()
+
+    baseline = min(
+        timeit.repeat(
+            lambda: _fromtimestamp_loop(zone, sample), number=1, repeat=REPEAT
+        )
+    )
+    candidate = min(
+        timeit.repeat(
+            lambda: zone.fromutc_array(timestamps), number=1, repeat=REPEAT
+        )
+    )
+
+    print("%d rows" % len(timestamps))
+    print("fromtimestamp per row: %8.1f ns/row" % (baseline / SAMPLE * 1e9))
+    print(
+        "fromutc_array:         %8.1f ns/row"
+        % (candidate / len(timestamps) * 1e9)
+    )
+    print(
+        "speedup:               %8.1fx" % (baseline / SAMPLE / candidate * ROWS)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of ``localize_array`` against calling ``localize`` once per value.
+
+The input is a column of ten million random wall times (in nanoseconds) over
+several decades, some of which fall in DST gaps or folds. The per-value loop
+is timed on a sample of the column and scaled up.
+
+Run from the repository root with ``python benchmarks/bench_localize_array.py``
+(requires NumPy).
+"""
+import timeit
+import warnings
+
+import numpy as np
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+ROWS = 10000000
+SAMPLE = 100000
+REPEAT = 3
+
+
+def _inputs():
+    rng = np.random.default_rng(0)
+    start = np.datetime64("1990-01-01", "ns").astype(np.int64)
+    end = np.datetime64("2030-01-01", "ns").astype(np.int64)
+
+    return rng.integers(start, end, ROWS).view("M8[ns]")
+
+
+def _localize_loop(zone, dts):
+    localize = zone.localize
+    return [localize(dt, is_dst=False) for dt in dts]
+
+
+def main():
+    zone = pds.timezone(KEY)
+    values = _inputs()
+    sample = values[:SAMPLE].astype("M8[us]").astype(object)
+
+    warnings.simplefilter("ignore", pds.PytzUsageWarning)
+
+    baseline = min(
+        timeit.repeat(
+            lambda: _localize_loop(zone, sample), number=1, repeat=REPEAT
+        )
+    )
+    candidate = min(
+        timeit.repeat(
+            lambda: zone.localize_array(values, is_dst=False),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+
+    print("%d rows" % len(values))
+    print("localize per row: %8.1f ns/row" % (baseline / SAMPLE * 1e9))
+    print("localize_array:   %8.1f ns/row" % (candidate / len(values) * 1e9))
+    print("speedup:          %8.1fx" % (baseline / SAMPLE / candidate * ROWS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of ``localize_many`` against calling ``localize`` once per row.
+
+The input is a million naive datetimes a few minutes apart, in order, as in a
+typical ingest of timestamped records; the few that fall in a DST gap or fold
+are dropped. Both loops localize with ``is_dst=False``, so ``localize``
+checks each row for ambiguity, and the per-row loop emits a warning for each
+row, while ``localize_many`` emits one per call.
+
+Run from the repository root with ``python benchmarks/bench_localize_many.py``.
+"""
+import datetime
+import timeit
+import warnings
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+ROWS = 1000000
+STEP = datetime.timedelta(minutes=7, seconds=13)
+REPEAT = 3
+
+
+def _inputs(zone):
+    start = datetime.datetime(2010, 1, 1)
+    dts = (start + i * STEP for i in range(ROWS))
+
+    return [dt for dt in dts if zone.classify(dt).kind == "normal"]
+
+
+def _localize_loop(zone, dts):
+    localize = zone.localize
+    return [localize(dt, is_dst=False) for dt in dts]
+
+
+def _localize_many(zone, dts):
+    return list(zone.localize_many(dts, is_dst=False))
+
+
+def main():
+    zone = pds.timezone(KEY)
+    dts = _inputs(zone)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pds.PytzUsageWarning)
+        assert _localize_loop(zone, dts[:1000]) == _localize_many(
+            zone, dts[:1000]
+        )
+
+        baseline = min(
+            timeit.repeat(
+                lambda: _localize_loop(zone, dts), number=1, repeat=REPEAT
+            )
+        )
+        candidate = min(
+            timeit.repeat(
+                lambda: _localize_many(zone, dts), number=1, repeat=REPEAT
+            )
+        )
+
+    print("%d rows" % len(dts))
+    print("localize per row: %8.1f ns/row" % (baseline / len(dts) * 1e9))
+    print("localize_many:    %8.1f ns/row" % (candidate / len(dts) * 1e9))
+    print("speedup:          %8.2fx" % (baseline / candidate))
+
+
+if __name__ == "__main__":
+    main()
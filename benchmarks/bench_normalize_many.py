@@ -0,0 +1,85 @@
+"""
+Benchmark of ``normalize_many`` and ``astimezone_many`` against calling
+``normalize`` or ``astimezone`` once per row.
+
+The input is a million aware datetimes a few minutes apart, in order, half of
+them in UTC and half of them in another zone, as after the arithmetic steps
+that pytz-era code follows with ``normalize``.
+
+Run from the repository root with ``python benchmarks/bench_normalize_many.py``.
+"""
+import datetime
+import timeit
+import warnings
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+SOURCE_KEY = "Europe/London"
+ROWS = 1000000
+STEP = datetime.timedelta(minutes=7, seconds=13)
+REPEAT = 3
+
+
+def _inputs():
+    source = pds.timezone(SOURCE_KEY)
+    start = datetime.datetime(2010, 1, 1, tzinfo=pds.UTC)
+
+    dts = []
+    for i in range(ROWS):
+        dt = start + i * STEP
+        if i % 2:
+            dt = dt.astimezone(source)
+
+        dts.append(dt)
+
+    return dts
+
+
+def _normalize_loop(zone, dts):
+    normalize = zone.normalize
+    return [normalize(dt) for dt in dts]
+
+
+def _astimezone_loop(zone, dts):
+    return [dt.astimezone(zone) for dt in dts]
+
+
+def _normalize_many(zone, dts):
+    return list(zone.normalize_many(dts))
+
+
+def _astimezone_many(zone, dts):
+    return list(zone.astimezone_many(dts))
+
+
+def _time(func, zone, dts):
+    return min(
+        timeit.repeat(lambda: func(zone, dts), number=1, repeat=REPEAT)
+    )
+
+
+def main():
+    zone = pds.timezone(KEY)
+    dts = _inputs()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pds.PytzUsageWarning)
+        assert _normalize_loop(zone, dts[:1000]) == _normalize_many(
+            zone, dts[:1000]
+        )
+
+        timings = [
+            ("normalize per row:", _time(_normalize_loop, zone, dts)),
+            ("normalize_many:", _time(_normalize_many, zone, dts)),
+            ("astimezone per row:", _time(_astimezone_loop, zone, dts)),
+            ("astimezone_many:", _time(_astimezone_many, zone, dts)),
+        ]
+
+    print("%d rows" % len(dts))
+    for name, timing in timings:
+        print("%-20s %8.1f ns/row" % (name, timing / len(dts) * 1e9))
+
+
+if __name__ == "__main__":
+    main()
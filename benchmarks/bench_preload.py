@@ -0,0 +1,70 @@
+"""
+Benchmark for ``preload()``.
+
+Each run clears the shim caches (and the ``zoneinfo`` cache, so that the TZif
+files are really parsed again) and then loads every available zone, first with
+one ``timezone()`` call per key in a loop, then with ``preload()`` at
+increasing numbers of worker threads.
+
+Run from the repository root with ``python benchmarks/bench_preload.py``.
+"""
+import time
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _compat, _sources
+
+WORKER_COUNTS = (1, 2, 4, 8, 16)
+
+
+def reset():
+    pds.clear_cache()
+    if _compat.ZoneInfo is not None:
+        _compat.ZoneInfo.clear_cache()
+
+
+def run_serial(keys):
+    reset()
+    start = time.perf_counter()
+    for key in keys:
+        pds.timezone(key)
+    return time.perf_counter() - start
+
+
+def run_preload(keys, workers):
+    reset()
+    start = time.perf_counter()
+    result = pds.preload(keys, workers=workers)
+    elapsed = time.perf_counter() - start
+
+    slowest = max(result.loaded.values())
+    return elapsed, len(result.loaded), len(result.failed), slowest
+
+
+def main():
+    keys = sorted(_sources.available_keys())
+    print("%d available keys" % len(keys))
+    print()
+
+    print(
+        "%-16s %10s %8s %8s %12s" % ("", "total", "loaded", "failed", "slowest")
+    )
+    print(
+        "%-16s %7.1f ms %8d %8s %12s"
+        % ("timezone() loop", run_serial(keys) * 1000, len(keys), "-", "-")
+    )
+    for workers in WORKER_COUNTS:
+        elapsed, loaded, failed, slowest = run_preload(keys, workers)
+        print(
+            "%-16s %7.1f ms %8d %8d %9.2f ms"
+            % (
+                "preload(%d)" % workers,
+                elapsed * 1000,
+                loaded,
+                failed,
+                slowest * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Cold-start benchmark for ``save_snapshot()`` and ``load_snapshot()``.
+
+A snapshot of every available zone is written to a temporary file. Then, for
+each scenario, a number of fresh processes are started which each import the
+shim and load every zone through ``timezone()``:
+
+- ``provider``: each zone is found on the search path and parsed from its own
+  file, as usual.
+- ``snapshot``: the snapshot is loaded (and validated) first, so each zone is
+  parsed from the memory-mapped snapshot.
+
+The script reports the median time spent in the process loading the zones
+(including loading the snapshot) and the median wall time of the whole
+process.
+
+Run from the repository root with
+``python benchmarks/bench_snapshot_cold_start.py``.
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RUNS = 15
+
+CHILD_CODE = """
+import sys, time
+import pytz_deprecation_shim as pds
+keys = sys.argv[2].split(",")
+load_start = time.perf_counter()
+if sys.argv[1]:
+    assert pds.load_snapshot(sys.argv[1])
+for key in keys:
+    pds.timezone(key)
+print(time.perf_counter() - load_start)
+"""
+
+
+def run(snapshot_path, keys):
+    args = [sys.executable, "-c", CHILD_CODE, snapshot_path, ",".join(keys)]
+    start = time.perf_counter()
+    output = subprocess.check_output(args)
+    wall = time.perf_counter() - start
+
+    return float(output), wall
+
+
+def main():
+    import pytz_deprecation_shim as pds
+    from pytz_deprecation_shim import _sources
+
+    keys = sorted(_sources.available_keys())
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        snapshot_path = os.path.join(tmp_dir, "zones.snapshot")
+        pds.save_snapshot(snapshot_path, keys=keys)
+        print(
+            "%d zones, snapshot is %.1f kB"
+            % (len(keys), os.path.getsize(snapshot_path) / 1024)
+        )
+        print()
+
+        print("%-10s %14s %14s" % ("scenario", "loading zones", "process"))
+        for name, path in (("provider", ""), ("snapshot", snapshot_path)):
+            timings = [run(path, keys) for _ in range(RUNS)]
+            load_times, wall_times = zip(*timings)
+            print(
+                "%-10s %11.1f ms %11.1f ms"
+                % (
+                    name,
+                    statistics.median(load_times) * 1000,
+                    statistics.median(wall_times) * 1000,
+                )
+            )
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
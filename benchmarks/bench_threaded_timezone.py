@@ -0,0 +1,106 @@
+"""
+Multi-threaded contention benchmark for ``timezone()``.
+
+Each round clears the shim caches (and the ``zoneinfo`` cache, so that the
+TZif files are really parsed again), then starts a number of threads which all
+look up the same set of keys at once. The script reports the wall time of the
+cold round, how many times the underlying zone was actually loaded, and the
+throughput of the warm (cached) lookups that follow, for increasing thread
+counts.
+
+Run from the repository root with ``python benchmarks/bench_threaded_timezone.py``.
+"""
+import threading
+import time
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _compat
+
+KEYS = (
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "Europe/London",
+    "Europe/Paris",
+    "Europe/Berlin",
+    "Asia/Tokyo",
+    "Asia/Kolkata",
+    "Australia/Sydney",
+)
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+WARM_LOOKUPS = 20000
+
+
+class LoadCounter(object):
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._get_timezone = _compat.get_timezone
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.count += 1
+        return self._get_timezone(*args, **kwargs)
+
+
+def run_round(n_threads):
+    pds.clear_cache()
+    if _compat.ZoneInfo is not None:
+        _compat.ZoneInfo.clear_cache()
+
+    counter = LoadCounter()
+    _compat.get_timezone = counter
+    barrier = threading.Barrier(n_threads)
+    timings = {"cold": [], "warm": []}
+
+    def timed(name, func):
+        barrier.wait()
+        start = time.perf_counter()
+        func()
+        timings[name].append((start, time.perf_counter()))
+
+    def cold():
+        for key in KEYS:
+            pds.timezone(key)
+
+    def warm():
+        for i in range(WARM_LOOKUPS):
+            pds.timezone(KEYS[i % len(KEYS)])
+
+    def worker():
+        timed("cold", cold)
+        timed("warm", warm)
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        _compat.get_timezone = counter._get_timezone
+
+    def elapsed(name):
+        starts, ends = zip(*timings[name])
+        return max(ends) - min(starts)
+
+    warm_rate = n_threads * WARM_LOOKUPS / elapsed("warm")
+    return elapsed("cold"), counter.count, warm_rate
+
+
+def main():
+    print(
+        "%8s %12s %8s %18s"
+        % ("threads", "cold round", "loads", "warm lookups/s")
+    )
+    for n_threads in THREAD_COUNTS:
+        cold_time, loads, warm_rate = run_round(n_threads)
+        print(
+            "%8d %9.2f ms %8d %18.0f"
+            % (n_threads, cold_time * 1000, loads, warm_rate)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of ``try_localize`` against ``localize`` with exception handling.
+
+The input is a list of naive datetimes in which a fraction (``BAD_FRACTION``)
+fall in a DST gap or fold, as happens when ingesting data recorded in wall
+time. The baseline calls ``localize(dt, is_dst=None)`` and catches the
+exceptions raised for the bad rows; ``try_localize`` reports them with a
+status instead.
+
+Run from the repository root with ``python benchmarks/bench_try_localize.py``.
+"""
+import datetime
+import random
+import timeit
+import warnings
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+ROWS = 100000
+BAD_FRACTION = 0.1
+REPEAT = 5
+
+
+def _inputs(zone):
+    rng = random.Random(0)
+    anomalies = zone.anomalies(
+        datetime.datetime(1990, 1, 1), datetime.datetime(2030, 1, 1)
+    )
+    start = datetime.datetime(1990, 1, 1)
+
+    dts = []
+    for _ in range(ROWS):
+        if rng.random() < BAD_FRACTION:
+            anomaly = rng.choice(anomalies)
+            seconds = (anomaly.end - anomaly.start).total_seconds()
+            dt = anomaly.start + datetime.timedelta(
+                seconds=rng.randrange(int(seconds))
+            )
+        else:
+            dt = start + datetime.timedelta(
+                seconds=rng.randrange(40 * 365 * 86400)
+            )
+            if zone.classify(dt).kind != "normal":
+                dt -= datetime.timedelta(hours=3)
+
+        dts.append(dt)
+
+    return dts
+
+
+def _localize_loop(zone, dts):
+    localize = zone.localize
+    results = []
+    for dt in dts:
+        try:
+            results.append(localize(dt, is_dst=None))
+        except pds.InvalidTimeError:
+            results.append(None)
+
+    return results
+
+
+def _try_localize_loop(zone, dts):
+    try_localize = zone.try_localize
+    return [try_localize(dt).dt for dt in dts]
+
+
+def main():
+    warnings.simplefilter("ignore", pds.PytzUsageWarning)
+
+    zone = pds.timezone(KEY)
+    dts = _inputs(zone)
+
+    assert _localize_loop(zone, dts) == _try_localize_loop(zone, dts)
+
+    baseline = min(
+        timeit.repeat(
+            lambda: _localize_loop(zone, dts), number=1, repeat=REPEAT
+        )
+    )
+    candidate = min(
+        timeit.repeat(
+            lambda: _try_localize_loop(zone, dts), number=1, repeat=REPEAT
+        )
+    )
+
+    print("%d rows, %d%% in gaps or folds" % (len(dts), BAD_FRACTION * 100))
+    print("localize + except: %8.1f ns/row" % (baseline / len(dts) * 1e9))
+    print("try_localize:      %8.1f ns/row" % (candidate / len(dts) * 1e9))
+    print("speedup:           %8.2fx" % (baseline / candidate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Stress benchmark for the memory use of the ``wrap_zone`` cache.
+
+This wraps a large number of short-lived time zones and reports the memory
+allocated (as measured by ``tracemalloc``) and the size of the ``wrap_zone``
+cache at regular intervals. With the default, weakly-referencing cache, both
+should stay flat; for comparison, the same run is repeated with a bounded and
+an unbounded strong cache.
+
+Run from the repository root with ``python benchmarks/bench_wrap_zone_memory.py``.
+Pass a number of iterations as the first argument to change the run length.
+"""
+import datetime
+import gc
+import sys
+import time
+import tracemalloc
+
+import pytz_deprecation_shim as pds
+
+ITERATIONS = 2000000
+REPORTS = 10
+
+
+class ShortLivedZone(datetime.tzinfo):
+    """A zone like those built dynamically by dateutil.tz.tzstr."""
+
+    def __init__(self, minutes):
+        self._offset = datetime.timedelta(minutes=minutes)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        return None
+
+
+def run(iterations, maxsize):
+    pds.clear_cache()
+    pds.set_cache_size(maxsize, names=["wrap_zone"])
+    gc.collect()
+
+    print("wrap_zone maxsize=%r" % (maxsize,))
+    print(
+        "%12s %14s %12s %10s"
+        % ("iterations", "allocated", "cache size", "time")
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    report_every = max(iterations // REPORTS, 1)
+    for i in range(1, iterations + 1):
+        shim = pds.wrap_zone(ShortLivedZone(i % 1440), key=None)
+        shim.utcoffset(None)
+
+        if i % report_every == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            print(
+                "%12d %11.1f kB %12d %9.1fs"
+                % (
+                    i,
+                    current / 1024,
+                    pds.cache_info()["wrap_zone"].currsize,
+                    time.perf_counter() - start,
+                )
+            )
+
+    tracemalloc.stop()
+    print()
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+
+    run(iterations, 0)
+    run(iterations // 10, 1024)
+    run(iterations // 10, None)
+
+    pds.clear_cache()
+    pds.set_cache_size(0, names=["wrap_zone"])
+
+
+if __name__ == "__main__":
+    main()
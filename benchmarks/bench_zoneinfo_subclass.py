@@ -0,0 +1,72 @@
+"""
+Benchmark comparing the wrapper shims with the ``ZoneInfo`` subclass shims.
+
+The wrapper shims forward every ``tzinfo`` protocol call to the underlying
+zone through a Python-level method; the subclass shims inherit the protocol
+methods from ``zoneinfo.ZoneInfo``. This script measures the per-call cost of
+the operations that exercise the protocol most heavily.
+
+Run from the repository root with ``python benchmarks/bench_zoneinfo_subclass.py``.
+"""
+import datetime
+import timeit
+
+import pytz_deprecation_shim as pds
+
+KEY = "America/New_York"
+NUMBER = 200000
+
+
+def _get_zones():
+    wrapper = pds.timezone(KEY)
+
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        subclass = pds.timezone(KEY)
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    return wrapper, subclass
+
+
+def _operations(zone):
+    dt = datetime.datetime(2020, 6, 1, 12, tzinfo=zone)
+    dt_utc = datetime.datetime(2020, 6, 1, 16, tzinfo=datetime.timezone.utc)
+
+    return {
+        "utcoffset": lambda: dt.utcoffset(),
+        "dst": lambda: dt.dst(),
+        "tzname": lambda: dt.tzname(),
+        "compare": lambda: dt < dt_utc,
+        "subtract": lambda: dt_utc - dt,
+        "astimezone": lambda: dt_utc.astimezone(zone),
+    }
+
+
+def main():
+    wrapper, subclass = _get_zones()
+    wrapper_ops = _operations(wrapper)
+    subclass_ops = _operations(subclass)
+
+    print(
+        "%-12s %14s %14s %9s" % ("operation", "wrapper", "subclass", "speedup")
+    )
+    for name, wrapper_op in wrapper_ops.items():
+        subclass_op = subclass_ops[name]
+
+        wrapper_time = min(timeit.repeat(wrapper_op, number=NUMBER, repeat=5))
+        subclass_time = min(timeit.repeat(subclass_op, number=NUMBER, repeat=5))
+
+        print(
+            "%-12s %11.1f ns %11.1f ns %8.2fx"
+            % (
+                name,
+                wrapper_time / NUMBER * 1e9,
+                subclass_time / NUMBER * 1e9,
+                wrapper_time / subclass_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,32 @@ __all__ = [
     "UTC",
     "utc",
     "build_tzinfo",
+    "build_tzinfo_many",
+    "set_build_tzinfo_deduplication",
     "timezone",
     "fixed_offset_timezone",
     "wrap_zone",
+    "set_zoneinfo_subclass_mode",
+    "cache_info",
+    "clear_cache",
+    "set_cache_size",
+    "is_valid_key",
+    "preload",
+    "prepare_for_fork",
+    "save_snapshot",
+    "load_snapshot",
+    "build_bundle",
+    "use_bundle",
+    "register_zones",
+    "publish_shared_zones",
+    "unpublish_shared_zones",
+    "attach_shared_zones",
+    "set_reload_interval",
+    "reload_zones",
+    "add_reload_hook",
+    "remove_reload_hook",
+    "set_case_insensitive_lookup",
+    "set_alias_deduplication",
 ]
 
 from . import helpers
@@ -23,9 +46,32 @@ from ._exceptions import (
 )
 from ._impl import (
     UTC,
+    add_reload_hook,
+    attach_shared_zones,
+    build_bundle,
     build_tzinfo,
+    build_tzinfo_many,
+    cache_info,
+    clear_cache,
     fixed_offset_timezone,
+    is_valid_key,
+    load_snapshot,
+    preload,
+    prepare_for_fork,
+    publish_shared_zones,
+    register_zones,
+    reload_zones,
+    remove_reload_hook,
+    save_snapshot,
+    set_alias_deduplication,
+    set_build_tzinfo_deduplication,
+    set_cache_size,
+    set_case_insensitive_lookup,
+    set_reload_interval,
+    set_zoneinfo_subclass_mode,
     timezone,
+    unpublish_shared_zones,
+    use_bundle,
     wrap_zone,
 )
 
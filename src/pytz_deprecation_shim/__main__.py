@@ -0,0 +1,43 @@
+"""Command line tools for ``pytz_deprecation_shim``.
+
+Usage: ``python -m pytz_deprecation_shim build-bundle PATH [KEY ...]``
+"""
+import argparse
+import sys
+
+from ._exceptions import UnknownTimeZoneError
+from ._impl import build_bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pytz_deprecation_shim")
+    subparsers = parser.add_subparsers(dest="command")
+
+    bundle_parser = subparsers.add_parser(
+        "build-bundle",
+        help="Write the data for many zones to a single bundle file.",
+    )
+    bundle_parser.add_argument("path", help="The bundle file to write.")
+    bundle_parser.add_argument(
+        "keys",
+        nargs="*",
+        metavar="KEY",
+        help="The zones to include (default: all available zones).",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command != "build-bundle":
+        parser.print_usage(sys.stderr)
+        return 2
+
+    try:
+        keys = build_bundle(args.path, keys=args.keys or None)
+    except UnknownTimeZoneError as e:
+        parser.error("unknown time zone: %s" % e.args[0])
+    print("Wrote %d zones to %s" % (len(keys), args.path))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
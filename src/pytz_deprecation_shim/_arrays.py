@@ -0,0 +1,247 @@
+"""Vectorized lookups in the transition tables of zones, using NumPy.
+
+An :class:`ArrayTable` holds the same transitions as a
+:class:`._transitions.TransitionTable`, as NumPy arrays with one entry per
+interval for the offsets, so that whole arrays of timestamps can be resolved
+with :func:`numpy.searchsorted`. Timestamps outside of the range covered by
+the table are reported as not covered, and callers resolve them by asking the
+zone, one at a time.
+"""
+from datetime import timedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: nocover
+    np = None
+
+from . import _transitions
+
+# The codes of the kinds of local time in the arrays returned by classify
+NORMAL = 0
+AMBIGUOUS = 1
+IMAGINARY = 2
+
+KIND_CODES = {
+    _transitions.NORMAL: NORMAL,
+    _transitions.AMBIGUOUS: AMBIGUOUS,
+    _transitions.IMAGINARY: IMAGINARY,
+}
+
+# The number of each supported datetime64 unit in a second; coarser units are
+# converted to seconds.
+_UNITS_PER_SECOND = {"s": 1, "ms": 10 ** 3, "us": 10 ** 6, "ns": 10 ** 9}
+_COARSE_UNITS = frozenset(("Y", "M", "W", "D", "h", "m"))
+
+
+class ArrayTable(object):
+    """The transitions of a zone as NumPy arrays.
+
+    ``utc``, ``local_0`` and ``local_1`` are the transition instants as in
+    :class:`._transitions.TransitionTable`, ``kinds`` the kind codes of the
+    local times in the window of each transition, and ``offsets`` and
+    ``dsts`` the UTC and DST offsets in seconds of each interval. Local
+    timestamps at or after ``local_limit`` and UTC timestamps at or after
+    ``utc_limit`` are not covered by the table (the limits are ``None`` if
+    every timestamp is).
+    """
+
+    __slots__ = (
+        "utc",
+        "local_0",
+        "local_1",
+        "kinds",
+        "offsets",
+        "dsts",
+        "abbreviation_indexes",
+        "abbreviations",
+        "utc_limit",
+        "local_limit",
+    )
+
+    def __init__(
+        self,
+        utc,
+        local_0,
+        local_1,
+        kinds,
+        offsets,
+        dsts,
+        abbreviation_indexes,
+        abbreviations,
+        utc_limit,
+        local_limit,
+    ):
+        self.utc = utc
+        self.local_0 = local_0
+        self.local_1 = local_1
+        self.kinds = kinds
+        self.offsets = offsets
+        self.dsts = dsts
+        self.abbreviation_indexes = abbreviation_indexes
+        self.abbreviations = abbreviations
+        self.utc_limit = utc_limit
+        self.local_limit = local_limit
+
+    def classify(self, seconds):
+        """Classifies an array of local timestamps.
+
+        :return:
+            A tuple of arrays of the kind codes of the local times, the
+            intervals they fall in with ``fold=0`` and with ``fold=1``, and
+            whether each timestamp is covered by the table.
+        """
+        covered = _covered(seconds, self.local_limit)
+        interval_1 = np.searchsorted(self.local_1, seconds, side="right")
+        if not len(self.local_1):
+            kind = np.zeros(seconds.shape, dtype=np.int8)
+            return kind, interval_1, interval_1, covered
+
+        # The windows of the transitions in local time never overlap, so a
+        # time is in the window of the last transition that starts at or
+        # before it if it is before that window ends.
+        previous = np.maximum(interval_1 - 1, 0)
+        anomalous = (interval_1 > 0) & (seconds < self.local_0[previous])
+        kind = np.where(anomalous, self.kinds[previous], np.int8(NORMAL))
+        interval_0 = interval_1 - anomalous
+
+        return kind, interval_0, interval_1, covered
+
+    def find_utc(self, seconds):
+        """Finds the intervals containing an array of UTC timestamps.
+
+        :return:
+            A tuple of arrays of the intervals, of the ``fold`` of the local
+            time of each timestamp, and whether each timestamp is covered by
+            the table.
+        """
+        utc = self.utc
+        interval = np.searchsorted(utc, seconds, side="right")
+        if not len(utc):
+            fold = np.zeros(seconds.shape, dtype=bool)
+        else:
+            # As in TransitionTable.fold_from_utc, the local time is in the
+            # fold if it repeats local times from before the last transition
+            previous = np.maximum(interval - 1, 0)
+            offsets = self.offsets
+            shift = offsets[previous] - offsets[interval]
+            fold = (interval > 0) & (seconds < utc[previous] + shift)
+
+        return interval, fold, _covered(seconds, self.utc_limit)
+
+
+def _covered(seconds, limit):
+    if limit is None:
+        return np.ones(seconds.shape, dtype=bool)
+
+    return seconds < limit
+
+
+def _seconds(td):
+    if td is None:
+        return 0
+
+    return td.days * 86400 + td.seconds
+
+
+def build_array_table(table):
+    """Builds the :class:`ArrayTable` of a transition table."""
+    return _build(
+        table.utc,
+        table.local[0],
+        table.local[1],
+        [table.ttinfos[i] for i in table.index],
+        _transitions.UTC_LIMIT,
+        _transitions.LOCAL_LIMIT,
+    )
+
+
+def build_fixed_array_table(ttinfo):
+    """Builds the :class:`ArrayTable` of a zone with a single offset."""
+    return _build((), (), (), [ttinfo], None, None)
+
+
+def _build(utc, local_0, local_1, ttinfos, utc_limit, local_limit):
+    abbreviations = []
+    abbreviation_indexes = {}
+    for _, _, tzname in ttinfos:
+        if tzname not in abbreviation_indexes:
+            abbreviation_indexes[tzname] = len(abbreviations)
+            abbreviations.append(tzname)
+
+    local_0 = np.array(local_0, dtype=np.int64)
+    local_1 = np.array(local_1, dtype=np.int64)
+    offsets = np.array([_seconds(offset) for offset, _, _ in ttinfos], np.int64)
+    kinds = np.where(
+        offsets[1:] > offsets[:-1], np.int8(IMAGINARY), np.int8(AMBIGUOUS)
+    )
+    kinds[local_0 == local_1] = NORMAL
+
+    return ArrayTable(
+        np.array(utc, dtype=np.int64),
+        local_0,
+        local_1,
+        kinds,
+        offsets,
+        np.array([_seconds(dst) for _, dst, _ in ttinfos], np.int64),
+        np.array([abbreviation_indexes[t] for _, _, t in ttinfos], np.intp),
+        tuple(abbreviations),
+        utc_limit,
+        local_limit,
+    )
+
+
+def to_datetime64(values, unit):
+    """Returns an array of ``datetime64`` values, interpreting integers as
+    counts of ``unit`` since the epoch."""
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        values = values.astype(np.int64).view("M8[%s]" % unit)
+
+    return values
+
+
+def to_seconds(values):
+    """Splits an array of ``datetime64`` values into whole seconds.
+
+    :return:
+        A tuple of the values as an array of ``datetime64`` in a supported
+        unit (seconds, for values in coarser units), the number of that unit
+        in a second, an ``int64`` array of the whole seconds since the epoch
+        (rounded down, and ``0`` for ``NaT``), and a mask of the ``NaT``
+        values.
+
+    :raises ValueError:
+        If the values are not ``datetime64`` values, or are in a unit finer
+        than nanoseconds.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != "M":
+        raise ValueError("Expected an array of datetime64 values")
+
+    unit = np.datetime_data(values.dtype)[0]
+    if unit in _COARSE_UNITS or unit == "generic":
+        values = values.astype("M8[s]")
+        unit = "s"
+
+    per_second = _UNITS_PER_SECOND.get(unit, None)
+    if per_second is None:
+        raise ValueError("Unsupported datetime64 unit: %s" % unit)
+
+    nat = np.isnat(values)
+    seconds = values.view(np.int64) // per_second
+    seconds[nat] = 0
+
+    return values, per_second, seconds, nat
+
+
+def to_datetime(values, index):
+    """Returns the naive datetime of an element of an array returned by
+    :func:`to_seconds`, by its index in the flattened array, truncated to
+    microseconds."""
+    per_second = _UNITS_PER_SECOND[np.datetime_data(values.dtype)[0]]
+    count = int(values.view(np.int64).flat[index])
+    seconds, fraction = divmod(count, per_second)
+
+    return _transitions.from_timestamp(seconds) + timedelta(
+        microseconds=fraction * 10 ** 6 // per_second
+    )
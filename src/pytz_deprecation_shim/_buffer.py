@@ -0,0 +1,63 @@
+"""A file-like view of a buffer, for parsing data without copying it."""
+
+
+class BufferReader(object):
+    """A read-only, seekable binary file over any object that supports the
+    buffer protocol (e.g. ``bytes``, ``memoryview`` or ``mmap.mmap``).
+
+    Unlike :class:`io.BytesIO`, the buffer is not copied when the reader is
+    created; only the chunks actually read are copied out of it.
+    """
+
+    def __init__(self, buffer):
+        try:
+            view = memoryview(buffer)
+        except TypeError:  # pragma: nocover
+            # Python 2's mmap does not support memoryview, but it can be
+            # sliced directly
+            view = buffer
+        else:
+            if getattr(view, "itemsize", 1) != 1:
+                view = view.cast("B")
+
+        self._view = view
+        self._pos = 0
+
+    def read(self, size=-1):
+        start = self._pos
+        length = len(self._view)
+        if size is None or size < 0:
+            end = length
+        else:
+            end = min(start + size, length)
+
+        if end <= start:
+            return b""
+
+        self._pos = end
+        return bytes(self._view[start:end])
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self._pos + offset
+        elif whence == 2:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError("invalid whence (%r)" % (whence,))
+
+        if pos < 0:
+            raise ValueError("negative seek position %d" % pos)
+
+        self._pos = pos
+        return pos
+
+    def tell(self):
+        return self._pos
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
@@ -0,0 +1,189 @@
+"""A container format for many TZif files, readable through a memory map.
+
+A bundle file consists of:
+
+- a fixed-size preamble: the magic bytes ``PDSZ``, the format version (an
+  unsigned 16-bit integer) and the length of the header (an unsigned 32-bit
+  integer), both big-endian;
+- the header: a UTF-8 encoded JSON object with the keys ``"metadata"`` (an
+  arbitrary JSON object describing the bundle) and ``"index"`` (an object
+  mapping each IANA key to the ``[offset, length]`` of its TZif data, with
+  offsets relative to the start of the data section);
+- the data section: the concatenated TZif files. Keys whose TZif files are
+  byte-for-byte identical share a single copy of the data.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b"PDSZ"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct(">4sHI")
+
+
+class InvalidBundleError(ValueError):
+    """Raised when a file is not a bundle this version can read."""
+
+
+def write_bundle(fp, zones, metadata=None):
+    """Writes a bundle to a binary file-like object.
+
+    :param zones:
+        An iterable of ``(key, data)`` pairs, where ``data`` is the contents of
+        a TZif file as ``bytes``.
+
+    :param metadata:
+        A JSON-serializable dictionary stored in the bundle's header.
+    """
+    index = {}
+    blobs = []
+    offsets_by_digest = {}
+    data_length = 0
+    for key, data in zones:
+        digest = hashlib.sha256(data).digest()
+        offset = offsets_by_digest.get(digest, None)
+        if offset is None:
+            offset = offsets_by_digest[digest] = data_length
+            blobs.append(data)
+            data_length += len(data)
+
+        index[key] = [offset, len(data)]
+
+    header = json.dumps(
+        {"metadata": metadata or {}, "index": index},
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    fp.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+    fp.write(header)
+    for blob in blobs:
+        fp.write(blob)
+
+
+def write_bundle_file(path, zones, metadata=None):
+    """Atomically writes a bundle to ``path``."""
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        with open(tmp_path, "wb") as f:
+            write_bundle(f, zones, metadata=metadata)
+
+        _replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_replace = getattr(os, "replace", os.rename)
+
+
+class Bundle(object):
+    """Read-only access to the zones in a bundle.
+
+    The TZif data is never copied out of the underlying buffer: :meth:`get`
+    returns :class:`memoryview` slices of it, which can be parsed with a
+    :class:`._buffer.BufferReader`.
+    """
+
+    def __init__(self, buffer, _closer=None):
+        try:
+            magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        except struct.error:
+            raise InvalidBundleError("File is too short to be a zone bundle")
+
+        if magic != MAGIC:
+            raise InvalidBundleError("File is not a zone bundle")
+
+        if version != FORMAT_VERSION:
+            raise InvalidBundleError(
+                "Unsupported zone bundle format version: %d" % version
+            )
+
+        header_start = _PREAMBLE.size
+        data_start = header_start + header_length
+        if data_start > len(buffer):
+            raise InvalidBundleError("Zone bundle header is truncated")
+
+        try:
+            header = json.loads(
+                bytes(buffer[header_start:data_start]).decode("utf-8")
+            )
+            metadata = header["metadata"]
+            index = [
+                (key, int(offset), int(length))
+                for key, (offset, length) in header["index"].items()
+            ]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise InvalidBundleError("Zone bundle header is corrupt")
+
+        data_length = len(buffer) - data_start
+        self.metadata = metadata
+        self._index = {}
+        for key, offset, length in index:
+            if offset < 0 or length < 0 or offset + length > data_length:
+                raise InvalidBundleError(
+                    "Zone bundle data is truncated: %s" % key
+                )
+
+            self._index[key] = (data_start + offset, length)
+
+        # The view is only created once the bundle is known to be valid, since
+        # a memory map cannot be closed while views of it exist.
+        self._buffer = buffer
+        try:
+            self._view = memoryview(buffer)
+        except TypeError:  # pragma: nocover
+            # Python 2's mmap does not support memoryview; slicing it copies
+            # the data, but the result is the same.
+            self._view = buffer
+        self._closer = _closer
+
+    @classmethod
+    def open(cls, path):
+        """Opens a bundle file by mapping it into memory."""
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                raise InvalidBundleError("File is not a zone bundle")
+
+        try:
+            return cls(buffer, _closer=buffer.close)
+        except Exception:
+            buffer.close()
+            raise
+
+    def keys(self):
+        return list(self._index)
+
+    def get(self, key):
+        """Returns the TZif data for ``key`` as a memoryview, or ``None``."""
+        entry = self._index.get(key, None)
+        if entry is None:
+            return None
+
+        start, length = entry
+        return self._view[start : start + length]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """Releases the buffer.
+
+        Memoryviews returned by :meth:`get` must not be used afterwards.
+        """
+        if hasattr(self._view, "release"):
+            self._view.release()
+
+        if self._closer is not None:
+            self._closer()
+            self._closer = None
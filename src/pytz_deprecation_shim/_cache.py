@@ -0,0 +1,260 @@
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ZoneCache(object):
+    """A thread-safe cache of shim zones with an optional bound on strong
+    references.
+
+    When ``maxsize`` is ``None``, every entry is held strongly and the cache
+    grows without bound. Otherwise, the ``maxsize`` most recently used entries
+    are held strongly (and are thus pinned in the cache), and the remaining
+    entries are held only weakly, so they stay in the cache for as long as
+    something else keeps them alive. This is the same scheme used by
+    :class:`zoneinfo.ZoneInfo`.
+
+    The interface deliberately resembles the subset of the ``dict`` interface
+    that the shim constructors use. Every operation that modifies the cache
+    takes the cache's lock, so the cache does not rely on the GIL to keep its
+    bookkeeping consistent.
+    """
+
+    def __init__(self, maxsize=None, key_func=None):
+        self._lock = threading.RLock()
+        self._key_func = key_func
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._strong = OrderedDict()
+        self._weak = weakref.WeakValueDictionary()
+        self._loading = {}
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get(self, key, default=None):
+        if self._maxsize is None:
+            # When the cache is unbounded, there is no recency to update, so
+            # hits can be served without taking the lock. The hit count may be
+            # slightly off under concurrent use, but the returned value is
+            # always correct.
+            value = self._strong.get(key, None)
+            if value is not None:
+                self._hits += 1
+                return value
+
+        with self._lock:
+            value = self._weak.get(key, None)
+            if value is None:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._pin(key, value)
+
+            return value
+
+    def setdefault(self, key, value):
+        with self._lock:
+            existing = self._weak.get(key, None)
+            if existing is not None:
+                value = existing
+            else:
+                self._weak[key] = value
+
+            self._pin(key, value)
+
+            return value
+
+    def get_or_create(self, key, factory):
+        """Returns the value for ``key``, calling ``factory(key)`` if needed.
+
+        This is intended to be called after :meth:`get` has missed, so it does
+        not update the statistics. Concurrent misses on the same key are
+        coalesced: only one thread calls ``factory`` and the others wait for
+        its result. If ``factory`` raises, the exception propagates to the
+        calling thread, and each waiting thread retries on its own.
+        """
+        with self._lock:
+            key_lock = self._loading.get(key, None)
+            if key_lock is None:
+                key_lock = self._loading[key] = threading.Lock()
+
+        with key_lock:
+            try:
+                with self._lock:
+                    value = self._weak.get(key, None)
+
+                if value is None:
+                    value = self.setdefault(key, factory(key))
+            finally:
+                with self._lock:
+                    if self._loading.get(key, None) is key_lock:
+                        del self._loading[key]
+
+        return value
+
+    def replace(self, key, value):
+        """Sets the value for ``key``, replacing any existing value."""
+        with self._lock:
+            self._weak[key] = value
+            self._pin(key, value)
+
+    def keys(self):
+        with self._lock:
+            return list(self._weak.keys())
+
+    def values(self):
+        with self._lock:
+            return list(self._weak.values())
+
+    def items(self):
+        with self._lock:
+            return list(self._weak.items())
+
+    def pop(self, key):
+        with self._lock:
+            self._strong.pop(key, None)
+            return self._weak.pop(key, None)
+
+    def _pin(self, key, value):
+        if self._maxsize is None:
+            self._strong[key] = value
+            return
+
+        if not self._maxsize:
+            return
+
+        # OrderedDict.move_to_end is not available on Python 2
+        self._strong.pop(key, None)
+        self._strong[key] = value
+
+        while len(self._strong) > self._maxsize:
+            self._strong.popitem(last=False)
+
+    def resize(self, maxsize):
+        """Change the number of strong references the cache may hold."""
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+
+        with self._lock:
+            self._maxsize = maxsize
+
+            if maxsize is None:
+                self._strong.update(self._weak.items())
+            else:
+                while len(self._strong) > maxsize:
+                    self._strong.popitem(last=False)
+
+    def clear(self, only_keys=None):
+        """Remove entries from the cache.
+
+        :param only_keys:
+            If specified, an iterable of keys to remove from the cache;
+            otherwise the entire cache is cleared (and the statistics reset).
+        """
+        with self._lock:
+            if only_keys is None:
+                self._strong.clear()
+                self._weak.clear()
+                self._hits = 0
+                self._misses = 0
+                return
+
+            only_keys = frozenset(only_keys)
+            key_func = self._key_func
+            for key in list(self._weak.keys()):
+                public_key = key if key_func is None else key_func(key)
+                if public_key in only_keys:
+                    self._weak.pop(key, None)
+                    self._strong.pop(key, None)
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._weak)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return len(self._weak)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._weak
+
+
+class KeyCache(object):
+    """A bounded, least-recently-used set of keys.
+
+    This is used to remember keys that are known to be invalid, so it has the
+    same ``clear``/``cache_info``/``resize`` interface as :class:`ZoneCache`.
+    """
+
+    def __init__(self, maxsize=None):
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._keys = OrderedDict()
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._keys:
+                self._hits += 1
+                self._keys.pop(key)
+                self._keys[key] = None
+                return True
+
+            self._misses += 1
+            return False
+
+    def add(self, key):
+        with self._lock:
+            self._keys.pop(key, None)
+            self._keys[key] = None
+            self._evict()
+
+    def _evict(self):
+        if self._maxsize is None:
+            return
+
+        while len(self._keys) > self._maxsize:
+            self._keys.popitem(last=False)
+
+    def resize(self, maxsize):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self, only_keys=None):
+        with self._lock:
+            if only_keys is None:
+                self._keys.clear()
+                self._hits = 0
+                self._misses = 0
+                return
+
+            for key in only_keys:
+                self._keys.pop(key, None)
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._keys)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return len(self._keys)
@@ -6,9 +6,19 @@ else:
     from . import _compat_py3 as _compat_impl
 
 UTC = _compat_impl.UTC
+ZoneInfo = _compat_impl.ZoneInfo
+string_types = _compat_impl.string_types
 get_timezone = _compat_impl.get_timezone
 get_timezone_file = _compat_impl.get_timezone_file
+reload_timezone = _compat_impl.reload_timezone
 get_fixed_offset_zone = _compat_impl.get_fixed_offset_zone
+is_fixed_offset_zone = _compat_impl.is_fixed_offset_zone
+get_tzpath = _compat_impl.get_tzpath
+get_tzdata_path = _compat_impl.get_tzdata_path
+has_opaque_sources = _compat_impl.has_opaque_sources
+get_opaque_keys = _compat_impl.get_opaque_keys
+get_tzdata_version = _compat_impl.get_tzdata_version
+read_opaque_zone = _compat_impl.read_opaque_zone
 is_ambiguous = _compat_impl.is_ambiguous
 is_imaginary = _compat_impl.is_imaginary
 enfold = _compat_impl.enfold
@@ -4,13 +4,18 @@ from dateutil import tz
 
 UTC = tz.UTC
 
+string_types = (basestring,)  # noqa: F821
 
-def get_timezone(key):
+# zoneinfo is not available on Python 2, so there is nothing to subclass
+ZoneInfo = None
+
+
+def get_timezone(key, _gettz=tz.gettz):
     if not key:
         raise KeyError("Unknown time zone: %s" % key)
 
     try:
-        rv = tz.gettz(key)
+        rv = _gettz(key)
     except Exception:
         rv = None
 
@@ -20,14 +25,52 @@ def get_timezone(key):
     return rv
 
 
+def reload_timezone(key):
+    return get_timezone(key, _gettz=tz.gettz.nocache)
+
+
 def get_timezone_file(f, key=None):
     return tz.tzfile(f)
 
 
+def get_tzpath():
+    return tz.TZPATHS
+
+
+def get_tzdata_path():
+    return None
+
+
+def has_opaque_sources():
+    # dateutil.tz.gettz falls back to the tarball bundled with dateutil
+    return True
+
+
+def get_opaque_keys():
+    from dateutil.zoneinfo import get_zonefile_instance
+
+    return list(get_zonefile_instance().zones)
+
+
+def get_tzdata_version():
+    from dateutil.zoneinfo import get_zonefile_instance
+
+    return get_zonefile_instance().metadata.get("tzversion", None)
+
+
+def read_opaque_zone(key):
+    # The zones in dateutil's tarball are only exposed as parsed objects
+    return None
+
+
 def get_fixed_offset_zone(offset):
     return tz.tzoffset(None, timedelta(minutes=offset))
 
 
+def is_fixed_offset_zone(zone):
+    return isinstance(zone, (tz.tzutc, tz.tzoffset))
+
+
 def is_ambiguous(dt):
     return tz.datetime_ambiguous(dt)
 
@@ -7,26 +7,126 @@ except ImportError:
     from backports import zoneinfo
 
 import datetime
+import os
 
 UTC = datetime.timezone.utc
+ZoneInfo = zoneinfo.ZoneInfo
 
+string_types = (str,)
 
-def get_timezone(key):
+_TZDATA_PATH = None
+_TZDATA_OPAQUE = None
+
+
+def get_timezone(key, zone_class=ZoneInfo):
     try:
-        return zoneinfo.ZoneInfo(key)
+        return zone_class(key)
     except (ValueError, OSError):
         # TODO: Use `from e` when this file can use Python 3 syntax
         raise KeyError(key)
 
 
-def get_timezone_file(f, key=None):
-    return zoneinfo.ZoneInfo.from_file(f, key=key)
+def reload_timezone(key, zone_class=ZoneInfo):
+    """Loads a zone from its source, bypassing the provider's cache.
+
+    The stale entry is removed from the provider's cache as well, so that
+    subsequent lookups in the provider itself see the new data.
+    """
+    zone_class.clear_cache(only_keys=[key])
+    return get_timezone(key, zone_class)
+
+
+def get_timezone_file(f, key=None, zone_class=ZoneInfo):
+    return zone_class.from_file(f, key=key)
+
+
+def get_tzpath():
+    return zoneinfo.TZPATH
+
+
+def get_tzdata_path():
+    if _TZDATA_OPAQUE is None:
+        _find_tzdata()
+
+    return _TZDATA_PATH
+
+
+def has_opaque_sources():
+    """Whether zones may be loaded from somewhere other than a directory."""
+    if _TZDATA_OPAQUE is None:
+        _find_tzdata()
+
+    return _TZDATA_OPAQUE
+
+
+def get_opaque_keys():
+    """Returns the keys available from sources that cannot be walked."""
+    if not has_opaque_sources():
+        return ()
+
+    # This is how zoneinfo.available_timezones finds the keys in tzdata
+    try:
+        from importlib import resources
+
+        with resources.open_text("tzdata", "zones") as f:
+            return [zone.strip() for zone in f]
+    except (ImportError, OSError):  # pragma: nocover
+        return ()
+
+
+def get_tzdata_version():
+    """Returns the IANA version of the installed ``tzdata`` package."""
+    try:
+        import tzdata
+    except ImportError:
+        return None
+
+    return getattr(tzdata, "IANA_VERSION", None)
+
+
+def read_opaque_zone(key):
+    """Reads the TZif data for a key from a source that cannot be walked."""
+    if not has_opaque_sources():
+        return None
+
+    # This is how zoneinfo finds the resource for a key in tzdata
+    components = key.split("/")
+    package_name = ".".join(["tzdata.zoneinfo"] + components[:-1])
+    try:
+        from importlib import resources
+
+        with resources.open_binary(package_name, components[-1]) as f:
+            return f.read()
+    except (ImportError, OSError, ValueError):  # pragma: nocover
+        return None
+
+
+def _find_tzdata():
+    global _TZDATA_PATH
+    global _TZDATA_OPAQUE
+
+    try:
+        import tzdata
+    except ImportError:
+        _TZDATA_OPAQUE = False
+        return
+
+    path = os.path.join(os.path.dirname(tzdata.__file__), "zoneinfo")
+    if os.path.isdir(path):
+        _TZDATA_PATH = path
+        _TZDATA_OPAQUE = False
+    else:  # pragma: nocover
+        _TZDATA_OPAQUE = True
 
 
 def get_fixed_offset_zone(offset):
     return datetime.timezone(datetime.timedelta(minutes=offset))
 
 
+def is_fixed_offset_zone(tz):
+    return isinstance(tz, datetime.timezone)
+
+
 def is_imaginary(dt):
     dt_rt = dt.astimezone(UTC).astimezone(dt.tzinfo)
 
@@ -1,3 +1,5 @@
+import threading
+
 from ._common import pytz_imported
 
 
@@ -28,6 +30,7 @@ class NonExistentTimeError(InvalidTimeError):
 
 
 PYTZ_BASE_ERROR_MAPPING = {}
+_PYTZ_BASE_ERROR_MAPPING_LOCK = threading.Lock()
 
 
 def _make_pytz_derived_errors(
@@ -39,6 +42,27 @@ def _make_pytz_derived_errors(
     if PYTZ_BASE_ERROR_MAPPING or not pytz_imported():
         return
 
+    # Without the lock, two threads could each create their own set of derived
+    # classes, and exceptions raised by one of them would not be instances of
+    # the classes that end up in the mapping.
+    with _PYTZ_BASE_ERROR_MAPPING_LOCK:
+        if not PYTZ_BASE_ERROR_MAPPING:
+            PYTZ_BASE_ERROR_MAPPING.update(
+                _build_pytz_derived_errors(
+                    InvalidTimeError_,
+                    AmbiguousTimeError_,
+                    NonExistentTimeError_,
+                    UnknownTimeZoneError_,
+                )
+            )
+
+
+def _build_pytz_derived_errors(
+    InvalidTimeError_,
+    AmbiguousTimeError_,
+    NonExistentTimeError_,
+    UnknownTimeZoneError_,
+):
     import pytz
 
     class InvalidTimeError(InvalidTimeError_, pytz.InvalidTimeError):
@@ -57,14 +81,12 @@ def _make_pytz_derived_errors(
     ):
         pass
 
-    PYTZ_BASE_ERROR_MAPPING.update(
-        {
-            InvalidTimeError_: InvalidTimeError,
-            AmbiguousTimeError_: AmbiguousTimeError,
-            NonExistentTimeError_: NonExistentTimeError,
-            UnknownTimeZoneError_: UnknownTimeZoneError,
-        }
-    )
+    return {
+        InvalidTimeError_: InvalidTimeError,
+        AmbiguousTimeError_: AmbiguousTimeError,
+        NonExistentTimeError_: NonExistentTimeError,
+        UnknownTimeZoneError_: UnknownTimeZoneError,
+    }
 
 
 def get_exception(exc_type, msg):
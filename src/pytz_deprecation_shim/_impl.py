@@ -1,21 +1,103 @@
 # -*- coding: utf-8 -*-
+import functools
+import gc
+import hashlib
+import io
+import mmap
+import os
+import threading
 import warnings
-from datetime import tzinfo
-
-from . import _compat
+import zipfile
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta, tzinfo
+from timeit import default_timer
+
+from . import (
+    _arrays,
+    _bundle,
+    _compat,
+    _reload,
+    _shared,
+    _snapshot,
+    _sources,
+    _transitions,
+)
+from ._buffer import BufferReader
+from ._cache import KeyCache, ZoneCache
 from ._exceptions import (
     AmbiguousTimeError,
     NonExistentTimeError,
     PytzUsageWarning,
     UnknownTimeZoneError,
+    _make_pytz_derived_errors,
     get_exception,
 )
 
 IS_DST_SENTINEL = object()
 KEY_SENTINEL = object()
+_NO_TABLE = object()
+_INF = float("inf")
+
+_ZONEINFO_SUBCLASS_MODE = False
+_CASE_INSENSITIVE_MODE = False
+_BUILD_TZINFO_DEDUPLICATION = False
+_ALIAS_DEDUPLICATION = False
+
+_TIMEZONE_CACHE = ZoneCache()
+_FIXED_OFFSET_CACHE = ZoneCache()
+# Shims hold a strong reference to the zone they wrap, so the wrap_zone cache
+# only holds shims weakly by default; otherwise, every zone ever wrapped would
+# be kept alive by the cache.
+_WRAP_ZONE_CACHE = ZoneCache(maxsize=0, key_func=lambda cache_key: cache_key[1])
+_UNKNOWN_KEY_CACHE = KeyCache(maxsize=1024)
+# Maps the SHA-256 digest of TZif data to the zone parsed from it. Like the
+# wrap_zone cache, this only holds zones weakly by default.
+_BUILD_TZINFO_CACHE = ZoneCache(maxsize=0)
+# Maps the key of each zone that links resolve to the provider zone shared by
+# all of its aliases. This also only holds zones weakly by default.
+_ALIAS_CACHE = ZoneCache(maxsize=0)
+_SHIM_CACHE_NAMES = ("timezone", "fixed_offset_timezone", "wrap_zone")
+_CACHES = {
+    "timezone": _TIMEZONE_CACHE,
+    "fixed_offset_timezone": _FIXED_OFFSET_CACHE,
+    "wrap_zone": _WRAP_ZONE_CACHE,
+    "unknown_keys": _UNKNOWN_KEY_CACHE,
+    "build_tzinfo": _BUILD_TZINFO_CACHE,
+    "aliases": _ALIAS_CACHE,
+}
+
+_RELOADER = _reload.Reloader()
+_RELOAD_HOOKS = []
+
+_SNAPSHOT = None
+# An object with the get/__contains__/keys interface of a dict mapping keys to
+# shims, consulted by timezone() before any other source; see use_bundle and
+# register_zones.
+_ZONE_SOURCE = None
+_ZONE_SOURCE_EXCLUSIVE = False
+_SHARED_SEGMENTS = {}
+
+PRELOAD_ENV_VAR = "PYTZ_DEPRECATION_SHIM_PRELOAD"
+PRELOAD_WORKERS_ENV_VAR = "PYTZ_DEPRECATION_SHIM_PRELOAD_WORKERS"
+
+PreloadResult = namedtuple("PreloadResult", ["loaded", "failed"])
+Classification = namedtuple(
+    "Classification", ["kind", "utcoffset_0", "utcoffset_1", "dst_0", "dst_1"]
+)
+LocalizeResult = namedtuple("LocalizeResult", ["dt", "status"])
+LocalizedArray = namedtuple("LocalizedArray", ["utc", "fold"])
+LocalArray = namedtuple(
+    "LocalArray",
+    ["local", "utcoffset", "dst", "tzname_index", "tznames", "fold"],
+)
+
+_LOCALIZE_POLICIES = frozenset(
+    ("none", "earliest", "latest", "shift_forward", "shift_backward")
+)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
 
-def timezone(key, _cache={}):
+def timezone(key, _cache=_TIMEZONE_CACHE):
     """Builds an IANA database time zone shim.
 
     This is the equivalent of ``pytz.timezone``.
@@ -30,21 +112,963 @@ def timezone(key, _cache={}):
         :exc:`zoneinfo.ZoneInfoNotFoundError`, both of those are subclasses of
         :exc:`KeyError`.
     """
+    if _RELOADER.enabled and _RELOADER.due():
+        _reload_changed_zones(blocking=False)
+
     instance = _cache.get(key, None)
     if instance is None:
-        if len(key) == 3 and key.lower() == "utc":
-            instance = _cache.setdefault(key, UTC)
-        else:
+        instance = _cache.get_or_create(key, _load_timezone)
+
+    return instance
+
+
+def _load_timezone(key):
+    if len(key) == 3 and key.lower() == "utc":
+        return UTC
+
+    if key in _UNKNOWN_KEY_CACHE:
+        raise get_exception(UnknownTimeZoneError, key)
+
+    if _CASE_INSENSITIVE_MODE:
+        canonical_key = _sources.get_canonical_key(key)
+        if canonical_key is not None and canonical_key != key:
+            # The result is cached under both spellings
+            return timezone(canonical_key)
+
+    zone_source = _ZONE_SOURCE
+    if zone_source is not None:
+        instance = zone_source.get(key)
+        if instance is not None:
+            # These sources are pinned, so their zones are never reloaded
+            return instance
+
+        if _ZONE_SOURCE_EXCLUSIVE:
+            _UNKNOWN_KEY_CACHE.add(key)
+            raise get_exception(UnknownTimeZoneError, key)
+
+    snapshot = _SNAPSHOT
+    data = snapshot.get(key) if snapshot is not None else None
+    if data is not None:
+        instance = _load_timezone_data(key, data)
+    else:
+        try:
+            if _ZONEINFO_SUBCLASS_MODE:
+                instance = _compat.get_timezone(key, _ZoneInfoShimTimezone)
+            else:
+                instance = wrap_zone(_get_provider_zone(key), key=key)
+        except KeyError:
+            _UNKNOWN_KEY_CACHE.add(key)
+            raise get_exception(UnknownTimeZoneError, key)
+
+        _set_transition_source(instance, functools.partial(_get_zone_data, key))
+
+    if _RELOADER.enabled:
+        _RELOADER.record(key)
+
+    return instance
+
+
+def _get_provider_zone(key, reload=False):
+    _load = _compat.reload_timezone if reload else _compat.get_timezone
+    if not _ALIAS_DEDUPLICATION:
+        return _load(key)
+
+    target = _sources.get_link_target(key) or key
+    zone = _ALIAS_CACHE.get(target, None)
+    if zone is None:
+        zone = _ALIAS_CACHE.get_or_create(target, _load)
+
+    return zone
+
+
+def _load_timezone_data(key, data):
+    # Builds the shim timezone(key) would return from its TZif data, without
+    # copying the data (which may be a slice of a memory map).
+    if _ZONEINFO_SUBCLASS_MODE:
+        instance = _ZoneInfoShimTimezone._from_shim_data(data, key=key)
+    else:
+        zone = _compat.get_timezone_file(BufferReader(data), key=key)
+        instance = _PytzShimTimezone(zone, key)
+
+    # Zones built from files cannot be pickled, but this one can be pickled
+    # by key, like any other zone returned by timezone().
+    instance._reduce_by_key = True
+
+    # The data may be a view of a memory map that must be closable, so the
+    # transition table is built from a fresh lookup rather than this view.
+    _set_transition_source(instance, functools.partial(_get_zone_data, key))
+
+    return instance
+
+
+def _set_transition_source(instance, source):
+    # Records where a shim can get the TZif data that its zone was built
+    # from, which it reads the first time it needs its transition table.
+    if "_transition_table" not in instance.__dict__:
+        instance._transition_source = source
+
+
+def set_case_insensitive_lookup(enabled=True):
+    """Controls whether :func:`timezone` ignores the case of keys.
+
+    ``pytz.timezone`` finds zones regardless of the case of the key (e.g.
+    ``"us/eastern"`` returns the ``"US/Eastern"`` zone), but the underlying
+    providers are only case-insensitive on case-insensitive file systems. When
+    this mode is enabled, keys are resolved to their canonical spelling using
+    an index of all available keys, which is built the first time it is
+    needed. The shim is cached under both spellings, and reports the canonical
+    key as its ``zone``.
+
+    :param enabled:
+        Whether :func:`timezone` should ignore the case of keys.
+    """
+    global _CASE_INSENSITIVE_MODE
+
+    enabled = bool(enabled)
+    if enabled != _CASE_INSENSITIVE_MODE:
+        _CASE_INSENSITIVE_MODE = enabled
+
+        # Drop any spellings cached (or rejected) under the previous mode
+        _TIMEZONE_CACHE.clear()
+        _UNKNOWN_KEY_CACHE.clear()
+
+
+def set_reload_interval(interval):
+    """Enables or disables automatic reloading of changed time zone data.
+
+    When enabled, :func:`timezone` records the file backing each zone it
+    loads, and at most once every ``interval`` seconds it checks whether any
+    of those files have changed (e.g. after an operating system or ``tzdata``
+    package update). The check is cheap: only the file metadata is examined,
+    and a file is only read and hashed when its metadata has changed. Zones
+    whose data has changed are re-parsed and replace the old shims in the
+    :func:`timezone` cache; shims that were already handed out keep working
+    with the old data.
+
+    The check runs in whichever thread calls :func:`timezone` once the
+    interval has elapsed. Use :func:`reload_zones` to check immediately.
+
+    :param interval:
+        The minimum number of seconds between checks, or ``None`` to disable
+        automatic reloading (the default).
+
+    :raises ValueError:
+        If ``interval`` is negative.
+    """
+    if interval is not None and interval < 0:
+        raise ValueError("interval must be non-negative or None")
+
+    was_enabled = _RELOADER.enabled
+    _RELOADER.interval = interval
+
+    if interval is None:
+        _RELOADER.forget()
+    elif not was_enabled:
+        for key in _TIMEZONE_CACHE.keys():
+            if _TIMEZONE_CACHE.get(key) is not UTC:
+                _RELOADER.record(key)
+
+
+def reload_zones():
+    """Checks for changed time zone data immediately.
+
+    This requires automatic reloading to have been enabled with
+    :func:`set_reload_interval`, since that is what records the data each zone
+    was loaded from.
+
+    :return:
+        A sorted list of the keys whose data has changed.
+    """
+    return _reload_changed_zones(blocking=True)
+
+
+def add_reload_hook(hook):
+    """Registers a function to be called when time zone data is reloaded.
+
+    :param hook:
+        A callable taking a single argument: the sorted list of keys whose data
+        changed. Exceptions raised by hooks are reported as a
+        :exc:`RuntimeWarning` rather than propagated, since hooks may be
+        called from inside an unrelated :func:`timezone` call.
+    """
+    _RELOAD_HOOKS.append(hook)
+
+
+def remove_reload_hook(hook):
+    """Unregisters a function registered with :func:`add_reload_hook`.
+
+    :raises ValueError:
+        If the hook is not registered.
+    """
+    _RELOAD_HOOKS.remove(hook)
+
+
+def _reload_changed_zones(blocking):
+    changes = _RELOADER.find_changes(blocking=blocking)
+    if changes is None:
+        return []
+
+    # Keys that were previously rejected may have been added by the update.
+    _UNKNOWN_KEY_CACHE.clear()
+    _sources.reset_key_index()
+
+    if not changes:
+        return []
+
+    if _ALIAS_DEDUPLICATION:
+        # The first alias of each changed zone reloads it for all of them
+        _ALIAS_CACHE.clear(
+            only_keys=[_sources.get_link_target(key) or key for key in changes]
+        )
+
+    for key, record in changes.items():
+        # If the data has disappeared, keep serving the existing shim rather
+        # than breaking callers, but stop tracking it.
+        if record is not None:
             try:
-                zone = _compat.get_timezone(key)
+                if _ZONEINFO_SUBCLASS_MODE:
+                    instance = _compat.reload_timezone(
+                        key, _ZoneInfoShimTimezone
+                    )
+                else:
+                    instance = wrap_zone(
+                        _get_provider_zone(key, reload=True),
+                        key=key,
+                    )
             except KeyError:
+                record = None
+            else:
+                _set_transition_source(
+                    instance, functools.partial(_get_zone_data, key)
+                )
+                _TIMEZONE_CACHE.replace(key, instance)
+
+        _RELOADER.update(key, record)
+
+    changed_keys = sorted(changes)
+    for hook in list(_RELOAD_HOOKS):
+        try:
+            hook(changed_keys)
+        except Exception as e:
+            warnings.warn(
+                "Exception in time zone reload hook %r: %r" % (hook, e),
+                RuntimeWarning,
+            )
+
+    return changed_keys
+
+
+def is_valid_key(key):
+    """Checks whether :func:`timezone` would accept a key, without raising.
+
+    This consults the :func:`timezone` cache and the cache of known-invalid
+    keys first. Otherwise, it looks for a TZif file for ``key`` on the time
+    zone search path without parsing it, so it is much cheaper than calling
+    :func:`timezone` and catching :exc:`UnknownTimeZoneError`. Keys found to be
+    invalid are remembered.
+
+    :param key:
+        A candidate IANA time zone key.
+
+    :return:
+        ``True`` if ``key`` refers to an available time zone, ``False``
+        otherwise.
+    """
+    if not isinstance(key, _compat.string_types):
+        return False
+
+    if key in _TIMEZONE_CACHE:
+        return True
+
+    if len(key) == 3 and key.lower() == "utc":
+        return True
+
+    if key in _UNKNOWN_KEY_CACHE:
+        return False
+
+    zone_source = _ZONE_SOURCE
+    if zone_source is not None:
+        if key in zone_source:
+            return True
+
+        if _ZONE_SOURCE_EXCLUSIVE:
+            return False
+
+    if _CASE_INSENSITIVE_MODE and _sources.get_canonical_key(key) is not None:
+        return True
+
+    exists = _sources.zone_file_exists(key)
+    if exists is None:
+        # The provider may find this key somewhere we cannot check cheaply, so
+        # fall back to actually loading it.
+        try:
+            timezone(key)
+        except UnknownTimeZoneError:
+            return False
+
+        return True
+
+    if not exists:
+        _UNKNOWN_KEY_CACHE.add(key)
+
+    return exists
+
+
+def preload(keys=None, workers=None):
+    """Loads many zones into the :func:`timezone` cache at once.
+
+    The zones are loaded by calling :func:`timezone` from a pool of threads, so
+    concurrent calls to :func:`timezone` for a key that is being preloaded
+    simply wait for it rather than loading it a second time. If the
+    :func:`timezone` cache is bounded (see :func:`set_cache_size`), only the
+    most recently loaded zones are kept.
+
+    Preloading can also be triggered when ``pytz_deprecation_shim`` is first
+    imported, by setting the ``PYTZ_DEPRECATION_SHIM_PRELOAD`` environment
+    variable to a comma-separated list of keys, or to ``*`` to load all
+    available zones. The number of threads used can be set with
+    ``PYTZ_DEPRECATION_SHIM_PRELOAD_WORKERS``.
+
+    :param keys:
+        An iterable of IANA keys to load. By default, every zone available on
+        the time zone search path is loaded.
+
+    :param workers:
+        The number of threads to load zones in. The default is based on the
+        number of CPUs. With ``workers=1``, zones are loaded in the calling
+        thread.
+
+    :raises ValueError:
+        If ``workers`` is not a positive integer.
+
+    :return:
+        A named tuple with the fields ``loaded``, a dictionary mapping each
+        key that was loaded to the time (in seconds) it took to load, and
+        ``failed``, a dictionary mapping each key that could not be loaded to
+        the exception raised when loading it.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer or None")
+
+    if keys is None:
+        keys = sorted(_sources.available_keys())
+    else:
+        # Remove duplicates, since they would only wait on one another
+        keys = list(OrderedDict.fromkeys(keys))
+
+    results = _map_in_threads(_preload_key, keys, workers)
+
+    loaded = {}
+    failed = {}
+    for key, elapsed, exc in results:
+        if exc is None:
+            loaded[key] = elapsed
+        else:
+            failed[key] = exc
+
+    return PreloadResult(loaded, failed)
+
+
+def _preload_key(key):
+    start = default_timer()
+    try:
+        timezone(key)
+    except Exception as e:
+        return key, None, e
+
+    return key, default_timer() - start, None
+
+
+def _map_in_threads(func, items, workers=None):
+    """Like ``map(func, items)``, but calls ``func`` from a pool of threads.
+
+    :param workers:
+        The maximum number of threads to use; by default, this is based on the
+        number of CPUs. With 1 thread, ``func`` is called in this thread.
+    """
+    if workers is None:
+        workers = _default_workers()
+
+    workers = min(workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _default_workers():
+    # This is the default used by concurrent.futures.ThreadPoolExecutor
+    try:
+        import multiprocessing
+
+        cpu_count = multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: nocover
+        cpu_count = 1
+
+    return min(32, cpu_count + 4)
+
+
+def prepare_for_fork(keys=None, workers=None, freeze=True):
+    """Loads zones and freezes them in preparation for forking worker processes.
+
+    In a pre-forking server (e.g. ``gunicorn`` or ``uwsgi``), each worker
+    otherwise loads every zone it uses separately. Calling this in the parent
+    process shortly before forking loads the zones with :func:`preload`, builds
+    everything the shims compute lazily (such as the pytz-derived exception
+    classes, when ``pytz`` has been imported, and the case-insensitive key
+    index, when that mode is enabled), and then moves every object tracked by
+    the garbage collector into the permanent generation with
+    :func:`gc.freeze`. Garbage collections in the workers then never write to
+    the memory holding the zones, so it stays shared between the parent and
+    the workers instead of being copied into each of them.
+
+    For best results, also follow the advice in the :func:`gc.freeze`
+    documentation: disable the garbage collector early in the parent process
+    and re-enable it in the workers after forking.
+
+    :param keys:
+        An iterable of IANA keys to load, as for :func:`preload`. By default,
+        every available zone is loaded.
+
+    :param workers:
+        The number of threads to load zones in, as for :func:`preload`.
+
+    :param freeze:
+        Whether to call :func:`gc.freeze`. This is ignored on Python versions
+        where :func:`gc.freeze` is not available (before Python 3.7).
+
+    :return:
+        The result of the :func:`preload` call.
+    """
+    result = preload(keys, workers=workers)
+
+    for shim in _TIMEZONE_CACHE.values():
+        _warm_shim(shim)
+
+    _make_pytz_derived_errors()
+    if _CASE_INSENSITIVE_MODE:
+        _sources.get_canonical_key("UTC")
+
+    if freeze and hasattr(gc, "freeze"):
+        # Collect first, so that garbage from loading is not frozen forever
+        gc.collect()
+        gc.freeze()
+
+    return result
+
+
+def _warm_shim(shim):
+    """Builds everything a shim would otherwise compute on first use."""
+    # In ZoneInfo subclass mode, the unwrapped zone is built lazily
+    shim.unwrap_shim()
+    shim._get_transition_table()
+    shim._get_anomaly_index()
+
+
+def _preload_from_environment(environ=os.environ):
+    value = environ.get(PRELOAD_ENV_VAR, "").strip()
+    if not value:
+        return None
+
+    if value == "*":
+        keys = None
+    else:
+        keys = [key.strip() for key in value.split(",") if key.strip()]
+
+    workers = environ.get(PRELOAD_WORKERS_ENV_VAR, "").strip() or None
+    if workers is not None:
+        try:
+            workers = int(workers)
+            if workers < 1:
+                raise ValueError(workers)
+        except ValueError:
+            warnings.warn(
+                "Ignoring invalid value for %s: %r"
+                % (PRELOAD_WORKERS_ENV_VAR, workers),
+                RuntimeWarning,
+            )
+            workers = None
+
+    result = preload(keys, workers=workers)
+    if result.failed:
+        warnings.warn(
+            "Failed to preload time zones: %s"
+            % ", ".join(sorted(result.failed)),
+            RuntimeWarning,
+        )
+
+    return result
+
+
+def save_snapshot(path, keys=None):
+    """Saves the data for the zones :func:`timezone` has loaded to a file.
+
+    The snapshot contains the TZif data for each zone, along with a record of
+    where that data came from: the time zone search path, the version of the
+    data in each directory on it (and in the ``tzdata`` package), and the
+    size, modification time and hash of each zone's file. Another process can
+    then use the snapshot with :func:`load_snapshot` instead of searching for
+    and reading each zone's file separately.
+
+    The file is written atomically, so processes loading the snapshot never
+    see a partially-written file.
+
+    :param path:
+        The path to write the snapshot to.
+
+    :param keys:
+        An iterable of IANA keys to include. By default, every zone in the
+        :func:`timezone` cache is included.
+
+    :return:
+        A list of the keys included in the snapshot. Keys whose data cannot be
+        found on the search path are left out.
+    """
+    if keys is None:
+        keys = _cached_keys()
+
+    return _snapshot.write_snapshot(path, keys)
+
+
+def _cached_keys():
+    # The keys of the zones timezone() has loaded, in their canonical spelling
+    return sorted(
+        key
+        for key, shim in _TIMEZONE_CACHE.items()
+        if shim is not UTC and shim._key == key
+    )
+
+
+def load_snapshot(path):
+    """Makes :func:`timezone` load zones from a snapshot.
+
+    The snapshot, written by :func:`save_snapshot`, is mapped into memory,
+    and each zone in it is parsed the first time :func:`timezone` is called
+    for its key; other keys are loaded from the provider as usual. Snapshots
+    are checked before they are used: if the snapshot cannot be read, or the
+    search path or the version of any source of time zone data has changed
+    since it was written, the snapshot is ignored entirely. Zones whose files
+    have changed are ignored individually.
+
+    Loading a snapshot replaces any previously loaded snapshot. It does not
+    affect zones already in the :func:`timezone` cache.
+
+    :param path:
+        The path of a snapshot file.
+
+    :return:
+        A sorted list of the keys that will be loaded from the snapshot; this
+        is empty if the snapshot was ignored.
+    """
+    global _SNAPSHOT
+
+    snapshot = _snapshot.open_snapshot(path)
+    if snapshot is None:
+        return []
+
+    _SNAPSHOT = snapshot
+
+    return sorted(snapshot.keys)
+
+
+def build_bundle(path, keys=None):
+    """Writes the data for many zones to a single bundle file.
+
+    A bundle contains an index of IANA keys followed by the TZif data for each
+    key (keys whose data is identical share a single copy of it), taken from
+    wherever the time zone provider would load it: the time zone search path
+    or the ``tzdata`` package. It can be used with :func:`use_bundle` to load
+    every zone from a single memory-mapped file, e.g. to pin the time zone
+    data used by a deployment.
+
+    This is also available from the command line, as
+    ``python -m pytz_deprecation_shim build-bundle PATH [KEY ...]``.
+
+    :param path:
+        The path to write the bundle to. The file is written atomically.
+
+    :param keys:
+        An iterable of IANA keys to include. By default, every available zone
+        is included.
+
+    :raises UnknownTimeZoneError:
+        If no data can be found for one of the requested keys.
+
+    :return:
+        A sorted list of the keys in the bundle.
+    """
+    if keys is None:
+        keys = _sources.available_keys()
+
+    zones = []
+    for key in sorted(set(keys)):
+        found = _sources.read_zone_data(key)
+        if found is None:
+            raise get_exception(UnknownTimeZoneError, key)
+
+        zones.append((key, found[0]))
+
+    metadata = {
+        "kind": "bundle",
+        "data_identity": _sources.get_data_identity(),
+    }
+    _bundle.write_bundle_file(path, zones, metadata=metadata)
+
+    return [key for key, _ in zones]
+
+
+def use_bundle(path, exclusive=False):
+    """Makes :func:`timezone` load zones from a bundle.
+
+    The bundle, written by :func:`build_bundle`, is mapped into memory and
+    each zone in it is parsed directly from the mapped data the first time
+    :func:`timezone` is called for its key. Unlike a snapshot loaded with
+    :func:`load_snapshot`, a bundle is not compared with the data on the
+    system: it takes precedence over it, and zones loaded from a bundle are
+    never reloaded (see :func:`set_reload_interval`).
+
+    This replaces any bundle or zones previously registered with
+    :func:`register_zones`, and clears the :func:`timezone` cache, so
+    subsequent calls return zones from the new source.
+
+    :param path:
+        The path of a bundle file, or ``None`` to stop using a bundle.
+
+    :param exclusive:
+        If true, :func:`timezone` only returns zones from the bundle, and
+        raises :exc:`UnknownTimeZoneError` for any key not in the bundle.
+        Otherwise, keys not in the bundle are loaded from the provider as
+        usual.
+
+    :raises ValueError:
+        If the file is not a valid bundle.
+
+    :return:
+        A sorted list of the keys in the bundle.
+    """
+    if path is None:
+        _set_zone_source(None, False)
+        return []
+
+    # The previous bundle is not closed explicitly, since another thread may
+    # still be parsing a zone from it; it is released when it is collected.
+    bundle = _bundle.Bundle.open(path)
+    _set_zone_source(_BundleSource(bundle), exclusive)
+
+    return sorted(bundle.keys())
+
+
+def register_zones(zones, exclusive=False):
+    """Makes :func:`timezone` return the given shims for their keys.
+
+    This can be used to make custom time zone data (e.g. built with
+    :func:`build_tzinfo_many`) the backing store for :func:`timezone`. The
+    registered zones take precedence over the system's time zone data, and are
+    never reloaded (see :func:`set_reload_interval`).
+
+    This replaces any zones previously registered or bundle used with
+    :func:`use_bundle`, and clears the :func:`timezone` cache.
+
+    :param zones:
+        A mapping of IANA keys to shim time zones, or ``None`` to stop using
+        registered zones.
+
+    :param exclusive:
+        If true, :func:`timezone` only returns registered zones, and raises
+        :exc:`UnknownTimeZoneError` for any other key. Otherwise, other keys
+        are loaded from the provider as usual.
+    """
+    _set_zone_source(dict(zones) if zones is not None else None, exclusive)
+
+
+def _set_zone_source(zone_source, exclusive):
+    global _ZONE_SOURCE
+    global _ZONE_SOURCE_EXCLUSIVE
+
+    _ZONE_SOURCE = zone_source
+    _ZONE_SOURCE_EXCLUSIVE = bool(exclusive) and zone_source is not None
+    _TIMEZONE_CACHE.clear()
+    _UNKNOWN_KEY_CACHE.clear()
+
+
+def publish_shared_zones(keys=None, name=None):
+    """Publishes the data for zones in a shared memory segment.
+
+    This is intended for pools of worker processes (e.g. a
+    :class:`concurrent.futures.ProcessPoolExecutor`): the parent process
+    publishes the TZif data for the zones it uses in a single
+    :mod:`multiprocessing.shared_memory` segment, and each worker calls
+    :func:`attach_shared_zones` (e.g. from the pool's ``initializer``) to load
+    zones from that segment. The data is then held in memory once, rather
+    than once per worker, and each worker only parses the zones it uses.
+
+    The segment is in the bundle format used by :func:`build_bundle`. It
+    remains available until :func:`unpublish_shared_zones` is called.
+
+    :param keys:
+        An iterable of IANA keys to publish. By default, every zone in the
+        :func:`timezone` cache is published.
+
+    :param name:
+        The name of the segment to create; by default, a unique name is
+        generated.
+
+    :raises NotImplementedError:
+        If :mod:`multiprocessing.shared_memory` is not available (i.e. before
+        Python 3.8).
+
+    :return:
+        The name of the segment, to be passed to :func:`attach_shared_zones`.
+    """
+    if _shared.shared_memory is None:
+        raise NotImplementedError(
+            "Sharing zones requires multiprocessing.shared_memory."
+        )
+
+    if keys is None:
+        keys = _cached_keys()
+
+    zones = []
+    for key in sorted(set(keys)):
+        data = _get_zone_data(key)
+        if data is not None:
+            zones.append((key, data))
+
+    buffer = io.BytesIO()
+    _bundle.write_bundle(
+        buffer, zones, metadata={"kind": "shared", "pid": os.getpid()}
+    )
+
+    segment = _shared.create_segment(buffer.getvalue(), name=name)
+    _SHARED_SEGMENTS[segment.name] = segment
+
+    return segment.name
+
+
+def unpublish_shared_zones(name):
+    """Removes a segment created by :func:`publish_shared_zones`.
+
+    Processes that have already attached to the segment can continue to use
+    it; the memory is released once they have all stopped using it.
+
+    :raises KeyError:
+        If this process did not publish a segment with that name.
+    """
+    _shared.destroy_segment(_SHARED_SEGMENTS.pop(name))
+
+
+def attach_shared_zones(name, exclusive=False):
+    """Makes :func:`timezone` load zones from a shared memory segment.
+
+    The segment must have been created by :func:`publish_shared_zones`,
+    usually in a parent process. It is used exactly like a bundle (see
+    :func:`use_bundle`): each zone is parsed directly from the shared memory
+    the first time it is requested, and ``use_bundle(None)`` stops using it.
+
+    :param name:
+        The name returned by :func:`publish_shared_zones`.
+
+    :param exclusive:
+        If true, :func:`timezone` raises :exc:`UnknownTimeZoneError` for keys
+        that are not in the segment, rather than loading them from the
+        provider.
+
+    :raises NotImplementedError:
+        If :mod:`multiprocessing.shared_memory` is not available (i.e. before
+        Python 3.8).
+
+    :raises FileNotFoundError:
+        If there is no segment with that name.
+
+    :return:
+        A sorted list of the keys in the segment.
+    """
+    if _shared.shared_memory is None:
+        raise NotImplementedError(
+            "Sharing zones requires multiprocessing.shared_memory."
+        )
+
+    mapping = _shared.attach_segment(name)
+    try:
+        bundle = _bundle.Bundle(mapping, _closer=mapping.close)
+    except Exception:
+        mapping.close()
+        raise
+
+    _set_zone_source(_BundleSource(bundle), exclusive)
+
+    return sorted(bundle.keys())
+
+
+def _get_zone_data(key):
+    # Returns the TZif data for the zone timezone(key) returns, or None
+    zone_source = _ZONE_SOURCE
+    if zone_source is not None and key in zone_source:
+        # The data for registered zones is not kept, so only bundles can
+        # provide it.
+        get_data = getattr(zone_source, "get_data", None)
+        return get_data(key) if get_data is not None else None
+
+    if _ZONE_SOURCE_EXCLUSIVE:
+        return None
+
+    found = _sources.read_zone_data(key)
+    return found[0] if found is not None else None
+
+
+class _BundleSource(object):
+    """Presents a bundle as a mapping of keys to (newly parsed) shims."""
+
+    def __init__(self, bundle):
+        self._bundle = bundle
+
+    def get_data(self, key):
+        data = self._bundle.get(key)
+        return bytes(data) if data is not None else None
+
+    def get(self, key):
+        data = self._bundle.get(key)
+        if data is None:
+            return None
+
+        return _load_timezone_data(key, data)
+
+    def keys(self):
+        return self._bundle.keys()
+
+    def __contains__(self, key):
+        return key in self._bundle
+
+
+def build_tzinfo_many(source, keys=None, workers=None, register=False):
+    """Builds shims for many TZif files in a directory or zip archive.
+
+    This is the equivalent of calling :func:`build_tzinfo` for each TZif file
+    under ``source``, but the files are read and parsed in a pool of threads.
+    Each key is the path of its file relative to the root of the directory or
+    archive, with ``/`` as the separator (e.g. ``"America/New_York"``).
+
+    :param source:
+        The path of a directory or a zip file.
+
+    :param keys:
+        An iterable of keys to load. By default, every TZif file found is
+        loaded (except for those that :func:`timezone` would not find, such as
+        the ``posix`` and ``right`` directories and ``posixrules``).
+
+    :param workers:
+        The number of threads to use, as for :func:`preload`.
+
+    :param register:
+        If true, the shims are also registered as the backing store for
+        :func:`timezone` with :func:`register_zones`. To register them
+        exclusively, pass the result to :func:`register_zones` instead.
+
+    :raises ValueError:
+        If ``source`` is neither a directory nor a zip file, or ``workers`` is
+        not a positive integer.
+
+    :raises UnknownTimeZoneError:
+        If one of the requested ``keys`` is not a TZif file in ``source``.
+
+    :return:
+        A dictionary mapping each key to its shim.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer or None")
+
+    if zipfile.is_zipfile(source):
+        archive = zipfile.ZipFile(source)
+        try:
+            zones = _build_zones(
+                _ZipReader(archive), keys, workers, explicit=keys is not None
+            )
+        finally:
+            archive.close()
+    elif os.path.isdir(source):
+        zones = _build_zones(
+            _DirectoryReader(source), keys, workers, explicit=keys is not None
+        )
+    else:
+        raise ValueError("Not a directory or zip file: %s" % (source,))
+
+    if register:
+        register_zones(zones)
+
+    return zones
+
+
+def _build_zones(reader, keys, workers, explicit):
+    if keys is None:
+        keys = reader.keys()
+
+    def build(key):
+        data = reader.read(key)
+        if data is None or not data.startswith(_sources.TZIF_MAGIC):
+            return key, None
+
+        return key, build_tzinfo(key, data)
+
+    zones = {}
+    for key, zone in _map_in_threads(build, sorted(set(keys)), workers):
+        if zone is None:
+            if explicit:
                 raise get_exception(UnknownTimeZoneError, key)
-            instance = _cache.setdefault(key, wrap_zone(zone, key=key))
+            continue
 
-    return instance
+        zones[key] = zone
 
+    return zones
 
-def fixed_offset_timezone(offset, _cache={}):
+
+class _DirectoryReader(object):
+    def __init__(self, directory):
+        self._directory = directory
+
+    def keys(self):
+        return [key for key, _ in _sources.find_zone_files(self._directory)]
+
+    def read(self, key):
+        if not _sources.is_valid_key_syntax(key):
+            return None
+
+        try:
+            with open(os.path.join(self._directory, key), "rb") as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+
+class _ZipReader(object):
+    def __init__(self, archive):
+        self._archive = archive
+        self._names = frozenset(archive.namelist())
+        # ZipFile objects are not safe to read from concurrently on Python 2
+        self._lock = threading.Lock()
+
+    def keys(self):
+        return [
+            name
+            for name in self._names
+            if not name.endswith("/") and _sources.is_included_key(name)
+        ]
+
+    def read(self, key):
+        if key not in self._names:
+            return None
+
+        with self._lock:
+            return self._archive.read(key)
+
+
+def fixed_offset_timezone(offset, _cache=_FIXED_OFFSET_CACHE):
     """Builds a fixed offset time zone shim.
 
     This is the equivalent of ``pytz.FixedOffset``. An alias is available as
@@ -55,26 +1079,179 @@ def fixed_offset_timezone(offset, _cache={}):
         <= offset <= 1439``.
 
     :raises ValueError:
-        For offsets whose absolute value is greater than or equal to 24 hours.
-
-    :return:
-        A shim time zone.
+        For offsets whose absolute value is greater than or equal to 24 hours.
+
+    :return:
+        A shim time zone.
+    """
+    if not (-1440 < offset < 1440):
+        raise ValueError("absolute offset is too large", offset)
+
+    instance = _cache.get(offset, None)
+    if instance is None:
+        if offset == 0:
+            instance = _cache.setdefault(offset, UTC)
+        else:
+            zone = _compat.get_fixed_offset_zone(offset)
+            instance = _cache.setdefault(offset, wrap_zone(zone, key=None))
+
+    return instance
+
+
+def set_zoneinfo_subclass_mode(enabled=True):
+    """Controls whether shims are :class:`zoneinfo.ZoneInfo` subclasses.
+
+    By default, :func:`timezone` and :func:`build_tzinfo` return wrapper
+    objects which forward the ``tzinfo`` protocol methods (``utcoffset``,
+    ``dst``, ``tzname`` and ``fromutc``) to the underlying time zone. When this
+    mode is enabled, these functions instead return instances of a
+    :class:`zoneinfo.ZoneInfo` subclass that also carries the ``pytz``-specific
+    interface (``localize``, ``normalize``, ``zone`` and ``unwrap_shim``), so
+    that the ``tzinfo`` protocol methods are those of ``ZoneInfo`` itself.
+
+    Shims that were created before the mode was changed continue to work, but
+    :func:`timezone` will not return them again.
+
+    :param enabled:
+        Whether :func:`timezone` and :func:`build_tzinfo` should return
+        :class:`zoneinfo.ZoneInfo` subclasses.
+
+    :raises NotImplementedError:
+        If ``enabled`` is true and :mod:`zoneinfo` is not available (i.e. on
+        Python 2).
+    """
+    global _ZONEINFO_SUBCLASS_MODE
+
+    if enabled and _compat.ZoneInfo is None:
+        raise NotImplementedError(
+            "ZoneInfo subclass mode requires the zoneinfo module."
+        )
+
+    if bool(enabled) != _ZONEINFO_SUBCLASS_MODE:
+        _ZONEINFO_SUBCLASS_MODE = bool(enabled)
+        _TIMEZONE_CACHE.clear()
+
+
+def cache_info():
+    """Reports statistics for the caches used by the shim constructors.
+
+    :return:
+        A dictionary mapping the name of each cached constructor
+        (``"timezone"``, ``"fixed_offset_timezone"`` and ``"wrap_zone"``) to
+        a named tuple with the fields ``hits``, ``misses``, ``maxsize`` and
+        ``currsize``, like the one returned by
+        :func:`functools.lru_cache`'s ``cache_info()``. The statistics for the
+        cache of keys that :func:`timezone` has rejected are reported under
+        ``"unknown_keys"``, and those for the zones shared by
+        :func:`build_tzinfo` (see :func:`set_build_tzinfo_deduplication`)
+        under ``"build_tzinfo"``.
+    """
+    return {name: cache.cache_info() for name, cache in _CACHES.items()}
+
+
+def clear_cache(only_keys=None):
+    """Clears the caches used by the shim constructors.
+
+    This mirrors :meth:`zoneinfo.ZoneInfo.clear_cache`: after the cache has
+    been cleared, the constructors will return new shim objects, but existing
+    shims remain valid. Keys that :func:`timezone` previously rejected are
+    forgotten as well. Note that this does not clear any caches in the
+    underlying time zone provider.
+
+    :param only_keys:
+        If specified, an iterable of keys to remove from the caches: IANA keys
+        for :func:`timezone` and :func:`wrap_zone`, and offsets in minutes for
+        :func:`fixed_offset_timezone`. Otherwise all entries are removed and
+        the statistics are reset.
+    """
+    if only_keys is not None:
+        only_keys = frozenset(only_keys)
+
+    for cache in _CACHES.values():
+        cache.clear(only_keys=only_keys)
+
+    _RELOADER.forget(only_keys)
+
+    if only_keys is None:
+        _sources.reset_key_index()
+
+    # The UTC singleton must always be what wrap_zone returns for its zone
+    _WRAP_ZONE_CACHE.setdefault((id(_compat.UTC), "UTC"), UTC)
+
+
+def set_cache_size(maxsize, names=None):
+    """Sets the number of entries the shim caches hold strong references to.
+
+    With ``maxsize=None``, a cache holds on to every shim it has ever
+    returned; this is the default for the :func:`timezone` and
+    :func:`fixed_offset_timezone` caches. Otherwise, each cache keeps strong
+    references to the ``maxsize`` most recently used shims, evicting the least
+    recently used ones; evicted shims are still returned from the cache for as
+    long as they are referenced elsewhere, so the same key continues to map to
+    the same object while that object is alive.
+
+    The :func:`wrap_zone` cache has a ``maxsize`` of 0 by default, so that the
+    shims it returns, and the zones they wrap, can be garbage collected as
+    soon as they are no longer in use.
+
+    :param maxsize:
+        A non-negative integer, or ``None`` for an unbounded cache.
+
+    :param names:
+        An iterable of cache names (as returned by :func:`cache_info`) to
+        resize. By default, all of the caches of shim objects are resized.
+        The cache of rejected keys (``"unknown_keys"``, which holds at most
+        1024 keys by default) is only resized when named explicitly, in which
+        case ``maxsize`` is the number of keys it remembers, as is the
+        ``"build_tzinfo"`` cache of zones.
+
+    :raises ValueError:
+        If ``maxsize`` is negative, or an unknown cache name is given.
     """
-    if not (-1440 < offset < 1440):
-        raise ValueError("absolute offset is too large", offset)
-
-    instance = _cache.get(offset, None)
-    if instance is None:
-        if offset == 0:
-            instance = _cache.setdefault(offset, UTC)
-        else:
-            zone = _compat.get_fixed_offset_zone(offset)
-            instance = _cache.setdefault(offset, wrap_zone(zone, key=None))
+    if names is None:
+        names = _SHIM_CACHE_NAMES
+
+    caches = []
+    for name in names:
+        if name not in _CACHES:
+            raise ValueError("Unknown cache: %s" % name)
+        caches.append(_CACHES[name])
+
+    for cache in caches:
+        cache.resize(maxsize)
+
+
+def set_alias_deduplication(enabled=True):
+    """Controls whether aliases of a zone share one underlying zone.
+
+    Many keys are links to another zone (e.g. ``"US/Eastern"`` is a link to
+    ``"America/New_York"``), and by default the provider loads and parses the
+    data for each of them separately. When this is enabled, :func:`timezone`
+    resolves links using the ``tzdata.zi`` file that accompanies the data and
+    wraps the target's zone instead, so all of the aliases of a zone share a
+    single parsed copy of its data. Each alias still gets its own shim, which
+    reports the key it was requested with as its ``zone``; ``unwrap_shim()``
+    returns the zone of the link's target (e.g. ``ZoneInfo("America/New_York")``
+    for ``"US/Eastern"``).
+
+    Keys whose data does not come with a ``tzdata.zi`` file (e.g. when it is
+    loaded from a zipped ``tzdata`` package) are loaded as usual. In ZoneInfo
+    subclass mode (see :func:`set_zoneinfo_subclass_mode`), each shim is
+    itself the parsed zone, so this has no effect.
+
+    :param enabled:
+        Whether :func:`timezone` should share zones between aliases.
+    """
+    global _ALIAS_DEDUPLICATION
 
-    return instance
+    enabled = bool(enabled)
+    if enabled != _ALIAS_DEDUPLICATION:
+        _ALIAS_DEDUPLICATION = enabled
+        _ALIAS_CACHE.clear()
+        _TIMEZONE_CACHE.clear()
 
 
-def build_tzinfo(zone, fp):
+def build_tzinfo(zone, fp, _cache=_BUILD_TZINFO_CACHE):
     """Builds a shim object from a TZif file.
 
     This is a shim for ``pytz.build_tzinfo``. Given a value to use as the zone
@@ -89,17 +1266,74 @@ def build_tzinfo(zone, fp):
 
     :param fp:
         A readable file-like object emitting bytes, pointing to a valid TZif
-        file.
+        file. The contents of a TZif file may also be passed directly as any
+        object supporting the buffer protocol (e.g. ``bytes``,
+        ``memoryview`` or ``mmap.mmap``), in which case they are parsed in
+        place, without being copied.
 
     :return:
         A shim time zone.
     """
-    zone_file = _compat.get_timezone_file(fp)
+    if hasattr(fp, "read") and not isinstance(fp, mmap.mmap):
+        if _ZONEINFO_SUBCLASS_MODE:
+            return _ZoneInfoShimTimezone._from_shim_file(fp, key=zone)
+
+        if not _BUILD_TZINFO_DEDUPLICATION:
+            return wrap_zone(_compat.get_timezone_file(fp), key=zone)
+
+        data = fp.read()
+    else:
+        data = fp
+
+    if _ZONEINFO_SUBCLASS_MODE:
+        instance = _ZoneInfoShimTimezone._from_shim_data(data, key=zone)
+    elif not _BUILD_TZINFO_DEDUPLICATION:
+        instance = wrap_zone(
+            _compat.get_timezone_file(BufferReader(data)), key=zone
+        )
+    else:
+        digest = hashlib.sha256(data).digest()
+        zone_file = _cache.get(digest, None)
+        if zone_file is None:
+            zone_file = _cache.get_or_create(
+                digest, lambda _: _compat.get_timezone_file(BufferReader(data))
+            )
+
+        instance = wrap_zone(zone_file, key=zone)
+
+    _set_transition_source(instance, lambda: data)
+
+    return instance
+
+
+def set_build_tzinfo_deduplication(enabled=True):
+    """Controls whether :func:`build_tzinfo` reuses zones with identical data.
+
+    When this is enabled, :func:`build_tzinfo` hashes the TZif data it is
+    given, and if a zone built from identical data is still alive, that zone
+    is wrapped rather than parsing the data again. Each key still gets its own
+    shim (the same one for as long as it is alive), but the shims for, e.g.,
+    ``"US/Eastern"`` and ``"America/New_York"`` share the underlying zone, so
+    ``unwrap_shim()`` returns the same object for both.
 
-    return wrap_zone(zone_file, key=zone)
+    The zones are held weakly, in the cache reported as ``"build_tzinfo"`` by
+    :func:`cache_info`; use :func:`set_cache_size` to keep some of them alive.
+    In ZoneInfo subclass mode (see :func:`set_zoneinfo_subclass_mode`), each
+    shim is itself the parsed zone, so this has no effect.
 
+    :param enabled:
+        Whether :func:`build_tzinfo` should reuse zones built from identical
+        data.
+    """
+    global _BUILD_TZINFO_DEDUPLICATION
+
+    enabled = bool(enabled)
+    if enabled != _BUILD_TZINFO_DEDUPLICATION:
+        _BUILD_TZINFO_DEDUPLICATION = enabled
+        _BUILD_TZINFO_CACHE.clear()
 
-def wrap_zone(tz, key=KEY_SENTINEL, _cache={}):
+
+def wrap_zone(tz, key=KEY_SENTINEL, _cache=_WRAP_ZONE_CACHE):
     """Wrap an existing time zone object in a shim class.
 
     This is likely to be useful if you would like to work internally with
@@ -116,7 +1350,8 @@ def wrap_zone(tz, key=KEY_SENTINEL, _cache={}):
         zones, but required for ``dateutil.tz`` zones.
 
     :return:
-        A shim time zone.
+        A shim time zone. Wrapping the same zone with the same key returns the
+        same shim for as long as that shim is alive.
     """
     if key is KEY_SENTINEL:
         key = getattr(tz, "key", KEY_SENTINEL)
@@ -127,52 +1362,66 @@ def wrap_zone(tz, key=KEY_SENTINEL, _cache={}):
             + "have a `key` attribute."
         )
 
-    instance = _cache.get((id(tz), key), None)
+    cache_key = (id(tz), key)
+    instance = _cache.get(cache_key, None)
+    if instance is not None and instance._zone is not tz:
+        # Each cached shim keeps its zone alive, so the id should not have
+        # been reused; this guards against it anyway, since returning a shim
+        # for the wrong zone would be much worse than a cache miss.
+        _cache.pop(cache_key)
+        instance = None
+
     if instance is None:
-        instance = _cache.setdefault((id(tz), key), _PytzShimTimezone(tz, key))
+        instance = _cache.setdefault(cache_key, _shim_class(tz)(tz, key))
 
     return instance
 
 
-class _PytzShimTimezone(tzinfo):
-    # Add instance variables for _zone and _key because this will make error
-    # reporting with partially-initialized _BasePytzShimTimezone objects
-    # work better.
-    _zone = None
-    _key = None
+def _shim_class(tz):
+    if tz is _compat.UTC:
+        return _UTCShimTimezone
 
-    def __init__(self, zone, key):
-        self._key = key
-        self._zone = zone
+    if _compat.is_fixed_offset_zone(tz):
+        return _FixedOffsetShimTimezone
 
-    def utcoffset(self, dt):
-        return self._zone.utcoffset(dt)
+    return _PytzShimTimezone
 
-    def dst(self, dt):
-        return self._zone.dst(dt)
 
-    def tzname(self, dt):
-        return self._zone.tzname(dt)
+def _get_constant_offset(tz):
+    # Returns the UTC offset of a fixed-offset zone, or None for other zones
+    if isinstance(tz, _FixedOffsetShimTimezone):
+        return tz._utcoffset
 
-    def fromutc(self, dt):
-        # The default fromutc implementation only works if tzinfo is "self"
-        dt_base = dt.replace(tzinfo=self._zone)
-        dt_out = self._zone.fromutc(dt_base)
+    if _compat.is_fixed_offset_zone(tz):
+        return tz.utcoffset(None)
 
-        return dt_out.replace(tzinfo=self)
+    return None
 
-    def __str__(self):
-        if self._key is not None:
-            return str(self._key)
-        else:
-            return repr(self)
 
-    def __repr__(self):
-        return "%s(%s, %s)" % (
-            self.__class__.__name__,
-            repr(self._zone),
-            repr(self._key),
-        )
+def _shift_clamped(dt, delta):
+    # Adds delta to a naive datetime, clamping to the range of datetime
+    try:
+        return dt + delta
+    except OverflowError:
+        return datetime.min if delta < timedelta(0) else datetime.max
+
+
+class _BasePytzShimTimezone(object):
+    """Mixin providing the ``pytz``-specific interface of the shim classes.
+
+    Subclasses must provide ``_zone`` (the underlying time zone) and ``_key``
+    (the IANA key, or ``None``) attributes as well as the ``tzinfo`` protocol
+    methods.
+    """
+
+    # Add instance variables for _zone and _key because this will make error
+    # reporting with partially-initialized _BasePytzShimTimezone objects
+    # work better.
+    _zone = None
+    _key = None
+    _reduce_by_key = False
+    # A function returning the TZif data the zone was built from, if known
+    _transition_source = None
 
     def unwrap_shim(self):
         """Returns the underlying class that the shim is a wrapper for.
@@ -189,6 +1438,176 @@ class _PytzShimTimezone(tzinfo):
         """
         return self._zone
 
+    def _get_transition_table(self):
+        """Returns the shim's :class:`._transitions.TransitionTable`.
+
+        The table is built the first time it is needed, and is ``None`` if the
+        data the zone was built from is not known or does not match the zone.
+        """
+        table = self.__dict__.get("_transition_table", _NO_TABLE)
+        if table is not _NO_TABLE:
+            return table
+
+        table = None
+        source = self._transition_source
+        if source is not None:
+            data = source()
+            if data is not None:
+                table = _transitions.build_table(self._zone, data)
+
+        table = self.__dict__.setdefault("_transition_table", table)
+        self.__dict__.pop("_transition_source", None)
+
+        return table
+
+    def _get_anomaly_index(self):
+        """Returns the shim's :class:`._transitions.AnomalyIndex`.
+
+        The index is built from the transition table the first time it is
+        needed, and is ``None`` if the zone has no table.
+        """
+        index = self.__dict__.get("_anomaly_index", None)
+        if index is None:
+            table = self._get_transition_table()
+            if table is None:
+                return None
+
+            index = self.__dict__.setdefault(
+                "_anomaly_index", _transitions.build_anomaly_index(table)
+            )
+
+        return index
+
+    def _get_covering_anomaly_index(self, timestamp=None):
+        index = self._get_anomaly_index()
+        if index is None:
+            raise ValueError("The gaps and folds of %s are not known" % self)
+
+        if timestamp is not None and not index.covers(timestamp):
+            raise ValueError(
+                "The gaps and folds of %s are only known before %s"
+                % (self, _transitions.EPOCH + timedelta(seconds=index.limit))
+            )
+
+        return index
+
+    def _get_array_table(self):
+        """Returns the shim's :class:`._arrays.ArrayTable`.
+
+        The table is built from the transition table the first time it is
+        needed, and is ``None`` if the zone has no transition table.
+        """
+        table = self.__dict__.get("_array_table", None)
+        if table is None:
+            transition_table = self._get_transition_table()
+            if transition_table is None:
+                return None
+
+            table = self.__dict__.setdefault(
+                "_array_table", _arrays.build_array_table(transition_table)
+            )
+
+        return table
+
+    def _classify_array(self, seconds):
+        # Returns arrays of the kind codes of an array of local timestamps,
+        # and of their offsets and DST offsets in seconds with fold=0 and
+        # fold=1. Timestamps the zone's table does not cover are classified
+        # one at a time.
+        np = _arrays.np
+        table = self._get_array_table()
+        if table is not None:
+            kind, interval_0, interval_1, covered = table.classify(seconds)
+            result = (
+                kind,
+                table.offsets[interval_0],
+                table.offsets[interval_1],
+                table.dsts[interval_0],
+                table.dsts[interval_1],
+            )
+            missing = zip(*np.nonzero(~covered))
+        else:
+            result = (np.zeros(seconds.shape, dtype=np.int8),) + tuple(
+                np.zeros(seconds.shape, dtype=np.int64) for _ in range(4)
+            )
+            missing = np.ndindex(seconds.shape)
+
+        for index in missing:
+            classification = self.classify(
+                _transitions.from_timestamp(int(seconds[index]))
+            )
+            result[0][index] = _arrays.KIND_CODES[classification.kind]
+            for array, offset in zip(result[1:], classification[1:]):
+                array[index] = int(offset.total_seconds())
+
+        return result
+
+    def find_anomaly(self, dt):
+        """Finds the gap or fold that a wall time falls in.
+
+        This is a shim-specific method. The ``tzinfo`` and ``fold`` of ``dt``
+        are ignored.
+
+        :param dt:
+            A :class:`datetime.datetime`.
+
+        :return:
+            An ``Anomaly`` named tuple of ``kind`` (``"imaginary"`` for a gap
+            or ``"ambiguous"`` for a fold), the naive local ``start``
+            (inclusive) and ``end`` (exclusive) of the window, and the
+            ``utcoffset_before`` and ``utcoffset_after`` the transition; or
+            ``None`` if ``dt`` is not in a gap or a fold.
+
+        :raises ValueError:
+            If the transitions of the zone are not known (e.g. for zones
+            built from a file object or on Python 2), or ``dt`` is after the
+            end of 2037.
+        """
+        timestamp = _transitions.to_timestamp(dt)
+
+        return self._get_covering_anomaly_index(timestamp).find(timestamp)
+
+    def anomalies(self, start=None, end=None):
+        """Lists the gaps and folds of the zone in a range of wall times.
+
+        This is a shim-specific method. The ``tzinfo`` and ``fold`` of the
+        bounds are ignored.
+
+        :param start:
+            A :class:`datetime.datetime`; only windows that end after this are
+            included. By default, the list starts at the zone's first
+            transition.
+
+        :param end:
+            A :class:`datetime.datetime`; only windows that start before this
+            are included. By default, the list ends at the end of 2037.
+
+        :return:
+            A list of the ``Anomaly`` named tuples (as returned by
+            :meth:`find_anomaly`) of every gap and fold overlapping the range,
+            in order.
+
+        :raises ValueError:
+            If the transitions of the zone are not known, or ``end`` is after
+            the end of 2037.
+        """
+        if end is None:
+            index = self._get_covering_anomaly_index()
+            end_timestamp = index.limit if index.limit is not None else _INF
+        else:
+            end_timestamp = _transitions.to_timestamp(end)
+            if end.microsecond:
+                end_timestamp += 1
+
+            index = self._get_covering_anomaly_index(end_timestamp - 1)
+
+        if start is None:
+            start_timestamp = -_INF
+        else:
+            start_timestamp = _transitions.to_timestamp(start)
+
+        return index.overlapping(start_timestamp, end_timestamp)
+
     @property
     def zone(self):
         warnings.warn(
@@ -215,52 +1634,492 @@ class _PytzShimTimezone(tzinfo):
         if dt.tzinfo is not None:
             raise ValueError("Not naive datetime (tzinfo is already set)")
 
+        return self._localize(dt, is_dst)
+
+    def _localize(self, dt, is_dst):
         dt_out = dt.replace(tzinfo=self)
 
         if is_dst is IS_DST_SENTINEL:
             return dt_out
 
-        dt_ambiguous = _compat.is_ambiguous(dt_out)
-        dt_imaginary = (
-            _compat.is_imaginary(dt_out) if not dt_ambiguous else False
-        )
+        kind, offset_0, offset_1, dst_0, dst_1 = self.classify(dt)
+        if kind == _transitions.NORMAL:
+            return dt_out
 
         if is_dst is None:
-            if dt_imaginary:
+            if kind == _transitions.IMAGINARY:
                 raise get_exception(
                     NonExistentTimeError, dt.replace(tzinfo=None)
                 )
 
-            if dt_ambiguous:
-                raise get_exception(AmbiguousTimeError, dt.replace(tzinfo=None))
-
-        elif dt_ambiguous or dt_imaginary:
-            # Start by normalizing the folds; dt_out may have fold=0 or fold=1,
-            # but we need to know the DST offset on both sides anyway, so we
-            # will get one datetime representing each side of the fold, then
-            # decide which one we're going to return.
-            if _compat.get_fold(dt_out):
-                dt_enfolded = dt_out
-                dt_out = _compat.enfold(dt_out, fold=0)
+            raise get_exception(AmbiguousTimeError, dt.replace(tzinfo=None))
+
+        # Decide whether the fold=0 or fold=1 side represents what pytz would
+        # return for `is_dst=True`.
+        enfolded_dst = bool(dst_1)
+        if bool(dst_0) == enfolded_dst:
+            # If this is not a transition between standard time and daylight
+            # saving time, pytz will consider the larger offset the DST
+            # offset.
+            enfolded_dst = offset_1 > offset_0
+
+        # Use the fold=1 side if is_dst == True and the enfolded side is DST
+        # or if is_dst == False and the enfolded side is *not* DST.
+        return _compat.enfold(dt_out, fold=int(is_dst == enfolded_dst))
+
+    def localize_many(self, dts, is_dst=IS_DST_SENTINEL, on_error="raise"):
+        """Localizes an iterable of naive datetimes.
+
+        This is a shim-specific batch version of ``localize``, which emits a
+        single :class:`PytzUsageWarning` when it is called rather than one
+        per datetime. The datetimes are localized lazily, as the returned
+        iterator is consumed. Consecutive datetimes that fall between the
+        same two gaps or folds of the zone are localized without looking up
+        the zone's transitions again, so inputs that are sorted, or nearly
+        so, are localized fastest.
+
+        :param dts:
+            An iterable of naive :class:`datetime.datetime` objects.
+
+        :param is_dst:
+            As for ``localize``.
+
+        :param on_error:
+            What to do with ambiguous and imaginary times when ``is_dst`` is
+            ``None``: ``"raise"`` raises the same exception as ``localize``,
+            ``"none"`` yields ``None`` in their place, and ``"skip"`` leaves
+            them out of the output.
+
+        :return:
+            An iterator of the localized datetimes.
+
+        :raises ValueError:
+            If ``on_error`` is not one of the values above, or (when the
+            iterator is consumed) if a datetime is not naive.
+        """
+        if on_error not in ("raise", "none", "skip"):
+            raise ValueError("Unknown on_error value: %r" % (on_error,))
+
+        warnings.warn(
+            "The localize_many method is no longer necessary, as this "
+            + "time zone supports the fold attribute (PEP 495). "
+            + "For more details on migrating to a PEP 495-compliant "
+            + "implementation, see %s" % PYTZ_MIGRATION_GUIDE_URL,
+            PytzUsageWarning,
+            stacklevel=2,
+        )
+
+        return self._localize_many(dts, is_dst, on_error)
+
+    def _localize_many(self, dts, is_dst, on_error):
+        check = is_dst is not IS_DST_SENTINEL
+
+        # The naive datetimes, [low, high), which are known to be normal
+        low = high = _transitions.EPOCH
+        for dt in dts:
+            if dt.tzinfo is not None:
+                raise ValueError("Not naive datetime (tzinfo is already set)")
+
+            if check and not low <= dt < high:
+                window = self._get_normal_window(_transitions.to_timestamp(dt))
+                if window is not None:
+                    low, high = window
+                elif is_dst is None and on_error != "raise":
+                    if self.classify(dt).kind != _transitions.NORMAL:
+                        if on_error == "none":
+                            yield None
+                        continue
+                else:
+                    yield self._localize(dt, is_dst)
+                    continue
+
+            yield dt.replace(tzinfo=self)
+
+    def _get_normal_window(self, timestamp):
+        # Returns the naive start and end of the run of normal wall times
+        # containing a local timestamp, or None if it is not normal or the
+        # zone's transitions are not known.
+        table = self._get_transition_table()
+        if table is None:
+            return None
+
+        window = table.normal_window(timestamp)
+        if window is None:
+            return None
+
+        return tuple(_transitions.from_timestamp(t) for t in window)
+
+    def localize_array(self, values, is_dst=IS_DST_SENTINEL):
+        """Localizes an array of wall times.
+
+        This is a shim-specific, vectorized version of ``localize`` for NumPy
+        arrays of ``datetime64`` values, which resolves ambiguous and
+        imaginary times according to ``is_dst`` in the same way. It does not
+        emit a :class:`PytzUsageWarning`.
+
+        Wall times are resolved with a bisection of the zone's transitions
+        for the whole array at once. Times after the end of 2037 (and all
+        times in zones whose transitions are not known, such as zones built
+        from a file object) are resolved one at a time.
+
+        :param values:
+            An array of ``datetime64`` values. Values in units coarser than
+            seconds are converted to seconds, and ``NaT`` values are passed
+            through.
+
+        :param is_dst:
+            As for ``localize``.
+
+        :return:
+            A ``LocalizedArray`` named tuple of ``utc``, an ``int64`` array of
+            the instants the wall times refer to, as counts of the unit of
+            ``values`` (or seconds) since the Unix epoch, and ``fold``, a
+            boolean array of the ``fold`` that ``localize`` would return for
+            each wall time.
+
+        :raises NotImplementedError:
+            If NumPy is not installed.
+
+        :raises ValueError:
+            If ``values`` are not ``datetime64`` values, or are in a unit
+            finer than nanoseconds.
+
+        :raises NonExistentTimeError:
+            If ``is_dst`` is ``None`` and a wall time is imaginary.
+
+        :raises AmbiguousTimeError:
+            If ``is_dst`` is ``None`` and a wall time is ambiguous.
+        """
+        np = _arrays.np
+        if np is None:
+            raise NotImplementedError("Localizing arrays requires NumPy.")
+
+        values, per_second, seconds, nat = _arrays.to_seconds(values)
+        kind, offset_0, offset_1, dst_0, dst_1 = self._classify_array(seconds)
+        kind[nat] = _arrays.NORMAL
+
+        anomalous = kind != _arrays.NORMAL
+        if is_dst is IS_DST_SENTINEL or not anomalous.any():
+            fold = np.zeros(values.shape, dtype=bool)
+        elif is_dst is None:
+            index = np.flatnonzero(anomalous)[0]
+            if kind.flat[index] == _arrays.IMAGINARY:
+                exc_type = NonExistentTimeError
+            else:
+                exc_type = AmbiguousTimeError
+
+            raise get_exception(exc_type, _arrays.to_datetime(values, index))
+        else:
+            # As in _localize, the fold=1 side is the DST side unless both or
+            # neither side is DST, when the larger offset is.
+            enfolded_dst = dst_1 != 0
+            enfolded_dst = np.where(
+                (dst_0 != 0) == enfolded_dst, offset_1 > offset_0, enfolded_dst
+            )
+            fold = anomalous & (enfolded_dst == bool(is_dst))
+
+        counts = values.view(np.int64)
+        utc = counts - np.where(fold, offset_1, offset_0) * per_second
+        utc[nat] = counts[nat]
+
+        return LocalizedArray(utc, fold)
+
+    def fromutc_array(self, values, unit="s"):
+        """Converts an array of UTC instants to wall times in this zone.
+
+        This is a shim-specific, vectorized equivalent of calling
+        ``fromutc`` (or ``datetime.fromtimestamp(ts, zone)``) for each
+        element of a NumPy array. The whole array is resolved with a single
+        bisection of the zone's UTC transitions, including those after the
+        last transition listed in the zone's data, up to the end of 2037.
+        Later instants (and all instants in zones whose transitions are not
+        known, such as zones built from a file object) are resolved one at a
+        time.
+
+        :param values:
+            An array of ``datetime64`` values, or of integer counts of
+            ``unit`` since the Unix epoch. Values in units coarser than
+            seconds are converted to seconds, and ``NaT`` values are passed
+            through.
+
+        :param unit:
+            The ``datetime64`` unit of integer ``values`` (e.g. ``"s"`` or
+            ``"ns"``).
+
+        :return:
+            A ``LocalArray`` named tuple of ``local``, a ``datetime64`` array
+            of the wall times in the unit of ``values``; ``utcoffset``, an
+            ``int64`` array of the offsets in seconds; ``dst``, a boolean
+            array of whether daylight saving time is in effect;
+            ``tzname_index``, an array of the index in ``tznames`` (a tuple
+            of strings) of the abbreviation of each wall time, or ``-1`` for
+            ``NaT``; and ``fold``, a boolean array of the ``fold`` of each
+            wall time.
+
+        :raises NotImplementedError:
+            If NumPy is not installed.
+
+        :raises ValueError:
+            If ``values`` are not ``datetime64`` values or integers, or are
+            in a unit finer than nanoseconds.
+        """
+        np = _arrays.np
+        if np is None:
+            raise NotImplementedError("Converting arrays requires NumPy.")
+
+        values, per_second, seconds, nat = _arrays.to_seconds(
+            _arrays.to_datetime64(values, unit)
+        )
+
+        table = self._get_array_table()
+        if table is not None:
+            interval, fold, covered = table.find_utc(seconds)
+            utcoffset = table.offsets[interval]
+            dst = table.dsts[interval] != 0
+            tzname_index = table.abbreviation_indexes[interval]
+            tznames = list(table.abbreviations)
+            missing = zip(*np.nonzero(~covered & ~nat))
+        else:
+            fold = np.zeros(seconds.shape, dtype=bool)
+            utcoffset = np.zeros(seconds.shape, dtype=np.int64)
+            dst = np.zeros(seconds.shape, dtype=bool)
+            tzname_index = np.zeros(seconds.shape, dtype=np.intp)
+            tznames = []
+            missing = zip(*np.nonzero(~nat))
+
+        for index in missing:
+            dt = _transitions.from_timestamp(int(seconds[index]))
+            dt = self.fromutc(dt.replace(tzinfo=self))
+            tzname = dt.tzname()
+            if tzname not in tznames:
+                tznames.append(tzname)
+
+            fold[index] = _compat.get_fold(dt)
+            utcoffset[index] = int(dt.utcoffset().total_seconds())
+            dst[index] = bool(dt.dst())
+            tzname_index[index] = tznames.index(tzname)
+
+        utcoffset[nat] = 0
+        fold[nat] = dst[nat] = False
+        tzname_index[nat] = -1
+
+        local = values.view(np.int64) + utcoffset * per_second
+        local[nat] = values.view(np.int64)[nat]
+
+        return LocalArray(
+            local.view(values.dtype),
+            utcoffset,
+            dst,
+            tzname_index,
+            tuple(tznames),
+            fold,
+        )
+
+    def ambiguous_mask(self, values):
+        """Finds the ambiguous wall times in an array.
+
+        This is a shim-specific, vectorized version of :meth:`classify` for
+        NumPy arrays of ``datetime64`` values, resolved as described for
+        :meth:`localize_array`.
+
+        :param values:
+            An array of ``datetime64`` values.
+
+        :return:
+            A boolean array that is ``True`` where the wall time occurs twice
+            in this zone (and ``False`` for ``NaT``).
+
+        :raises NotImplementedError:
+            If NumPy is not installed.
+
+        :raises ValueError:
+            If ``values`` are not ``datetime64`` values, or are in a unit
+            finer than nanoseconds.
+        """
+        return self._kind_array(values) == _arrays.AMBIGUOUS
+
+    def imaginary_mask(self, values):
+        """Finds the imaginary wall times in an array.
+
+        This is a shim-specific, vectorized version of :meth:`classify` for
+        NumPy arrays of ``datetime64`` values, resolved as described for
+        :meth:`localize_array`.
+
+        :param values:
+            An array of ``datetime64`` values.
+
+        :return:
+            A boolean array that is ``True`` where the wall time does not
+            occur in this zone (and ``False`` for ``NaT``).
+
+        :raises NotImplementedError:
+            If NumPy is not installed.
+
+        :raises ValueError:
+            If ``values`` are not ``datetime64`` values, or are in a unit
+            finer than nanoseconds.
+        """
+        return self._kind_array(values) == _arrays.IMAGINARY
+
+    def _kind_array(self, values):
+        # Returns an array of the kind codes of an array of wall times
+        np = _arrays.np
+        if np is None:
+            raise NotImplementedError("Classifying arrays requires NumPy.")
+
+        _, _, seconds, nat = _arrays.to_seconds(values)
+        table = self._get_array_table()
+        if table is not None:
+            kind, _, _, covered = table.classify(seconds)
+            missing = zip(*np.nonzero(~covered & ~nat))
+        else:
+            kind = np.zeros(seconds.shape, dtype=np.int8)
+            missing = zip(*np.nonzero(~nat))
+
+        for index in missing:
+            classification = self.classify(
+                _transitions.from_timestamp(int(seconds[index]))
+            )
+            kind[index] = _arrays.KIND_CODES[classification.kind]
+
+        kind[nat] = _arrays.NORMAL
+
+        return kind
+
+    def try_localize(self, dt, policy="none"):
+        """Localizes a naive datetime without raising for gaps and folds.
+
+        This is a shim-specific alternative to ``localize`` that reports
+        ambiguous and imaginary times with a status rather than an exception,
+        and resolves them according to ``policy``:
+
+        - ``"none"``: no datetime is returned.
+        - ``"earliest"`` and ``"latest"``: the interpretation of the wall time
+          (``fold=0`` or ``fold=1``) that refers to the earliest or latest
+          instant, respectively.
+        - ``"shift_forward"`` and ``"shift_backward"``: imaginary times are
+          moved to the closest time that exists after or before the gap,
+          respectively; ambiguous times are resolved as by ``"latest"`` and
+          ``"earliest"``, respectively.
+
+        :param dt:
+            A naive :class:`datetime.datetime`.
+
+        :param policy:
+            One of the policies listed above.
+
+        :return:
+            A ``LocalizeResult`` named tuple of ``dt``, the localized datetime
+            (or ``None``), and ``status``, which is ``"normal"``,
+            ``"ambiguous"`` or ``"imaginary"`` as reported by
+            :meth:`classify`.
+
+        :raises ValueError:
+            If ``dt`` is not naive or ``policy`` is not a known policy.
+        """
+        if policy not in _LOCALIZE_POLICIES:
+            raise ValueError("Unknown localize policy: %r" % (policy,))
+
+        if dt.tzinfo is not None:
+            raise ValueError("Not naive datetime (tzinfo is already set)")
+
+        classification = self.classify(dt)
+        kind = classification.kind
+        if kind == _transitions.NORMAL:
+            return LocalizeResult(dt.replace(tzinfo=self), kind)
+
+        if policy == "none":
+            return LocalizeResult(None, kind)
+
+        forward = policy in ("latest", "shift_forward")
+        if kind == _transitions.IMAGINARY and policy.startswith("shift_"):
+            start, end = self._find_gap(dt, classification)
+            dt_out = end if forward else start - _ONE_MICROSECOND
+            return LocalizeResult(dt_out.replace(tzinfo=self), kind)
+
+        # The side of the fold with the larger offset is the earlier instant
+        earlier_fold = int(
+            classification.utcoffset_1 > classification.utcoffset_0
+        )
+        fold = earlier_fold if not forward else 1 - earlier_fold
+        return LocalizeResult(
+            _compat.enfold(dt.replace(tzinfo=self), fold=fold), kind
+        )
+
+    def _find_gap(self, dt, classification):
+        # Returns the naive local start and end of the gap containing dt
+        timestamp = _transitions.to_timestamp(dt)
+        index = self._get_anomaly_index()
+        if index is not None and index.covers(timestamp):
+            anomaly = index.find(timestamp)
+            if anomaly is not None:
+                return anomaly.start, anomaly.end
+
+        # The transition is at or after the instant dt refers to with the
+        # offset after it, and before the one with the offset before it.
+        offset_before = classification.utcoffset_0
+        offset_after = classification.utcoffset_1
+        low = timestamp - int(offset_after.total_seconds())
+        high = timestamp - int(offset_before.total_seconds())
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _transitions.query_utc(self, middle)[0] == offset_after:
+                high = middle
             else:
-                dt_enfolded = _compat.enfold(dt_out, fold=1)
+                low = middle
 
-            # Now we want to decide whether the fold=0 or fold=1 represents
-            # what pytz would return for `is_dst=True`
-            enfolded_dst = bool(dt_enfolded.dst())
-            if bool(dt_out.dst()) == enfolded_dst:
-                # If this is not a transition between standard time and
-                # daylight saving time, pytz will consider the larger offset
-                # the DST offset.
-                enfolded_dst = dt_enfolded.utcoffset() > dt_out.utcoffset()
+        transition = _transitions.EPOCH + timedelta(seconds=high)
+        return transition + offset_before, transition + offset_after
 
-            # The default we've established is that dt_out is fold=0; swap it
-            # for the fold=1 datetime if is_dst == True and the enfolded side
-            # is DST or if is_dst == False and the enfolded side is *not* DST.
-            if is_dst == enfolded_dst:
-                dt_out = dt_enfolded
+    def classify(self, dt):
+        """Classifies the wall time of a datetime in this zone.
 
-        return dt_out
+        This is a shim-specific method that determines whether a wall time
+        occurs once (``"normal"``), twice (``"ambiguous"``, during a fold) or
+        not at all (``"imaginary"``, during a gap) in this zone, and finds
+        the offsets it would have with ``fold=0`` and with ``fold=1``, in a
+        single lookup. The ``tzinfo`` and ``fold`` of ``dt`` are ignored.
+
+        :param dt:
+            A :class:`datetime.datetime`.
+
+        :return:
+            A ``Classification`` named tuple of ``kind`` (one of the strings
+            above) and ``utcoffset_0``, ``utcoffset_1``, ``dst_0`` and
+            ``dst_1``, the results of :meth:`utcoffset` and :meth:`dst` for
+            the wall time with ``fold=0`` and ``fold=1``. These are the same
+            for both folds when the time is ``"normal"``.
+        """
+        table = self._get_transition_table()
+        if table is not None:
+            result = table.classify(_transitions.to_timestamp(dt))
+            if result is not None:
+                kind, interval_0, interval_1 = result
+                offset_0, dst_0, _ = table.ttinfo(interval_0)
+                if kind == _transitions.NORMAL:
+                    return Classification(
+                        kind, offset_0, offset_0, dst_0, dst_0
+                    )
+
+                offset_1, dst_1, _ = table.ttinfo(interval_1)
+                return Classification(kind, offset_0, offset_1, dst_0, dst_1)
+
+        dt_0 = _compat.enfold(dt.replace(tzinfo=self), fold=0)
+        if _compat.is_imaginary(dt_0):
+            kind = _transitions.IMAGINARY
+        elif _compat.is_ambiguous(dt_0):
+            kind = _transitions.AMBIGUOUS
+        else:
+            offset_0 = dt_0.utcoffset()
+            dst_0 = dt_0.dst()
+            return Classification(
+                _transitions.NORMAL, offset_0, offset_0, dst_0, dst_0
+            )
+
+        dt_1 = _compat.enfold(dt_0, fold=1)
+        return Classification(
+            kind, dt_0.utcoffset(), dt_1.utcoffset(), dt_0.dst(), dt_1.dst()
+        )
 
     def normalize(self, dt):
         warnings.warn(
@@ -280,17 +2139,315 @@ class _PytzShimTimezone(tzinfo):
 
         return dt.astimezone(self)
 
+    def normalize_many(self, dts):
+        """Normalizes an iterable of aware datetimes.
+
+        This is a shim-specific batch version of ``normalize``, which emits a
+        single :class:`PytzUsageWarning` when it is called rather than one
+        per datetime. The datetimes are converted lazily, as described for
+        :meth:`astimezone_many`, and the results are the same as those of
+        ``normalize``.
+
+        :param dts:
+            An iterable of aware :class:`datetime.datetime` objects.
+
+        :return:
+            An iterator of the normalized datetimes.
+
+        :raises ValueError:
+            When the iterator is consumed, if a datetime is naive.
+        """
+        warnings.warn(
+            "The normalize_many method is no longer necessary, as this "
+            + "time zone supports the fold attribute (PEP 495). "
+            + "For more details on migrating to a PEP 495-compliant "
+            + "implementation, see %s" % PYTZ_MIGRATION_GUIDE_URL,
+            PytzUsageWarning,
+            stacklevel=2,
+        )
+
+        return self._astimezone_many(dts, True)
+
+    def astimezone_many(self, dts):
+        """Converts an iterable of datetimes to this zone.
+
+        This is a shim-specific method returning an iterator of the results of
+        ``dt.astimezone(self)`` for each datetime, converted lazily as the
+        iterator is consumed. Consecutive datetimes that fall between the same
+        two transitions of the zone are converted without looking up the
+        zone's transitions again, and the offset of fixed-offset source zones
+        is only looked up once per run of datetimes in the same zone.
+
+        :param dts:
+            An iterable of :class:`datetime.datetime` objects.
+
+        :return:
+            An iterator of the converted datetimes.
+        """
+        return self._astimezone_many(dts, False)
+
+    def _astimezone_many(self, dts, normalize):
+        # The naive UTC datetimes, [low, high), which have the local offset
+        # and fold in this zone
+        low = high = _transitions.EPOCH
+        offset = fold = None
+
+        # For each source zone (by id, holding a reference to the zone so the
+        # id is not reused), its offset if it is constant, and the window
+        # above as wall times in the source zone, which can be converted to
+        # this zone with a single shift.
+        sources = {}
+        for dt in dts:
+            tz = dt.tzinfo
+            if tz is self:
+                yield dt
+                continue
+
+            if tz is None and normalize:
+                raise ValueError("Naive time - no tzinfo set")
+
+            state = sources.get(id(tz), None)
+            if state is None:
+                state = sources[id(tz)] = [tz, _get_constant_offset(tz), None]
+
+            source_window = state[2]
+            if source_window is not None and (
+                source_window[0] <= dt < source_window[1]
+            ):
+                # Aware datetimes with the same tzinfo compare as naive ones
+                dt_out = (dt + source_window[2]).replace(tzinfo=self)
+                fold_out = source_window[3]
+            else:
+                source_offset = utcoffset = state[1]
+                if utcoffset is None:
+                    utcoffset = dt.utcoffset()
+                    if utcoffset is None:
+                        # Naive times are converted from the system's local
+                        # time
+                        yield dt.astimezone(self)
+                        continue
+
+                utc = dt.replace(tzinfo=None) - utcoffset
+                if not low <= utc < high:
+                    window = self._get_utc_window(utc)
+                    if window is None:
+                        yield dt.astimezone(self)
+                        continue
+
+                    low, high, offset, fold = window
+
+                if source_offset is not None:
+                    state[2] = (
+                        _shift_clamped(low, source_offset).replace(tzinfo=tz),
+                        _shift_clamped(high, source_offset).replace(tzinfo=tz),
+                        offset - source_offset,
+                        fold,
+                    )
+
+                dt_out = (utc + offset).replace(tzinfo=self)
+                fold_out = fold
+
+            if fold_out:
+                dt_out = _compat.enfold(dt_out, fold=1)
+
+            yield dt_out
+
+    def _get_utc_window(self, utc):
+        # Returns the naive start and end of the run of UTC times containing
+        # utc that have the same offset and fold in this zone, along with
+        # them, or None if the zone's transitions are not known.
+        table = self._get_transition_table()
+        if table is None:
+            return None
+
+        window = table.utc_window(_transitions.to_timestamp(utc))
+        if window is None:
+            return None
+
+        low, high, interval, fold = window
+        return (
+            _transitions.from_timestamp(low),
+            _transitions.from_timestamp(high),
+            table.ttinfo(interval)[0],
+            fold,
+        )
+
     def __copy__(self):
         return self
 
     def __deepcopy__(self, memo=None):
         return self
 
+
+class _PytzShimTimezone(_BasePytzShimTimezone, tzinfo):
+    def __init__(self, zone, key):
+        self._key = key
+        self._zone = zone
+
+    def utcoffset(self, dt):
+        return self._zone.utcoffset(dt)
+
+    def dst(self, dt):
+        return self._zone.dst(dt)
+
+    def tzname(self, dt):
+        return self._zone.tzname(dt)
+
+    def fromutc(self, dt):
+        # The default fromutc implementation only works if tzinfo is "self"
+        dt_base = dt.replace(tzinfo=self._zone)
+        dt_out = self._zone.fromutc(dt_base)
+
+        return dt_out.replace(tzinfo=self)
+
+    def __str__(self):
+        if self._key is not None:
+            return str(self._key)
+        else:
+            return repr(self)
+
+    def __repr__(self):
+        return "%s(%s, %s)" % (
+            self.__class__.__name__,
+            repr(self._zone),
+            repr(self._key),
+        )
+
     def __reduce__(self):
+        if self._reduce_by_key:
+            return timezone, (self._key,)
+
         return wrap_zone, (self._zone, self._key)
 
 
+class _FixedOffsetShimTimezone(_PytzShimTimezone):
+    """Shim for zones whose offset never changes.
+
+    Since a fixed offset zone has no folds or gaps, all of the ``tzinfo``
+    methods can return values computed when the shim is created, and
+    ``localize`` never needs to check for ambiguous or imaginary times.
+    """
+
+    def __init__(self, zone, key):
+        super(_FixedOffsetShimTimezone, self).__init__(zone, key)
+
+        self._utcoffset = zone.utcoffset(None)
+        self._dst = zone.dst(None)
+        self._tzname = zone.tzname(None)
+
+    def utcoffset(self, dt):
+        return self._utcoffset
+
+    def dst(self, dt):
+        return self._dst
+
+    def tzname(self, dt):
+        return self._tzname
+
+    def fromutc(self, dt):
+        if dt.tzinfo is not self:
+            dt = dt.replace(tzinfo=self)
+
+        return dt + self._utcoffset
+
+    def _localize(self, dt, is_dst):
+        return dt.replace(tzinfo=self)
+
+    def _get_anomaly_index(self):
+        return _transitions.EMPTY_ANOMALY_INDEX
+
+    def _get_normal_window(self, timestamp):
+        return datetime.min, datetime.max
+
+    def _get_array_table(self):
+        table = self.__dict__.get("_array_table", None)
+        if table is None:
+            table = self.__dict__.setdefault(
+                "_array_table",
+                _arrays.build_fixed_array_table(
+                    (self._utcoffset, self._dst, self._tzname)
+                ),
+            )
+
+        return table
+
+    def _get_utc_window(self, utc):
+        return datetime.min, datetime.max, self._utcoffset, 0
+
+    def classify(self, dt):
+        return Classification(
+            _transitions.NORMAL,
+            self._utcoffset,
+            self._utcoffset,
+            self._dst,
+            self._dst,
+        )
+
+
+class _UTCShimTimezone(_FixedOffsetShimTimezone):
+    def fromutc(self, dt):
+        if dt.tzinfo is not self:
+            dt = dt.replace(tzinfo=self)
+
+        return dt
+
+
+if _compat.ZoneInfo is not None:
+
+    class _ZoneInfoShimTimezone(_BasePytzShimTimezone, _compat.ZoneInfo):
+        """A shim that is itself a :class:`zoneinfo.ZoneInfo`.
+
+        The ``tzinfo`` protocol methods are inherited directly from
+        ``ZoneInfo``, so no Python-level forwarding happens when these zones
+        are used in datetime arithmetic, comparisons or ``astimezone``.
+        """
+
+        @property
+        def _key(self):
+            return self.key
+
+        @property
+        def _zone(self):
+            # The plain ZoneInfo object is only needed when someone asks to
+            # unwrap the shim, so it is constructed lazily.
+            zone = self.__dict__.get("_unwrapped", None)
+            if zone is None:
+                zone = self.__dict__.setdefault(
+                    "_unwrapped", _compat.get_timezone(self.key)
+                )
+
+            return zone
+
+        @classmethod
+        def _from_shim_file(cls, fp, key=None):
+            return cls._from_shim_data(fp.read(), key=key)
+
+        @classmethod
+        def _from_shim_data(cls, data, key=None):
+            # The underlying zone cannot be recovered from the key when the
+            # zone was built from a file, so build both from the same data.
+            instance = _compat.get_timezone_file(
+                BufferReader(data), key=key, zone_class=cls
+            )
+            instance.__dict__["_unwrapped"] = _compat.get_timezone_file(
+                BufferReader(data), key=key
+            )
+
+            return instance
+
+        def __reduce__(self):
+            if self._reduce_by_key:
+                return timezone, (self._key,)
+
+            return super(_ZoneInfoShimTimezone, self).__reduce__()
+
+else:  # pragma: nocover
+    _ZoneInfoShimTimezone = None
+
+
 UTC = wrap_zone(_compat.UTC, "UTC")
 PYTZ_MIGRATION_GUIDE_URL = (
     "https://pytz-deprecation-shim.readthedocs.io/en/latest/migration.html"
 )
+
+_preload_from_environment()
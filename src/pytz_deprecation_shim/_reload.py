@@ -0,0 +1,165 @@
+"""Change detection for the time zone data backing cached zones."""
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+
+from . import _sources
+
+SourceRecord = namedtuple("SourceRecord", ["path", "signature", "digest"])
+
+try:
+    _monotonic = time.monotonic
+except AttributeError:  # pragma: nocover
+    # Python 2
+    _monotonic = time.time
+
+
+def stat_signature(path):
+    try:
+        st = os.stat(path)
+    except (IOError, OSError):
+        return None
+
+    mtime = getattr(st, "st_mtime_ns", st.st_mtime)
+    return (st.st_ino, st.st_size, mtime)
+
+
+def _file_digest(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def get_source_record(key, path=None, data=None):
+    """Records the identity and contents of the file backing ``key``.
+
+    :param data:
+        The contents of the file at ``path``, if they have already been read.
+
+    :return:
+        A :class:`SourceRecord`, or ``None`` if the key is not backed by a
+        file on the search path.
+    """
+    if path is None:
+        path = _sources.find_zone_file(key)
+        if path is None:
+            return None
+
+    signature = stat_signature(path)
+    if data is None:
+        digest = _file_digest(path)
+    else:
+        digest = hashlib.sha256(data).hexdigest()
+
+    if signature is None or digest is None:
+        return None
+
+    return SourceRecord(path, signature, digest)
+
+
+class Reloader(object):
+    """Tracks the sources of cached zones and detects when they change.
+
+    Checking is rate-limited: :meth:`due` only returns ``True`` once every
+    ``interval`` seconds, and only one thread at a time may perform a check.
+    Between checks, the cost of consulting the reloader is a couple of
+    attribute lookups.
+    """
+
+    def __init__(self):
+        self.interval = None
+        self._last_check = _monotonic()
+        self._records = {}
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.interval is not None
+
+    def due(self):
+        return _monotonic() - self._last_check >= self.interval
+
+    def record(self, key):
+        record = get_source_record(key)
+
+        with self._lock:
+            if record is None:
+                self._records.pop(key, None)
+            else:
+                self._records[key] = record
+
+    def forget(self, keys=None):
+        with self._lock:
+            if keys is None:
+                self._records.clear()
+            else:
+                for key in keys:
+                    self._records.pop(key, None)
+
+    def tracked_keys(self):
+        with self._lock:
+            return list(self._records)
+
+    def find_changes(self, blocking=True):
+        """Finds the tracked keys whose data has changed.
+
+        The ``stat`` signature of each source file is compared with the
+        recorded one first; the file is only read and hashed if that differs,
+        or if the key now resolves to a different file.
+
+        :param blocking:
+            If false and another thread is already checking, returns ``None``
+            immediately.
+
+        :return:
+            A dictionary mapping each changed key to its new
+            :class:`SourceRecord` (``None`` if the key's data has disappeared),
+            or ``None`` if the check was skipped.
+        """
+        if not self._check_lock.acquire(blocking):
+            return None
+
+        try:
+            self._last_check = _monotonic()
+
+            with self._lock:
+                records = list(self._records.items())
+
+            changes = {}
+            for key, record in records:
+                path = _sources.find_zone_file(key)
+                if path is None:
+                    changes[key] = None
+                    continue
+
+                if (
+                    path == record.path
+                    and stat_signature(path) == record.signature
+                ):
+                    continue
+
+                new_record = get_source_record(key, path=path)
+                if new_record is None or new_record.digest != record.digest:
+                    changes[key] = new_record
+                elif new_record != record:
+                    # Only the metadata changed, e.g. the file was touched or
+                    # rewritten with identical contents.
+                    with self._lock:
+                        if key in self._records:
+                            self._records[key] = new_record
+
+            return changes
+        finally:
+            self._check_lock.release()
+
+    def update(self, key, record):
+        with self._lock:
+            if record is None:
+                self._records.pop(key, None)
+            else:
+                self._records[key] = record
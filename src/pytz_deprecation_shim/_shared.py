@@ -0,0 +1,63 @@
+"""Helpers for sharing bundles of zone data between processes."""
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: nocover
+    # multiprocessing.shared_memory was added in Python 3.8
+    resource_tracker = shared_memory = None
+
+
+def create_segment(data, name=None):
+    """Creates a shared memory segment holding a copy of ``data``."""
+    segment = shared_memory.SharedMemory(
+        name=name, create=True, size=max(len(data), 1)
+    )
+    segment.buf[: len(data)] = data
+
+    return segment
+
+
+def destroy_segment(segment):
+    """Unlinks and closes a segment created by :func:`create_segment`."""
+    # Processes that attach to the segment before Python 3.13 remove it from
+    # the resource tracker (see attach_segment), which is shared with child
+    # processes. Registering it again keeps unlink() from unregistering a name
+    # the tracker no longer knows about, which it reports on stderr.
+    resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
+
+    try:
+        segment.close()
+    except BufferError:  # pragma: nocover
+        # This process is using the segment itself
+        pass
+
+
+def attach_segment(name):
+    """Maps an existing shared memory segment into this process.
+
+    :return:
+        An :class:`mmap.mmap` of the segment, which is independent of the
+        :class:`~multiprocessing.shared_memory.SharedMemory` object used to
+        open it.
+    """
+    try:
+        segment = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching to a segment registers it with the
+        # resource tracker, which then unlinks it when this process exits,
+        # even though another process created it (bpo-39959).
+        segment = shared_memory.SharedMemory(name=name)
+        try:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:  # pragma: nocover
+            pass
+
+    # SharedMemory.close() (which is also called when the object is garbage
+    # collected) fails if any views of the mapping are still alive, which is
+    # hard to avoid at interpreter shutdown. Taking over the mapping itself
+    # leaves its lifetime to the views that use it.
+    mapping = segment._mmap
+    segment._mmap = None
+    segment.close()
+
+    return mapping
@@ -0,0 +1,124 @@
+"""Snapshots of the TZif data behind the zones in the ``timezone`` cache.
+
+A snapshot is a bundle (see :mod:`._bundle`) whose metadata records where the
+data came from: the time zone search path, the version of the data in each
+source, and the path, ``stat`` signature and SHA-256 digest of each zone's
+file. A snapshot is only used if all of these still match, so that it never
+serves data that differs from what the provider would load.
+"""
+import hashlib
+from collections import namedtuple
+
+from . import _bundle, _reload, _sources
+
+SNAPSHOT_KIND = "snapshot"
+
+
+class Snapshot(namedtuple("Snapshot", ["bundle", "keys"])):
+    """A bundle, and the keys in it that are still up to date."""
+
+    __slots__ = ()
+
+    def get(self, key):
+        if key not in self.keys:
+            return None
+
+        return self.bundle.get(key)
+
+
+def write_snapshot(path, keys):
+    """Writes a snapshot of the data for ``keys`` to ``path``.
+
+    :return:
+        The list of keys included; keys whose data cannot be found are left
+        out.
+    """
+    zones = []
+    sources = {}
+    for key in keys:
+        found = _sources.read_zone_data(key)
+        if found is None:
+            continue
+
+        data, source_path = found
+        if source_path is None:
+            # Sources that are not directories are identified by their
+            # version alone.
+            sources[key] = None
+        else:
+            record = _reload.get_source_record(
+                key, path=source_path, data=data
+            )
+            if record is None:
+                continue
+
+            sources[key] = [
+                record.path,
+                list(record.signature),
+                record.digest,
+            ]
+
+        zones.append((key, data))
+
+    metadata = {
+        "kind": SNAPSHOT_KIND,
+        "search_path": _sources.get_search_path(),
+        "data_identity": _sources.get_data_identity(),
+        "sources": sources,
+    }
+    _bundle.write_bundle_file(path, zones, metadata=metadata)
+
+    return [key for key, _ in zones]
+
+
+def open_snapshot(path):
+    """Opens a snapshot, checking that it is still up to date.
+
+    The snapshot as a whole is rejected if it cannot be read, or if the search
+    path or the version of any data source has changed. Otherwise, each zone
+    whose source file has changed since the snapshot was written is left out.
+
+    :return:
+        A :class:`Snapshot`, or ``None`` if the snapshot cannot be used.
+    """
+    try:
+        bundle = _bundle.Bundle.open(path)
+    except (IOError, OSError, _bundle.InvalidBundleError):
+        return None
+
+    metadata = bundle.metadata
+    if (
+        metadata.get("kind", None) != SNAPSHOT_KIND
+        or metadata.get("search_path", None) != _sources.get_search_path()
+        or metadata.get("data_identity", None) != _sources.get_data_identity()
+    ):
+        bundle.close()
+        return None
+
+    sources = metadata.get("sources", {})
+    keys = frozenset(
+        key
+        for key in bundle.keys()
+        if key in sources and _is_current(sources[key])
+    )
+
+    return Snapshot(bundle, keys)
+
+
+def _is_current(source):
+    if source is None:
+        return True
+
+    path, signature, digest = source
+    if list(_reload.stat_signature(path) or ()) == signature:
+        return True
+
+    # The file has been touched or replaced; it is still usable if the
+    # contents are unchanged.
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except (IOError, OSError):
+        return False
+
+    return hashlib.sha256(data).hexdigest() == digest
@@ -0,0 +1,312 @@
+"""Functions for locating the TZif data backing IANA time zone keys.
+
+These mirror the search order used by the time zone providers: each directory
+on the provider's time zone search path, followed by the ``tzdata`` package
+(when it is installed as a regular directory).
+"""
+import os
+import threading
+
+from . import _compat
+
+TZIF_MAGIC = b"TZif"
+
+_TEST_PATH = os.path.normpath(os.path.join("_", "_"))[:-1]
+
+# These are excluded for the same reasons that zoneinfo.available_timezones
+# excludes them: "posix" and "right" are alternate copies of the whole
+# database, and "posixrules" is an implementation detail of the compiler.
+_EXCLUDED_DIRS = frozenset(("posix", "right"))
+_EXCLUDED_KEYS = frozenset(("posixrules",))
+
+_KEY_INDEX = None
+_KEY_INDEX_LOCK = threading.Lock()
+
+_LINK_INDEXES = {}
+
+
+def is_valid_key_syntax(key):
+    """Checks that a key could refer to a file inside a search path directory.
+
+    This applies the same rules as :mod:`zoneinfo`: keys must be non-empty,
+    normalized, relative paths that do not escape the search path.
+    """
+    if not key or not isinstance(key, _compat.string_types) or "\0" in key:
+        return False
+
+    if os.path.isabs(key):
+        return False
+
+    normalized = os.path.normpath(key)
+    if len(normalized) != len(key):
+        return False
+
+    resolved = os.path.normpath(os.path.join(_TEST_PATH, normalized))
+    return resolved.startswith(_TEST_PATH)
+
+
+def get_search_path():
+    """Returns the directories searched for TZif files, in order."""
+    search_path = list(_compat.get_tzpath())
+
+    tzdata_path = _compat.get_tzdata_path()
+    if tzdata_path is not None:
+        search_path.append(tzdata_path)
+
+    return search_path
+
+
+def find_zone_file(key):
+    """Returns the path of the TZif file for a key, or ``None``.
+
+    Only files that start with the TZif magic bytes are considered, so
+    non-zone files that live alongside the zones (e.g. ``zone.tab``) are not
+    found.
+    """
+    if not is_valid_key_syntax(key):
+        return None
+
+    for directory in get_search_path():
+        path = os.path.join(directory, key)
+        if os.path.isfile(path) and _has_tzif_magic(path):
+            return path
+
+    return None
+
+
+def zone_file_exists(key):
+    """Determines whether the data for ``key`` is available.
+
+    :return:
+        ``True`` or ``False`` if this can be determined from the search path
+        alone, or ``None`` if the provider may find the key somewhere that is
+        not searched here (e.g. a zipped ``tzdata`` package).
+    """
+    if not is_valid_key_syntax(key):
+        return False
+
+    if find_zone_file(key) is not None:
+        return True
+
+    if _compat.has_opaque_sources():
+        return None
+
+    return False
+
+
+def read_zone_data(key):
+    """Reads the TZif data the provider would load for ``key``.
+
+    :return:
+        A tuple of the data and the path of the file it was read from (or
+        ``None`` if it was read from a source that is not a directory), or
+        ``None`` if the data cannot be found.
+    """
+    path = find_zone_file(key)
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                return f.read(), path
+        except (IOError, OSError):
+            return None
+
+    if not is_valid_key_syntax(key):
+        return None
+
+    data = _compat.read_opaque_zone(key)
+    if data is None or not data.startswith(TZIF_MAGIC):
+        return None
+
+    return data, None
+
+
+def get_data_identity():
+    """Describes where the time zone data comes from and which version it is.
+
+    :return:
+        A list of ``[directory, version]`` pairs for each directory on the
+        search path, in order, followed by ``["tzdata", version]`` for the
+        ``tzdata`` package (if it is installed). The version is read from the
+        ``tzdata.zi`` file in each directory, and is ``None`` if there is no
+        such file.
+    """
+    identity = []
+    for directory in _compat.get_tzpath():
+        identity.append([directory, _read_zi_version(directory)])
+
+    tzdata_version = _compat.get_tzdata_version()
+    if tzdata_version is not None:
+        identity.append(["tzdata", tzdata_version])
+
+    return identity
+
+
+def _read_zi_version(directory):
+    try:
+        with open(os.path.join(directory, "tzdata.zi"), "rb") as f:
+            line = f.readline().decode("ascii", "replace").strip()
+    except (IOError, OSError):
+        return None
+
+    if line.startswith("# version "):
+        return line[len("# version ") :]
+
+    return None
+
+
+def available_keys():
+    """Returns the set of all keys available on the search path.
+
+    This walks every directory on the search path looking for TZif files, and
+    includes keys from sources that cannot be walked (e.g. a zipped ``tzdata``
+    package) as reported by the provider.
+    """
+    keys = set()
+    for directory in get_search_path():
+        keys.update(key for key, _ in find_zone_files(directory, exclude=keys))
+
+    keys.update(_compat.get_opaque_keys())
+
+    return keys
+
+
+def find_zone_files(directory, exclude=()):
+    """Yields the key and path of each TZif file under ``directory``.
+
+    Files that :func:`available_keys` leaves out are skipped, as are keys in
+    ``exclude`` (without checking the file, which is what makes this cheaper
+    than filtering the results).
+    """
+    for root, dirs, files in os.walk(directory):
+        if root == directory:
+            dirs[:] = [d for d in dirs if d not in _EXCLUDED_DIRS]
+
+        for name in files:
+            path = os.path.join(root, name)
+            key = os.path.relpath(path, directory).replace(os.sep, "/")
+            if key in exclude or key in _EXCLUDED_KEYS:
+                continue
+
+            if _has_tzif_magic(path):
+                yield key, path
+
+
+def is_included_key(key):
+    """Whether :func:`available_keys` would include a key if it existed.
+
+    This does not check that the key refers to a TZif file.
+    """
+    if key in _EXCLUDED_KEYS:
+        return False
+
+    return key.split("/", 1)[0] not in _EXCLUDED_DIRS or "/" not in key
+
+
+def get_canonical_key(key):
+    """Finds the canonical spelling of a key, ignoring case.
+
+    The index mapping lowercased keys to their canonical spelling is built
+    from :func:`available_keys` the first time this is called, so lookups
+    after that never touch the file system.
+
+    :return:
+        The canonical key, or ``None`` if no available key matches.
+    """
+    global _KEY_INDEX
+
+    index = _KEY_INDEX
+    if index is None:
+        with _KEY_INDEX_LOCK:
+            index = _KEY_INDEX
+            if index is None:
+                index = {}
+                # Sort so that the choice between keys differing only in case
+                # (which the IANA database does not have) is deterministic.
+                for available_key in sorted(available_keys()):
+                    index.setdefault(available_key.lower(), available_key)
+
+                _KEY_INDEX = index
+
+    return index.get(key.lower(), None)
+
+
+def get_link_target(key):
+    """Finds the zone that a key is a link (alias) to.
+
+    Links are read from the ``tzdata.zi`` file in the directory that provides
+    ``key``, which lists them as ``L TARGET LINK`` lines. The links in each
+    directory are read the first time they are needed.
+
+    :return:
+        The key of the target zone, or ``None`` if ``key`` is not known to be
+        a link (including when its directory has no ``tzdata.zi`` file).
+    """
+    if not is_valid_key_syntax(key):
+        return None
+
+    for directory in get_search_path():
+        path = os.path.join(directory, key)
+        if os.path.isfile(path) and _has_tzif_magic(path):
+            break
+    else:
+        return None
+
+    links = _LINK_INDEXES.get(directory, None)
+    if links is None:
+        with _KEY_INDEX_LOCK:
+            links = _LINK_INDEXES.get(directory, None)
+            if links is None:
+                links = _LINK_INDEXES[directory] = _read_links(directory)
+
+    target = links.get(key, None)
+    if target is None or target == key:
+        return None
+
+    # Only trust the link if the target is served by the same directory
+    target_path = os.path.join(directory, target)
+    if find_zone_file(target) != target_path:
+        return None
+
+    return target
+
+
+def _read_links(directory):
+    links = {}
+    try:
+        with open(os.path.join(directory, "tzdata.zi"), "rb") as f:
+            for line in f:
+                if not line.startswith(b"L "):
+                    continue
+
+                fields = line.decode("utf-8", "replace").split()
+                if len(fields) == 3:
+                    links[fields[2]] = fields[1]
+    except (IOError, OSError):
+        return links
+
+    # Resolve chains of links, which the data does not currently contain
+    for link, target in list(links.items()):
+        seen = set((link,))
+        while target in links and target not in seen:
+            seen.add(target)
+            target = links[target]
+
+        links[link] = target
+
+    return links
+
+
+def reset_key_index():
+    global _KEY_INDEX
+
+    with _KEY_INDEX_LOCK:
+        _KEY_INDEX = None
+        _LINK_INDEXES.clear()
+
+
+def _has_tzif_magic(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(TZIF_MAGIC)) == TZIF_MAGIC
+    except (IOError, OSError):
+        return False
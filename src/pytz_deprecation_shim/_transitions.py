@@ -0,0 +1,620 @@
+"""Precomputed tables of the transitions of a time zone.
+
+A :class:`TransitionTable` holds the instants at which a zone's offset, DST
+offset or abbreviation changes, as sorted arrays of seconds since the epoch
+(both in UTC and in local time), so that the offset in effect at any time in
+the range the table covers can be found with a single bisection.
+
+The transition instants are read from the zone's TZif data (extended past the
+last explicit transition using the POSIX TZ string in the footer), but the
+values in the table are always obtained by querying the zone itself, and the
+table is checked against the zone on both sides of every transition when it is
+built. If anything disagrees, :func:`build_table` returns ``None`` and callers
+fall back to asking the zone.
+"""
+import bisect
+import calendar
+import re
+import struct
+from array import array
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from . import _compat
+
+try:
+    array("q")
+except ValueError:  # pragma: nocover
+    # Python 2's array does not support 64-bit integers; doubles represent
+    # every second in the range of datetime exactly.
+    _TIMESTAMP_TYPECODE = "d"
+else:
+    _TIMESTAMP_TYPECODE = "q"
+
+EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = EPOCH.toordinal()
+
+# Transitions outside of this range are not included in the tables, and the
+# tables do not answer for times at or after the end of it. The end matches
+# the range covered by pytz's own tables.
+_MIN_TIMESTAMP = -62135510400  # 0001-01-02T00:00:00
+_MAX_TIMESTAMP = 2145916800  # 2038-01-01T00:00:00
+
+# No UTC offset is larger than a day, so local times this far before the end
+# of the range can only be affected by transitions in the table.
+_LOCAL_MARGIN = 2 * 86400
+
+# The first UTC and local timestamps that the tables do not answer for
+UTC_LIMIT = _MAX_TIMESTAMP
+LOCAL_LIMIT = _MAX_TIMESTAMP - _LOCAL_MARGIN
+
+_HEADER = struct.Struct(">4sc15x6l")
+
+# The kinds of local time reported by TransitionTable.classify
+NORMAL = "normal"
+AMBIGUOUS = "ambiguous"
+IMAGINARY = "imaginary"
+
+Anomaly = namedtuple(
+    "Anomaly", ["kind", "start", "end", "utcoffset_before", "utcoffset_after"]
+)
+
+
+def to_timestamp(dt):
+    """Returns the seconds since the epoch of ``dt``'s wall time.
+
+    Any ``tzinfo`` is ignored, and microseconds are truncated, which does not
+    affect comparisons with transition instants (always whole seconds).
+    """
+    return (
+        (dt.toordinal() - _EPOCH_ORDINAL) * 86400
+        + dt.hour * 3600
+        + dt.minute * 60
+        + dt.second
+    )
+
+
+def from_timestamp(timestamp):
+    """Returns the naive datetime of a local timestamp.
+
+    A timestamp of ``-inf`` gives :data:`datetime.min`.
+    """
+    if timestamp == float("-inf"):
+        return datetime.min
+
+    return EPOCH + timedelta(seconds=timestamp)
+
+
+class TransitionTable(object):
+    """The transitions of a zone within a fixed range of time.
+
+    Interval ``i`` is the time between transition ``i - 1`` and transition
+    ``i`` (interval ``0`` is everything before the first transition), and
+    ``ttinfos[index[i]]`` is the ``(utcoffset, dst, tzname)`` of the zone
+    during that interval.
+
+    Transition ``i`` is found in local time by bisecting ``local[fold]``:
+    ``local[0][i]`` is the instant of the transition in the larger of the
+    offsets on either side of it, and ``local[1][i]`` the instant in the
+    smaller one. This gives the :pep:`495` semantics used by :mod:`zoneinfo`:
+    times in a gap or fold resolve to the offset before the transition when
+    ``fold=0``, and to the offset after it when ``fold=1``.
+    """
+
+    __slots__ = ("utc", "local", "index", "ttinfos", "offsets")
+
+    def __init__(self, utc, local, index, ttinfos, offsets):
+        self.utc = utc
+        self.local = local
+        self.index = index
+        self.ttinfos = ttinfos
+        self.offsets = offsets
+
+    def find_utc(self, timestamp):
+        """Finds the interval containing a UTC timestamp.
+
+        :return:
+            The index of the interval, or ``None`` if the timestamp is outside
+            of the range covered by the table.
+        """
+        if timestamp >= _MAX_TIMESTAMP:
+            return None
+
+        return bisect.bisect_right(self.utc, timestamp)
+
+    def fold_from_utc(self, timestamp, interval):
+        """Returns the ``fold`` of the local time for a UTC timestamp.
+
+        This is ``1`` if the timestamp falls in the first part of an interval
+        that starts with a fold, during which the same local times were
+        already seen before the transition.
+        """
+        if not interval:
+            return 0
+
+        offsets = self.offsets
+        index = self.index
+        shift = offsets[index[interval - 1]] - offsets[index[interval]]
+        if shift > 0 and timestamp < self.utc[interval - 1] + shift:
+            return 1
+
+        return 0
+
+    def utc_window(self, timestamp):
+        """Finds the run of UTC times around a UTC timestamp in which the
+        local time has the same offset and ``fold``.
+
+        :return:
+            A tuple of the first UTC timestamp of the run (or ``-inf``), the
+            one after its end, the interval and the ``fold``; or ``None`` if
+            the timestamp is outside of the range covered by the table.
+        """
+        interval = self.find_utc(timestamp)
+        if interval is None:
+            return None
+
+        utc = self.utc
+        low = utc[interval - 1] if interval else float("-inf")
+        high = utc[interval] if interval < len(utc) else _MAX_TIMESTAMP
+        if interval:
+            offsets = self.offsets
+            index = self.index
+            shift = offsets[index[interval - 1]] - offsets[index[interval]]
+            if shift > 0:
+                # The first part of the interval repeats local times
+                boundary = min(low + shift, high)
+                if timestamp < boundary:
+                    return low, boundary, interval, 1
+
+                low = boundary
+
+        return low, high, interval, 0
+
+    def find_local(self, timestamp):
+        """Finds the intervals that contain a local timestamp.
+
+        :return:
+            A tuple of the intervals that the local time falls in with
+            ``fold=0`` and with ``fold=1``, which differ only when the time is
+            ambiguous or imaginary; or ``None`` if the timestamp is outside of
+            the range covered by the table.
+        """
+        if timestamp >= _MAX_TIMESTAMP - _LOCAL_MARGIN:
+            return None
+
+        return (
+            bisect.bisect_right(self.local[0], timestamp),
+            bisect.bisect_right(self.local[1], timestamp),
+        )
+
+    def classify(self, timestamp):
+        """Classifies a local timestamp as normal, ambiguous or imaginary.
+
+        :return:
+            A tuple of the kind of the local time (:data:`NORMAL`,
+            :data:`AMBIGUOUS` or :data:`IMAGINARY`) and the intervals it falls
+            in with ``fold=0`` and with ``fold=1``, or ``None`` if the
+            timestamp is outside of the range covered by the table.
+        """
+        intervals = self.find_local(timestamp)
+        if intervals is None:
+            return None
+
+        interval_0, interval_1 = intervals
+        if interval_0 == interval_1:
+            return NORMAL, interval_0, interval_1
+
+        if self.is_gap(interval_0):
+            return IMAGINARY, interval_0, interval_1
+
+        return AMBIGUOUS, interval_0, interval_1
+
+    def normal_window(self, timestamp):
+        """Finds the run of normal local times containing a local timestamp.
+
+        :return:
+            A tuple of the first local timestamp of the run (or ``-inf``) and
+            the one after its end, during which every local time
+            falls in the same interval; or ``None`` if the timestamp is
+            ambiguous, imaginary or outside of the range covered by the table.
+        """
+        intervals = self.find_local(timestamp)
+        if intervals is None:
+            return None
+
+        interval, interval_1 = intervals
+        if interval != interval_1:
+            return None
+
+        limit = _MAX_TIMESTAMP - _LOCAL_MARGIN
+        low = self.local[0][interval - 1] if interval else float("-inf")
+        if interval < len(self.utc):
+            high = min(self.local[1][interval], limit)
+        else:
+            high = limit
+
+        return low, high
+
+    def ttinfo(self, interval):
+        return self.ttinfos[self.index[interval]]
+
+    def is_gap(self, interval):
+        """Whether the transition ending ``interval`` increases the offset."""
+        offsets = self.offsets
+        index = self.index
+        return offsets[index[interval + 1]] > offsets[index[interval]]
+
+
+class AnomalyIndex(object):
+    """The gaps and folds of a zone, as windows of local time.
+
+    Window ``i`` covers the local timestamps from ``starts[i]`` (inclusive) to
+    ``ends[i]`` (exclusive), and ``anomalies[i]`` is the :class:`Anomaly`
+    describing it. The windows are sorted and never overlap, so both point
+    and range queries are bisections.
+    """
+
+    __slots__ = ("starts", "ends", "anomalies", "limit")
+
+    def __init__(self, starts, ends, anomalies, limit):
+        self.starts = starts
+        self.ends = ends
+        self.anomalies = anomalies
+        self.limit = limit
+
+    def covers(self, timestamp):
+        """Whether the index knows about the local timestamp."""
+        return self.limit is None or timestamp < self.limit
+
+    def find(self, timestamp):
+        """Returns the :class:`Anomaly` containing a local timestamp, or
+        ``None`` if the timestamp is not in a gap or a fold."""
+        i = bisect.bisect_right(self.starts, timestamp) - 1
+        if i >= 0 and timestamp < self.ends[i]:
+            return self.anomalies[i]
+
+        return None
+
+    def overlapping(self, start, end):
+        """Returns the anomalies overlapping local timestamps from ``start``
+        (inclusive) to ``end`` (exclusive), in order."""
+        first = bisect.bisect_right(self.ends, start)
+        last = bisect.bisect_left(self.starts, end)
+
+        return list(self.anomalies[first:last])
+
+
+EMPTY_ANOMALY_INDEX = AnomalyIndex(
+    array(_TIMESTAMP_TYPECODE), array(_TIMESTAMP_TYPECODE), (), None
+)
+
+
+def build_anomaly_index(table):
+    """Builds the :class:`AnomalyIndex` of the zone a table describes."""
+    local_0, local_1 = table.local
+    starts = array(_TIMESTAMP_TYPECODE)
+    ends = array(_TIMESTAMP_TYPECODE)
+    anomalies = []
+    for i in range(len(table.utc)):
+        start = local_1[i]
+        end = local_0[i]
+        if start == end:
+            continue
+
+        starts.append(start)
+        ends.append(end)
+        anomalies.append(
+            Anomaly(
+                IMAGINARY if table.is_gap(i) else AMBIGUOUS,
+                EPOCH + timedelta(seconds=start),
+                EPOCH + timedelta(seconds=end),
+                table.ttinfo(i)[0],
+                table.ttinfo(i + 1)[0],
+            )
+        )
+
+    return AnomalyIndex(
+        starts, ends, tuple(anomalies), _MAX_TIMESTAMP - _LOCAL_MARGIN
+    )
+
+
+def build_table(zone, data):
+    """Builds the transition table for a zone from its TZif data.
+
+    :param zone:
+        The ``tzinfo`` that the table must agree with.
+
+    :param data:
+        The TZif data the zone was built from.
+
+    :return:
+        A :class:`TransitionTable`, or ``None`` if the data cannot be parsed
+        or does not describe ``zone``.
+    """
+    try:
+        transitions, footer = _read_tzif(data)
+    except (ValueError, struct.error):
+        return None
+
+    # The footer only applies after the last explicit transition
+    last = transitions[-1][0] if transitions else _MIN_TIMESTAMP
+    transitions = [
+        (t, changes)
+        for t, changes in transitions
+        if _MIN_TIMESTAMP < t < _MAX_TIMESTAMP
+    ]
+
+    if footer and last < _MAX_TIMESTAMP:
+        generated = _footer_transitions(
+            footer, max(last, _MIN_TIMESTAMP), _MAX_TIMESTAMP
+        )
+        if generated is None:
+            return None
+
+        transitions.extend(generated)
+
+    starts = [_MIN_TIMESTAMP] + [t for t, _ in transitions]
+    ttinfos = []
+    ttinfo_indexes = {}
+    index = array("H")
+    offsets = []
+    for start in starts:
+        ttinfo = query_utc(zone, start)
+        position = ttinfo_indexes.get(ttinfo, None)
+        if position is None:
+            position = ttinfo_indexes[ttinfo] = len(ttinfos)
+            ttinfos.append(ttinfo)
+            offsets.append(_seconds(ttinfo[0]))
+
+        index.append(position)
+
+    if len(ttinfos) > 0xFFFF:  # pragma: nocover
+        return None
+
+    utc = array(_TIMESTAMP_TYPECODE, starts[1:])
+    local = (array(_TIMESTAMP_TYPECODE), array(_TIMESTAMP_TYPECODE))
+    for i, (t, changes) in enumerate(transitions):
+        before = offsets[index[i]]
+        after = offsets[index[i + 1]]
+        if changes != (before != after):
+            return None
+
+        local[0].append(t + max(before, after))
+        local[1].append(t + min(before, after))
+
+    table = TransitionTable(utc, local, index, tuple(ttinfos), offsets)
+    if not _verify(table, zone):
+        return None
+
+    return table
+
+
+def _verify(table, zone):
+    # The values at the start of each interval came from the zone, so check
+    # that each interval lasts until the next transition, and that the zone
+    # resolves local times around each transition the way the table does.
+    utc = table.utc
+    local_0, local_1 = table.local
+    count = len(utc)
+    for i, t in enumerate(utc):
+        before = table.ttinfo(i)[0]
+        after = table.ttinfo(i + 1)[0]
+        if query_utc(zone, t - 1)[0] != before:
+            return False
+
+        low = local_1[i]
+        high = local_0[i]
+        if i and low < local_0[i - 1]:
+            # The windows of consecutive transitions overlap in local time
+            return False
+
+        checks = []
+        if not i or low > local_0[i - 1]:
+            checks.append((low - 1, (before, before)))
+
+        if low != high:
+            checks.append((low, (before, after)))
+            checks.append((high - 1, (before, after)))
+
+        if i + 1 == count or local_1[i + 1] > high:
+            checks.append((high, (after, after)))
+
+        for timestamp, expected in checks:
+            if timestamp >= _MAX_TIMESTAMP - _LOCAL_MARGIN:
+                continue
+
+            if _query_local(zone, timestamp) != expected:
+                return False
+
+    return query_utc(zone, _MAX_TIMESTAMP - 1) == table.ttinfo(len(utc))
+
+
+def query_utc(zone, timestamp):
+    """Returns the ``(utcoffset, dst, tzname)`` of a zone at a UTC timestamp."""
+    dt = (EPOCH + timedelta(seconds=timestamp)).replace(tzinfo=zone)
+    dt = zone.fromutc(dt)
+
+    return (dt.utcoffset(), dt.dst(), dt.tzname())
+
+
+def _query_local(zone, timestamp):
+    dt = EPOCH + timedelta(seconds=timestamp)
+
+    return (
+        zone.utcoffset(_compat.enfold(dt, fold=0)),
+        zone.utcoffset(_compat.enfold(dt, fold=1)),
+    )
+
+
+def _seconds(td):
+    return td.days * 86400 + td.seconds
+
+
+def _read_tzif(data):
+    # Returns a list of (timestamp, changes_offset) pairs for the transitions
+    # in a TZif file, and its footer (or None for version 1 files).
+    try:
+        data = memoryview(data)
+    except TypeError:  # pragma: nocover
+        # Python 2's mmap does not support memoryview
+        pass
+
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = (
+        _HEADER.unpack_from(data, 0)
+    )
+    if magic != b"TZif":
+        raise ValueError("Not a TZif file")
+
+    time_size = 4
+    pos = _HEADER.size
+    if version != b"\x00":
+        # Skip the version 1 data block in favor of the 64-bit one
+        pos += (
+            timecnt * 5
+            + typecnt * 6
+            + charcnt
+            + leapcnt * 8
+            + isstdcnt
+            + isutcnt
+        )
+        header = _HEADER.unpack_from(data, pos)
+        if header[0] != b"TZif":
+            raise ValueError("Not a TZif file")
+
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = header[2:]
+        pos += _HEADER.size
+        time_size = 8
+
+    if leapcnt:
+        # Zones using leap seconds ("right/") are not supported
+        raise ValueError("Leap seconds")
+
+    times = struct.unpack_from(
+        ">%d%s" % (timecnt, "q" if time_size == 8 else "l"), data, pos
+    )
+    pos += timecnt * time_size
+    type_indexes = struct.unpack_from(">%dB" % timecnt, data, pos)
+    pos += timecnt
+    utoffs = [
+        struct.unpack_from(">l", data, pos + 6 * i)[0] for i in range(typecnt)
+    ]
+    pos += typecnt * 6 + charcnt + isstdcnt + isutcnt
+
+    transitions = []
+    previous = utoffs[0] if utoffs else 0
+    for t, type_index in zip(times, type_indexes):
+        utoff = utoffs[type_index]
+        transitions.append((t, utoff != previous))
+        previous = utoff
+
+    footer = None
+    if time_size == 8:
+        footer = data[pos:]
+        if hasattr(footer, "tobytes"):
+            footer = footer.tobytes()
+
+        footer = footer.strip(b"\n").decode("ascii")
+
+    return transitions, footer
+
+
+_NAME = r"(?:[A-Za-z]{3,}|<[A-Za-z0-9+-]{1,}>)"
+_OFFSET = r"[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?"
+_RULE = r"(?:J\d{1,3}|\d{1,3}|M\d{1,2}\.\d\.\d)(?:/%s)?" % _OFFSET
+_TZ_STRING = re.compile(
+    r"^%(name)s(?P<std>%(offset)s)"
+    r"(?:%(name)s(?P<dst>%(offset)s)?"
+    r",(?P<start>%(rule)s),(?P<end>%(rule)s))?$"
+    % {"name": _NAME, "offset": _OFFSET, "rule": _RULE}
+)
+
+
+def _footer_transitions(footer, start, end):
+    # Returns the (timestamp, changes_offset) pairs for the transitions
+    # described by a POSIX TZ string between start and end (exclusive), or
+    # None if the string is not understood.
+    match = _TZ_STRING.match(footer)
+    if match is None:
+        return None
+
+    std_offset = -_parse_offset(match.group("std"))
+    if match.group("start") is None:
+        return []
+
+    if match.group("dst") is None:
+        dst_offset = std_offset + 3600
+    else:
+        dst_offset = -_parse_offset(match.group("dst"))
+
+    if dst_offset == std_offset:
+        return None
+
+    rules = [
+        (match.group("start"), std_offset, True),
+        (match.group("end"), dst_offset, False),
+    ]
+
+    first_year = max((EPOCH + timedelta(seconds=start)).year - 1, 1)
+    last_year = (EPOCH + timedelta(seconds=end)).year + 1
+
+    transitions = []
+    for year in range(first_year, last_year + 1):
+        for rule, offset_before, to_dst in rules:
+            t = _rule_timestamp(rule, year) - offset_before
+            if start < t < end:
+                transitions.append((t, to_dst))
+
+    transitions.sort()
+
+    # Both transitions change the offset, and must alternate
+    result = []
+    for t, to_dst in transitions:
+        if result and result[-1][1] == to_dst:
+            return None
+
+        result.append((t, to_dst))
+
+    return [(t, True) for t, _ in result]
+
+
+def _parse_offset(value):
+    sign = -1 if value.startswith("-") else 1
+    parts = [int(part) for part in value.lstrip("+-").split(":")]
+    parts += [0] * (3 - len(parts))
+
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _rule_timestamp(rule, year):
+    # The local timestamp (in the offset before the transition) of a rule
+    if "/" in rule:
+        rule, time = rule.split("/", 1)
+        seconds = _parse_offset(time)
+    else:
+        seconds = 7200
+
+    if rule.startswith("M"):
+        month, week, weekday = (int(part) for part in rule[1:].split("."))
+        first = datetime(year, month, 1)
+        # POSIX weekdays start on Sunday
+        day = 1 + (weekday - (first.weekday() + 1)) % 7 + 7 * (week - 1)
+        if week == 5:
+            while day > calendar.monthrange(year, month)[1]:
+                day -= 7
+
+        date = datetime(year, month, day)
+    elif rule.startswith("J"):
+        # Julian day 1-365, never counting February 29th
+        day = int(rule[1:])
+        date = datetime(year, 1, 1) + timedelta(days=day - 1)
+        if day >= 60 and _is_leap(year):
+            date += timedelta(days=1)
+    else:
+        # Zero-based day of the year, counting February 29th
+        date = datetime(year, 1, 1) + timedelta(days=int(rule))
+
+    return to_timestamp(date) + seconds
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
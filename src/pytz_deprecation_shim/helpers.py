@@ -2,10 +2,13 @@
 This module contains helper functions to ease the transition from ``pytz`` to
 another :pep:`495`-compatible library.
 """
+import threading
+
 from . import _common, _compat
-from ._impl import _PytzShimTimezone
+from ._impl import _BasePytzShimTimezone
 
 _PYTZ_BASE_CLASSES = None
+_PYTZ_BASE_CLASSES_LOCK = threading.Lock()
 
 
 def is_pytz_zone(tz):
@@ -57,8 +60,8 @@ def upgrade_tzinfo(tz):
         A :pep:`495`-compatible equivalent of any ``pytz`` or shim
         class, or the original object.
     """
-    if isinstance(tz, _PytzShimTimezone):
-        return tz._zone
+    if isinstance(tz, _BasePytzShimTimezone):
+        return tz.unwrap_shim()
 
     if is_pytz_zone(tz):
         if tz.zone is None:
@@ -77,6 +80,12 @@ def upgrade_tzinfo(tz):
 
 
 def _populate_pytz_base_classes():
+    with _PYTZ_BASE_CLASSES_LOCK:
+        if _PYTZ_BASE_CLASSES is None:
+            _set_pytz_base_classes()
+
+
+def _set_pytz_base_classes():
     import pytz
     from pytz.tzinfo import BaseTzInfo
 
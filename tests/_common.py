@@ -41,7 +41,13 @@ MAX_DATETIME = EPOCHALYPSE - timedelta(days=365)
 MAX_OFFSET_MINUTES = 24 * 60 - 1  # pytz's range is (-1 day, 1 day)
 
 valid_zone_strategy = hst.sampled_from(VALID_ZONES)
-invalid_zone_strategy = hst.text().filter(lambda t: t not in VALID_ZONE_SET)
+# "posixrules" is not in pytz's list of zones, but it is a valid TZif file in
+# most zoneinfo directories, so the providers will happily load it. Like pytz,
+# timezone() also accepts "UTC" in any case.
+INVALID_ZONE_EXCLUSIONS = VALID_ZONE_SET | frozenset(("posixrules",))
+invalid_zone_strategy = hst.text().filter(
+    lambda t: t not in INVALID_ZONE_EXCLUSIONS and t.upper() != "UTC"
+)
 dt_strategy = hst.datetimes(min_value=MIN_DATETIME, max_value=MAX_DATETIME)
 offset_minute_strategy = hst.integers(
     min_value=-MAX_OFFSET_MINUTES, max_value=MAX_OFFSET_MINUTES
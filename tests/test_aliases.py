@@ -0,0 +1,158 @@
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _sources
+
+from . import _zoneinfo_data
+from ._common import PY2
+
+TARGET = "Test/Target_Zone"
+ALIAS = "Test/Alias_Zone"
+
+
+@pytest.fixture(autouse=True)
+def alias_deduplication():
+    pds.set_alias_deduplication(True)
+    try:
+        yield
+    finally:
+        pds.set_alias_deduplication(False)
+
+
+def _write_zone(tzpath, key, source_key):
+    path = os.path.join(tzpath, key)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_zoneinfo_data.get_zone_file_obj(source_key).read())
+
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture
+def tzpath():
+    if PY2:
+        pytest.skip(
+            "Relies on zoneinfo.reset_tzpath to control the search path"
+        )
+
+    try:
+        import zoneinfo
+    except ImportError:
+        from backports import zoneinfo
+
+    tmp_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(tmp_dir, "Test"))
+    for key in (TARGET, ALIAS):
+        _write_zone(tmp_dir, key, "Europe/London")
+
+    with open(os.path.join(tmp_dir, "tzdata.zi"), "w") as f:
+        f.write("# version 2020a\n")
+        f.write("L %s %s\n" % (TARGET, ALIAS))
+
+    keys = [TARGET, ALIAS]
+    old_tzpath = zoneinfo.TZPATH
+    zoneinfo.reset_tzpath([tmp_dir])
+    pds.clear_cache()
+    zoneinfo.ZoneInfo.clear_cache(only_keys=keys)
+    try:
+        yield tmp_dir
+    finally:
+        pds.set_reload_interval(None)
+        zoneinfo.reset_tzpath(old_tzpath)
+        pds.clear_cache()
+        zoneinfo.ZoneInfo.clear_cache(only_keys=keys)
+        shutil.rmtree(tmp_dir)
+
+
+def test_link_target(tzpath):
+    assert _sources.get_link_target(ALIAS) == TARGET
+    assert _sources.get_link_target(TARGET) is None
+    assert _sources.get_link_target("Test/Not_A_Zone") is None
+
+
+def test_aliases_share_zone(tzpath):
+    alias = pds.timezone(ALIAS)
+    target = pds.timezone(TARGET)
+
+    assert alias is not target
+    assert alias.unwrap_shim() is target.unwrap_shim()
+
+    assert str(alias) == ALIAS
+    with pytest.warns(pds.PytzUsageWarning):
+        assert alias.zone == ALIAS
+
+
+def test_alias_loaded_first(tzpath):
+    alias = pds.timezone(ALIAS)
+
+    assert str(alias.unwrap_shim()) == TARGET
+    assert pds.timezone(TARGET).unwrap_shim() is alias.unwrap_shim()
+
+
+def test_missing_link_target(tzpath):
+    os.remove(os.path.join(tzpath, TARGET))
+
+    # The link cannot be followed, so the alias is loaded from its own file
+    alias = pds.timezone(ALIAS)
+    assert str(alias.unwrap_shim()) == ALIAS
+
+
+def test_deduplication_disabled(tzpath):
+    pds.set_alias_deduplication(False)
+
+    alias = pds.timezone(ALIAS)
+    target = pds.timezone(TARGET)
+
+    assert alias.unwrap_shim() is not target.unwrap_shim()
+
+
+def test_reload_aliases(tzpath):
+    pds.set_reload_interval(3600)
+
+    alias = pds.timezone(ALIAS)
+    target = pds.timezone(TARGET)
+    dt = datetime(2020, 1, 1)
+    assert alias.utcoffset(dt) == timedelta(0)
+
+    for key in (TARGET, ALIAS):
+        _write_zone(tzpath, key, "Asia/Tokyo")
+
+    assert pds.reload_zones() == sorted([TARGET, ALIAS])
+
+    new_alias = pds.timezone(ALIAS)
+    new_target = pds.timezone(TARGET)
+    assert new_alias is not alias
+    assert new_target is not target
+    assert new_alias.unwrap_shim() is new_target.unwrap_shim()
+    assert new_alias.utcoffset(dt) == timedelta(hours=9)
+
+
+@pytest.mark.parametrize(
+    "alias_key, target_key",
+    [("US/Eastern", "America/New_York"), ("Asia/Calcutta", "Asia/Kolkata")],
+)
+def test_system_aliases(alias_key, target_key):
+    if _sources.get_link_target(alias_key) != target_key:
+        pytest.skip("The time zone data does not list %s as a link" % alias_key)
+
+    pds.clear_cache()
+    alias = pds.timezone(alias_key)
+    target = pds.timezone(target_key)
+
+    assert alias.unwrap_shim() is target.unwrap_shim()
+    assert str(alias) == alias_key
+
+    dt = datetime(2020, 11, 1, 1, 30)
+    for fold in (0, 1):
+        dt_alias = dt.replace(tzinfo=alias, fold=fold)
+        dt_target = dt.replace(tzinfo=target, fold=fold)
+        assert dt_alias.utcoffset() == dt_target.utcoffset()
+        assert dt_alias.tzname() == dt_target.tzname()
+
+    assert pickle.loads(pickle.dumps(alias)) is alias
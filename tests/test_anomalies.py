@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, enfold
+
+pytestmark = pytest.mark.skipif(
+    PY2, reason="The gap and fold index requires a transition table"
+)
+
+ONE_SECOND = timedelta(seconds=1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _zone_data(key):
+    return _zoneinfo_data.get_zone_file_obj(key).read()
+
+
+def _transition_cases():
+    return [
+        (key, zt)
+        for key, zt in _zoneinfo_data.get_fold_cases()
+        + _zoneinfo_data.get_gap_cases()
+        if zt.transition.year < 2037
+    ]
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_find_anomaly(key, zt):
+    zone = pds.build_tzinfo(key, _zone_data(key))
+
+    for dt in (zt.anomaly_start, zt.anomaly_end - ONE_SECOND):
+        anomaly = zone.find_anomaly(dt)
+        assert anomaly == (
+            "imaginary" if zt.gap else "ambiguous",
+            zt.anomaly_start,
+            zt.anomaly_end,
+            zt.offset_before.utcoffset,
+            zt.offset_after.utcoffset,
+        )
+        assert anomaly.kind == zone.classify(dt).kind
+
+    for dt in (zt.anomaly_start - ONE_SECOND, zt.anomaly_end):
+        assert zone.find_anomaly(dt) is None
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_anomalies_range(key, zt):
+    zone = pds.build_tzinfo(key, _zone_data(key))
+
+    anomalies = zone.anomalies(zt.anomaly_start, zt.anomaly_end)
+    assert [(a.start, a.end) for a in anomalies] == [
+        (zt.anomaly_start, zt.anomaly_end)
+    ]
+
+    assert zone.anomalies(zt.anomaly_end, zt.anomaly_end + ONE_SECOND) == []
+    assert zone.anomalies(zt.anomaly_start - ONE_SECOND, zt.anomaly_start) == []
+
+
+def test_anomalies_new_york():
+    zone = pds.timezone("America/New_York")
+
+    anomalies = zone.anomalies(datetime(2020, 1, 1), datetime(2021, 1, 1))
+
+    assert anomalies == [
+        (
+            "imaginary",
+            datetime(2020, 3, 8, 2),
+            datetime(2020, 3, 8, 3),
+            timedelta(hours=-5),
+            timedelta(hours=-4),
+        ),
+        (
+            "ambiguous",
+            datetime(2020, 11, 1, 1),
+            datetime(2020, 11, 1, 2),
+            timedelta(hours=-4),
+            timedelta(hours=-5),
+        ),
+    ]
+
+
+def test_anomalies_all():
+    zone = pds.timezone("Europe/London")
+
+    anomalies = zone.anomalies()
+
+    assert anomalies == zone.anomalies(datetime(1, 1, 2), datetime(2037, 12, 1))
+    assert all(a.start < a.end for a in anomalies)
+    assert all(a.end <= b.start for a, b in zip(anomalies, anomalies[1:]))
+    for anomaly in anomalies:
+        assert zone.find_anomaly(anomaly.start) == anomaly
+        assert zone.classify(anomaly.start).kind == anomaly.kind
+
+
+def test_anomalies_microsecond_bounds():
+    zone = pds.timezone("America/New_York")
+    gap_start = datetime(2020, 3, 8, 2)
+    gap_end = datetime(2020, 3, 8, 3)
+
+    assert zone.anomalies(gap_start - ONE_SECOND, gap_start) == []
+    assert (
+        len(zone.anomalies(gap_start - ONE_SECOND, gap_start + ONE_MICROSECOND))
+        == 1
+    )
+    assert (
+        zone.anomalies(gap_end - ONE_MICROSECOND, gap_end + ONE_SECOND)[0].start
+        == gap_start
+    )
+    assert zone.find_anomaly(gap_end - ONE_MICROSECOND).start == gap_start
+
+
+@pytest.mark.parametrize("fold", [0, 1])
+def test_find_anomaly_ignores_tzinfo_and_fold(fold):
+    zone = pds.timezone("America/New_York")
+    dt = enfold(datetime(2020, 11, 1, 1, 30, tzinfo=UTC), fold=fold)
+
+    assert zone.find_anomaly(dt).kind == "ambiguous"
+
+
+@pytest.mark.parametrize(
+    "zone", [pds.UTC, pds.fixed_offset_timezone(330)], ids=str
+)
+def test_fixed_offset(zone):
+    assert zone.anomalies() == []
+    assert zone.anomalies(datetime(2000, 1, 1), datetime(2100, 1, 1)) == []
+    assert zone.find_anomaly(datetime(2100, 3, 8, 2, 30)) is None
+
+
+def test_no_transitions():
+    zone = pds.timezone("Etc/GMT+5")
+
+    assert zone.anomalies() == []
+    assert zone.find_anomaly(datetime(2020, 3, 8, 2, 30)) is None
+
+
+def test_unknown_transitions():
+    key = "Europe/London"
+    zone = pds.build_tzinfo(key, _zoneinfo_data.get_zone_file_obj(key))
+
+    with pytest.raises(ValueError):
+        zone.find_anomaly(datetime(2020, 3, 29, 1, 30))
+
+    with pytest.raises(ValueError):
+        zone.anomalies()
+
+
+def test_out_of_range():
+    zone = pds.timezone("America/New_York")
+
+    with pytest.raises(ValueError):
+        zone.find_anomaly(datetime(2040, 3, 11, 2, 30))
+
+    with pytest.raises(ValueError):
+        zone.anomalies(datetime(2037, 1, 1), datetime(2039, 1, 1))
+
+    assert zone.anomalies(datetime(2037, 1, 1))[-1].start == datetime(
+        2037, 11, 1, 1
+    )
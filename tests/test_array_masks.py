@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import hypothesis
+import hypothesis.strategies as hst
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _arrays
+
+from . import _zoneinfo_data
+from ._common import PY2, dt_strategy, valid_zone_strategy
+
+np = _arrays.np
+
+pytestmark = pytest.mark.skipif(np is None, reason="Requires NumPy")
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _assert_matches_classify(zone, dts):
+    values = np.array(dts, dtype="M8[us]")
+    kinds = [zone.classify(dt).kind for dt in dts]
+
+    assert zone.ambiguous_mask(values).tolist() == [
+        kind == "ambiguous" for kind in kinds
+    ]
+    assert zone.imaginary_mask(values).tolist() == [
+        kind == "imaginary" for kind in kinds
+    ]
+
+
+def _transition_cases():
+    cases = _zoneinfo_data.get_fold_cases()
+    if not PY2:
+        # dateutil.tz does not follow PEP 495 in gaps
+        cases += _zoneinfo_data.get_gap_cases()
+
+    return cases
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_transitions(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    dts = [
+        zt.anomaly_start - ONE_SECOND,
+        zt.anomaly_start,
+        zt.anomaly_end - timedelta(microseconds=1),
+        zt.anomaly_end,
+    ]
+
+    _assert_matches_classify(zone, dts)
+
+    kind = "imaginary" if zt.gap else "ambiguous"
+    mask = getattr(zone, "%s_mask" % kind)(np.array(dts, dtype="M8[us]"))
+    assert mask.tolist() == [False, True, True, False]
+
+
+@hypothesis.given(
+    dts=hst.lists(dt_strategy, max_size=20), key=valid_zone_strategy
+)
+def test_matches_classify(dts, key):
+    _assert_matches_classify(pds.timezone(key), dts)
+
+
+def test_after_table():
+    # Times after 2037 are classified by the zone, one at a time
+    zone = pds.timezone("America/New_York")
+    dts = [
+        datetime(2037, 12, 31, 12),
+        datetime(2040, 3, 11, 2, 30),
+        datetime(2040, 11, 4, 1, 30),
+        datetime(2040, 7, 1),
+    ]
+
+    _assert_matches_classify(zone, dts)
+
+
+def test_fixed_offset():
+    zone = pds.fixed_offset_timezone(330)
+    values = np.array(["2020-03-08T02:30", "2020-11-01T01:30"], dtype="M8[s]")
+
+    assert not zone.ambiguous_mask(values).any()
+    assert not zone.imaginary_mask(values).any()
+
+
+def test_nat():
+    zone = pds.timezone("America/New_York")
+    values = np.array(
+        [["NaT", "2020-03-08T02:30"], ["2020-11-01T01:30", "NaT"]],
+        dtype="M8[ns]",
+    )
+
+    assert zone.ambiguous_mask(values).tolist() == [
+        [False, False],
+        [True, False],
+    ]
+    assert zone.imaginary_mask(values).tolist() == [
+        [False, True],
+        [False, False],
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["i8", "M8[ps]"])
+def test_invalid_values(dtype):
+    values = np.zeros(3, dtype=dtype)
+
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").ambiguous_mask(values)
+
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").imaginary_mask(values)
@@ -0,0 +1,160 @@
+import warnings
+from datetime import datetime, timedelta
+
+import hypothesis
+import hypothesis.strategies as hst
+import pytest
+import pytz
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, dt_strategy, get_fold, valid_zone_strategy
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _assert_identical(actual, expected):
+    assert len(actual) == len(expected)
+    for dt_actual, dt_expected in zip(actual, expected):
+        assert dt_actual.replace(tzinfo=None) == dt_expected.replace(
+            tzinfo=None
+        )
+        assert get_fold(dt_actual) == get_fold(dt_expected)
+        assert dt_actual.tzinfo is dt_expected.tzinfo
+
+
+def _transition_inputs(zt):
+    # Aware datetimes on either side of the transition, in several zones
+    utc = zt.transition_utc.replace(tzinfo=UTC)
+    dts = [
+        utc + delta
+        for delta in (
+            -timedelta(days=1),
+            -ONE_SECOND,
+            timedelta(0),
+            zt.offset_before.utcoffset - zt.offset_after.utcoffset - ONE_SECOND,
+            zt.offset_before.utcoffset - zt.offset_after.utcoffset,
+            timedelta(days=1),
+        )
+    ]
+
+    dts.append(dts[2].astimezone(pds.fixed_offset_timezone(-330)))
+    dts.append(dts[3].astimezone(pds.timezone("Asia/Tokyo")))
+    dts.append(dts[4].astimezone(pytz.timezone("Europe/London")))
+
+    return dts
+
+
+@pytest.mark.parametrize(
+    "key, zt", _zoneinfo_data.get_fold_cases() + _zoneinfo_data.get_gap_cases()
+)
+def test_transitions(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    dts = _transition_inputs(zt)
+
+    expected = [dt.astimezone(zone) for dt in dts]
+    _assert_identical(list(zone.astimezone_many(dts)), expected)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.normalize_many(dts))
+
+    _assert_identical(actual, expected)
+
+
+@hypothesis.given(
+    dts=hst.lists(dt_strategy, max_size=20),
+    key=valid_zone_strategy,
+    source_key=valid_zone_strategy,
+)
+def test_matches_astimezone(dts, key, source_key):
+    zone = pds.timezone(key)
+    source = pds.timezone(source_key)
+    aware = [dt.replace(tzinfo=source) for dt in sorted(dts)]
+
+    expected = [dt.astimezone(zone) for dt in aware]
+    _assert_identical(list(zone.astimezone_many(aware)), expected)
+
+
+def test_same_zone():
+    zone = pds.timezone("America/New_York")
+    dt = datetime(2020, 3, 8, 2, 30, tzinfo=zone)
+
+    (result,) = zone.astimezone_many([dt])
+
+    assert result is dt
+
+
+def test_fixed_offset_target():
+    zone = pds.fixed_offset_timezone(330)
+    dts = [
+        datetime(2020, 1, 1, tzinfo=UTC),
+        datetime(2020, 1, 1, tzinfo=pds.timezone("America/New_York")),
+    ]
+
+    expected = [dt.astimezone(zone) for dt in dts]
+    _assert_identical(list(zone.astimezone_many(dts)), expected)
+
+
+@pytest.mark.skipif(PY2, reason="zoneinfo is not available on Python 2")
+def test_zoneinfo_subclass():
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        zone = pds.timezone("America/New_York")
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    start = datetime(2020, 11, 1, 4, tzinfo=UTC)
+    dts = [start + i * timedelta(minutes=20) for i in range(12)]
+
+    expected = [dt.astimezone(zone) for dt in dts]
+    _assert_identical(list(zone.astimezone_many(dts)), expected)
+    assert [get_fold(dt) for dt in expected].count(1) == 3
+
+
+def test_single_warning():
+    zone = pds.timezone("America/New_York")
+    start = datetime(2020, 1, 1, tzinfo=UTC)
+    dts = (start + timedelta(hours=i) for i in range(24 * 366))
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        results = list(zone.normalize_many(dts))
+
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, pds.PytzUsageWarning)
+    assert caught[0].filename == __file__
+    assert len(results) == 24 * 366
+
+
+def test_normalize_naive():
+    zone = pds.timezone("America/New_York")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        results = zone.normalize_many([datetime(2020, 1, 1)])
+
+    with pytest.raises(ValueError):
+        next(results)
+
+
+@pytest.mark.skipif(PY2, reason="Naive astimezone is not supported")
+def test_astimezone_naive():
+    zone = pds.timezone("America/New_York")
+    dt = datetime(2020, 1, 1)
+
+    _assert_identical(list(zone.astimezone_many([dt])), [dt.astimezone(zone)])
@@ -0,0 +1,251 @@
+import gc
+import mmap
+import os
+import shutil
+import tempfile
+import zipfile
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _impl
+
+from . import _zoneinfo_data
+from ._common import PY2, assert_dt_offset
+
+
+def _zone_data(key):
+    return _zoneinfo_data.get_zone_file_obj(key).read()
+
+
+@pytest.fixture
+def deduplication():
+    pds.set_build_tzinfo_deduplication(True)
+    try:
+        yield
+    finally:
+        pds.set_build_tzinfo_deduplication(False)
+
+
+@pytest.fixture
+def mmap_factory():
+    tmp_dir = tempfile.mkdtemp()
+    maps = []
+
+    def factory(data):
+        path = os.path.join(tmp_dir, "zone%d" % len(maps))
+        with open(path, "wb") as f:
+            f.write(data)
+
+        with open(path, "rb") as f:
+            maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        return maps[-1]
+
+    try:
+        yield factory
+    finally:
+        gc.collect()
+        for m in maps:
+            m.close()
+        shutil.rmtree(tmp_dir)
+
+
+BUFFER_TYPES = [bytes, bytearray, memoryview, "mmap"]
+
+
+@pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+@pytest.mark.parametrize(
+    "key, dt, offset", _zoneinfo_data.get_unambiguous_cases()[::7]
+)
+def test_build_tzinfo_buffer(buffer_type, key, dt, offset, mmap_factory):
+    data = _zone_data(key)
+    if buffer_type == "mmap":
+        buffer = mmap_factory(data)
+    else:
+        buffer = buffer_type(data)
+
+    zone = pds.build_tzinfo(key, buffer)
+
+    assert str(zone) == key
+    assert_dt_offset(dt.replace(tzinfo=zone), offset)
+
+
+def test_build_tzinfo_no_deduplication():
+    data = _zone_data("Asia/Tokyo")
+
+    zone_a = pds.build_tzinfo("Asia/Tokyo", data)
+    zone_b = pds.build_tzinfo("Asia/Tokyo", data)
+
+    assert zone_a is not zone_b
+    assert zone_a.unwrap_shim() is not zone_b.unwrap_shim()
+
+
+@pytest.mark.parametrize("as_file", [True, False])
+def test_build_tzinfo_deduplication(deduplication, as_file):
+    def build(key, source_key):
+        if as_file:
+            return pds.build_tzinfo(
+                key, _zoneinfo_data.get_zone_file_obj(source_key)
+            )
+
+        return pds.build_tzinfo(key, memoryview(_zone_data(source_key)))
+
+    tokyo = build("Asia/Tokyo", "Asia/Tokyo")
+    japan = build("Japan", "Asia/Tokyo")
+    sydney = build("Australia/Sydney", "Australia/Sydney")
+
+    assert str(tokyo) == "Asia/Tokyo"
+    assert str(japan) == "Japan"
+    assert tokyo is not japan
+    assert tokyo.unwrap_shim() is japan.unwrap_shim()
+    assert sydney.unwrap_shim() is not tokyo.unwrap_shim()
+
+    # The same key and data returns the same shim while it is alive
+    assert build("Asia/Tokyo", "Asia/Tokyo") is tokyo
+
+
+def test_build_tzinfo_deduplication_weak(deduplication):
+    before = pds.cache_info()["build_tzinfo"]
+    zone = pds.build_tzinfo("Europe/Lisbon", _zone_data("Europe/Lisbon"))
+    assert pds.cache_info()["build_tzinfo"].currsize == before.currsize + 1
+
+    del zone
+    gc.collect()
+    assert pds.cache_info()["build_tzinfo"].currsize == before.currsize
+
+
+@pytest.mark.skipif(PY2, reason="ZoneInfo subclass mode requires zoneinfo")
+@pytest.mark.parametrize("buffer_type", [bytes, memoryview])
+def test_build_tzinfo_buffer_subclass_mode(buffer_type):
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        zone = pds.build_tzinfo(
+            "Europe/Dublin", buffer_type(_zone_data("Europe/Dublin"))
+        )
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    assert isinstance(zone, _impl._ZoneInfoShimTimezone)
+    assert zone.key == "Europe/Dublin"
+
+
+DATA_KEYS = ["Asia/Tokyo", "Europe/Dublin", "America/Santiago"]
+
+
+def _write_tree(write):
+    for key in DATA_KEYS:
+        write(key, _zone_data(key))
+
+    write("posixrules", _zone_data("America/Santiago"))
+    write("posix/Asia/Tokyo", _zone_data("Asia/Tokyo"))
+    write("zone.tab", b"# Not a TZif file\n")
+
+
+@pytest.fixture
+def zone_tree():
+    tmp_dir = tempfile.mkdtemp()
+
+    def write(key, data):
+        path = os.path.join(tmp_dir, *key.split("/"))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, "wb") as f:
+            f.write(data)
+
+    _write_tree(write)
+    try:
+        yield tmp_dir
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@pytest.fixture
+def zone_zip():
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, "zones.zip")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        _write_tree(archive.writestr)
+
+    try:
+        yield path
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@pytest.fixture
+def reset_zone_source():
+    try:
+        yield
+    finally:
+        pds.register_zones(None)
+
+
+@pytest.fixture(params=["zone_tree", "zone_zip"])
+def zone_source(request):
+    return request.getfixturevalue(request.param)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_build_tzinfo_many(zone_source, workers):
+    zones = pds.build_tzinfo_many(zone_source, workers=workers)
+
+    assert sorted(zones) == sorted(DATA_KEYS)
+    for key, zone in zones.items():
+        assert str(zone) == key
+
+
+@pytest.mark.parametrize(
+    "key, dt, offset",
+    [
+        case
+        for case in _zoneinfo_data.get_unambiguous_cases()
+        if case[0] in DATA_KEYS
+    ],
+)
+def test_build_tzinfo_many_offsets(zone_tree, key, dt, offset):
+    zone = pds.build_tzinfo_many(zone_tree, keys=[key])[key]
+
+    assert_dt_offset(dt.replace(tzinfo=zone), offset)
+
+
+def test_build_tzinfo_many_explicit_keys(zone_source):
+    zones = pds.build_tzinfo_many(zone_source, keys=["posix/Asia/Tokyo"])
+    assert list(zones) == ["posix/Asia/Tokyo"]
+
+    for key in ["zone.tab", "Not/A_Zone", "../Asia/Tokyo"]:
+        with pytest.raises(pds.UnknownTimeZoneError):
+            pds.build_tzinfo_many(zone_source, keys=["Asia/Tokyo", key])
+
+
+def test_build_tzinfo_many_invalid_source(zone_tree):
+    with pytest.raises(ValueError):
+        pds.build_tzinfo_many(os.path.join(zone_tree, "zone.tab"))
+
+    with pytest.raises(ValueError):
+        pds.build_tzinfo_many(zone_tree, workers=0)
+
+
+def test_build_tzinfo_many_register(zone_source, reset_zone_source):
+    zones = pds.build_tzinfo_many(zone_source, register=True)
+
+    assert pds.timezone("Asia/Tokyo") is zones["Asia/Tokyo"]
+    assert pds.is_valid_key("Europe/Dublin")
+
+    # Other keys still come from the provider
+    assert str(pds.timezone("Europe/Paris")) == "Europe/Paris"
+
+    pds.register_zones(None)
+    assert pds.timezone("Asia/Tokyo") is not zones["Asia/Tokyo"]
+
+
+def test_register_zones_exclusive(zone_tree, reset_zone_source):
+    zones = pds.build_tzinfo_many(zone_tree)
+    pds.register_zones(zones, exclusive=True)
+
+    assert pds.timezone("Europe/Dublin") is zones["Europe/Dublin"]
+    assert pds.timezone("UTC") is pds.UTC
+    assert not pds.is_valid_key("Europe/Paris")
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Europe/Paris")
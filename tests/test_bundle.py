@@ -0,0 +1,168 @@
+import io
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _bundle, _impl
+from pytz_deprecation_shim.__main__ import main
+from pytz_deprecation_shim._buffer import BufferReader
+
+from . import _zoneinfo_data
+from ._common import PY2
+
+KEYS = ["America/Santiago", "Europe/Dublin", "Asia/Tokyo", "Japan"]
+
+
+@pytest.fixture(autouse=True)
+def reset_bundle():
+    try:
+        yield
+    finally:
+        pds.use_bundle(None)
+
+
+@pytest.fixture
+def tmp_dir():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        yield tmp_dir
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@pytest.fixture
+def bundle_path(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.bundle")
+    pds.build_bundle(path, keys=KEYS)
+    return path
+
+
+def _offsets(zone):
+    dt = datetime(1970, 1, 1)
+    offsets = []
+    while dt.year < 2040:
+        offsets.append(dt.replace(tzinfo=zone).utcoffset())
+        dt += timedelta(days=17, hours=5)
+    return offsets
+
+
+def test_use_bundle(bundle_path):
+    pds.clear_cache()
+    expected = {key: _offsets(pds.timezone(key)) for key in KEYS}
+
+    assert pds.use_bundle(bundle_path) == sorted(KEYS)
+
+    for key in KEYS:
+        zone = pds.timezone(key)
+        assert zone is pds.timezone(key)
+        assert str(zone) == key
+        assert _offsets(zone) == expected[key]
+        assert zone.unwrap_shim() is not _impl._compat.get_timezone(key)
+
+    # Keys that are not in the bundle come from the provider
+    assert str(pds.timezone("Europe/Paris")) == "Europe/Paris"
+    assert pds.is_valid_key("Europe/Paris")
+
+
+def test_use_bundle_exclusive(bundle_path):
+    pds.use_bundle(bundle_path, exclusive=True)
+
+    assert str(pds.timezone("Asia/Tokyo")) == "Asia/Tokyo"
+    assert pds.timezone("UTC") is pds.UTC
+    assert pds.is_valid_key("Asia/Tokyo")
+    assert not pds.is_valid_key("Europe/Paris")
+
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Europe/Paris")
+
+
+def test_stop_using_bundle(bundle_path):
+    pds.use_bundle(bundle_path, exclusive=True)
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Europe/Paris")
+
+    assert pds.use_bundle(None) == []
+    assert str(pds.timezone("Europe/Paris")) == "Europe/Paris"
+
+
+@pytest.mark.skipif(PY2, reason="ZoneInfo subclass mode requires zoneinfo")
+def test_use_bundle_subclass_mode(bundle_path):
+    pds.use_bundle(bundle_path)
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        zone = pds.timezone("Europe/Dublin")
+        assert isinstance(zone, _impl._ZoneInfoShimTimezone)
+        assert _offsets(zone) == _offsets(zone.unwrap_shim())
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+
+def test_build_bundle_unknown_key(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.bundle")
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.build_bundle(path, keys=["Asia/Tokyo", "Not/A_Zone"])
+
+    assert not os.path.exists(path)
+
+
+def test_use_invalid_bundle(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.bundle")
+    with open(path, "wb") as f:
+        f.write(b"TZif" + b"\x00" * 40)
+
+    with pytest.raises(ValueError):
+        pds.use_bundle(path)
+
+
+def test_bundle_shares_identical_data(bundle_path):
+    bundle = _bundle.Bundle.open(bundle_path)
+    try:
+        tokyo = bundle.get("Asia/Tokyo")
+        japan = bundle.get("Japan")
+        assert bytes(tokyo) == bytes(japan)
+        assert bundle._index["Asia/Tokyo"] == bundle._index["Japan"]
+    finally:
+        del tokyo, japan
+        bundle.close()
+
+
+def test_build_bundle_command_line(tmp_dir, capsys):
+    path = os.path.join(tmp_dir, "zones.bundle")
+
+    assert main(["build-bundle", path, "Asia/Tokyo", "Europe/Dublin"]) == 0
+    assert "Wrote 2 zones" in capsys.readouterr().out
+    assert pds.use_bundle(path) == ["Asia/Tokyo", "Europe/Dublin"]
+
+
+def test_build_bundle_command_line_unknown_key(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.bundle")
+
+    with pytest.raises(SystemExit):
+        main(["build-bundle", path, "Not/A_Zone"])
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        [("read", 4), ("read", 0), ("tell",), ("read", -1)],
+        [("seek", 10, 0), ("read", 5), ("seek", -3, 1), ("read", 100)],
+        [("seek", -4, 2), ("read", None), ("read", 1), ("tell",)],
+        [("seek", 1000, 0), ("read", 1), ("tell",)],
+    ],
+)
+def test_buffer_reader_matches_bytes_io(ops):
+    data = _zoneinfo_data.get_zone_file_obj("Asia/Tokyo").read()[:64]
+    readers = [io.BytesIO(data), BufferReader(memoryview(data))]
+
+    for op in ops:
+        results = [getattr(reader, op[0])(*op[1:]) for reader in readers]
+        assert results[0] == results[1]
+
+
+def test_buffer_reader_negative_seek():
+    with pytest.raises(ValueError):
+        BufferReader(b"TZif").seek(-1)
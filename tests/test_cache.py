@@ -0,0 +1,354 @@
+import gc
+import threading
+import time
+import weakref
+from datetime import timedelta, tzinfo
+
+import hypothesis
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim._cache import KeyCache, ZoneCache
+
+from ._common import PY2, invalid_zone_strategy, valid_zone_strategy
+
+
+@pytest.fixture(autouse=True)
+def restore_cache_size():
+    sizes = {name: info.maxsize for name, info in pds.cache_info().items()}
+    try:
+        yield
+    finally:
+        for name, maxsize in sizes.items():
+            pds.set_cache_size(maxsize, names=[name])
+
+
+def test_cache_info_hits_misses():
+    key = "America/Chicago"
+    pds.clear_cache(only_keys=[key])
+
+    before = pds.cache_info()["timezone"]
+    zone = pds.timezone(key)
+    assert pds.timezone(key) is zone
+    after = pds.cache_info()["timezone"]
+
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+    assert after.currsize >= 1
+    assert after.maxsize is None
+
+
+def test_wrap_zone_cache_weak_by_default():
+    assert pds.cache_info()["wrap_zone"].maxsize == 0
+
+
+def test_cache_info_names():
+    info = pds.cache_info()
+
+    assert set(info) == {
+        "timezone",
+        "fixed_offset_timezone",
+        "wrap_zone",
+        "unknown_keys",
+        "build_tzinfo",
+        "aliases",
+    }
+
+
+def test_clear_cache_only_keys():
+    zone_a = pds.timezone("Europe/Paris")
+    zone_b = pds.timezone("Europe/Berlin")
+
+    pds.clear_cache(only_keys=["Europe/Paris"])
+
+    assert pds.timezone("Europe/Berlin") is zone_b
+
+    new_zone_a = pds.timezone("Europe/Paris")
+    assert new_zone_a is not zone_a
+    assert str(new_zone_a) == str(zone_a)
+
+
+def test_clear_cache_fixed_offset():
+    zone = pds.fixed_offset_timezone(90)
+    pds.clear_cache(only_keys=[90])
+
+    assert pds.fixed_offset_timezone(90) is not zone
+    assert pds.fixed_offset_timezone(0) is pds.UTC
+
+
+def test_clear_cache_all():
+    pds.timezone("Asia/Kolkata")
+    pds.clear_cache()
+
+    info = pds.cache_info()["timezone"]
+    assert info.currsize == 0
+    assert info.hits == info.misses == 0
+
+
+def test_set_cache_size_unknown_name():
+    with pytest.raises(ValueError):
+        pds.set_cache_size(4, names=["not_a_cache"])
+
+
+def test_set_cache_size_negative():
+    with pytest.raises(ValueError):
+        pds.set_cache_size(-1)
+
+
+def test_lru_eviction_keeps_referenced_zones():
+    pds.clear_cache()
+    pds.set_cache_size(2, names=["timezone"])
+
+    held = pds.timezone("America/Denver")
+    for key in ("Asia/Seoul", "Asia/Manila", "Asia/Dhaka"):
+        pds.timezone(key)
+
+    # America/Denver has been evicted from the strong cache, but since it is
+    # still referenced, timezone() must still return the same object.
+    assert pds.timezone("America/Denver") is held
+    assert pds.cache_info()["timezone"].maxsize == 2
+
+
+class _Value(object):
+    pass
+
+
+def test_zone_cache_lru_eviction():
+    cache = ZoneCache(maxsize=2)
+
+    for key in "abc":
+        cache.setdefault(key, _Value())
+    gc.collect()
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+
+
+def test_zone_cache_get_pins():
+    cache = ZoneCache(maxsize=2)
+
+    cache.setdefault("a", _Value())
+    cache.setdefault("b", _Value())
+    cache.get("a")
+    cache.setdefault("c", _Value())
+    gc.collect()
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.cache_info() == (1, 0, 2, 2)
+
+
+def test_zone_cache_resize():
+    cache = ZoneCache()
+    values = [_Value() for _ in range(4)]
+    for i, value in enumerate(values):
+        cache.setdefault(i, value)
+
+    cache.resize(1)
+    del values
+    gc.collect()
+
+    assert len(cache) == 1
+    assert 3 in cache
+
+
+def test_zone_cache_setdefault_existing():
+    cache = ZoneCache()
+    value = _Value()
+
+    assert cache.setdefault("a", value) is value
+    assert cache.setdefault("a", _Value()) is value
+
+
+def test_zone_cache_clear_key_func():
+    cache = ZoneCache(key_func=lambda cache_key: cache_key[1])
+    value = _Value()
+    cache.setdefault((1, "a"), value)
+    cache.setdefault((2, "b"), _Value())
+
+    cache.clear(only_keys=["b"])
+
+    assert (1, "a") in cache
+    assert (2, "b") not in cache
+
+
+def test_clear_cache_keeps_utc_singleton():
+    pds.clear_cache()
+
+    assert pds.wrap_zone(pds.UTC.unwrap_shim(), "UTC") is pds.UTC
+    assert pds.timezone("UTC") is pds.UTC
+
+
+def test_unknown_key_cached(monkeypatch):
+    key = "Not/A_Real_Zone"
+    pds.clear_cache(only_keys=[key])
+
+    calls = []
+    get_timezone = pds._compat.get_timezone
+
+    def counting_get_timezone(*args, **kwargs):
+        calls.append(args)
+        return get_timezone(*args, **kwargs)
+
+    monkeypatch.setattr(pds._compat, "get_timezone", counting_get_timezone)
+
+    for _ in range(3):
+        with pytest.raises(pds.UnknownTimeZoneError):
+            pds.timezone(key)
+
+    assert len(calls) == 1
+
+    pds.clear_cache(only_keys=[key])
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone(key)
+
+    assert len(calls) == 2
+
+
+def test_unknown_keys_bounded():
+    assert pds.cache_info()["unknown_keys"].maxsize == 1024
+
+    pds.set_cache_size(None)
+    assert pds.cache_info()["unknown_keys"].maxsize == 1024
+
+
+@hypothesis.given(key=valid_zone_strategy)
+def test_is_valid_key_valid(key):
+    assert pds.is_valid_key(key)
+
+
+@hypothesis.given(key=invalid_zone_strategy)
+@hypothesis.example(key="")
+@hypothesis.example(key="zone.tab")
+@hypothesis.example(key="America")
+@hypothesis.example(key="../zoneinfo/UTC")
+@hypothesis.example(key="/usr/share/zoneinfo/UTC")
+def test_is_valid_key_invalid(key):
+    assert not pds.is_valid_key(key)
+
+
+@pytest.mark.parametrize("key", [None, 1, b"UTC"])
+def test_is_valid_key_non_string(key):
+    assert not pds.is_valid_key(key)
+
+
+def test_is_valid_key_consistent_with_timezone():
+    key = "Europe/Lisbon"
+    assert pds.is_valid_key(key)
+    pds.timezone(key)
+    assert pds.is_valid_key(key)
+
+
+def test_key_cache_lru():
+    cache = KeyCache(maxsize=2)
+    cache.add("a")
+    cache.add("b")
+    assert "a" in cache
+    cache.add("c")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.cache_info() == (3, 1, 2, 2)
+
+    cache.clear(only_keys=["a"])
+    assert "a" not in cache
+    assert len(cache) == 1
+
+
+class _UnkeyedZone(tzinfo):
+    def utcoffset(self, dt):
+        return timedelta(hours=1)
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def tzname(self, dt):
+        return "Custom"
+
+
+def test_wrap_zone_releases_zone():
+    zone = _UnkeyedZone()
+    zone_ref = weakref.ref(zone)
+
+    shim = pds.wrap_zone(zone, key="Custom/Zone")
+    assert pds.wrap_zone(zone, key="Custom/Zone") is shim
+
+    del zone, shim
+    gc.collect()
+
+    assert zone_ref() is None
+
+
+def test_wrap_zone_many_short_lived():
+    before = pds.cache_info()["wrap_zone"].currsize
+
+    for _ in range(1000):
+        pds.wrap_zone(_UnkeyedZone(), key="Custom/Zone")
+    gc.collect()
+
+    assert pds.cache_info()["wrap_zone"].currsize <= before
+
+
+def test_wrap_zone_never_returns_wrong_zone():
+    shims = {}
+    for i in range(100):
+        zone = _UnkeyedZone()
+        shim = pds.wrap_zone(zone, key="Custom/Zone")
+        assert shim.unwrap_shim() is zone
+
+        # Drop the previous iteration's zone so that its id can be reused
+        shims[i % 2] = shim
+
+
+@pytest.mark.skipif(PY2, reason="threading.Barrier requires Python 3")
+def test_timezone_single_flight(monkeypatch):
+    key = "America/Anchorage"
+    pds.clear_cache(only_keys=[key])
+
+    calls = []
+    get_timezone = pds._compat.get_timezone
+
+    def slow_get_timezone(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)
+        return get_timezone(*args, **kwargs)
+
+    monkeypatch.setattr(pds._compat, "get_timezone", slow_get_timezone)
+
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    results = [None] * n_threads
+
+    def load(i):
+        barrier.wait()
+        results[i] = pds.timezone(key)
+
+    threads = [
+        threading.Thread(target=load, args=(i,)) for i in range(n_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_zone_cache_get_or_create_failure():
+    cache = ZoneCache()
+    calls = []
+
+    def factory(key):
+        calls.append(key)
+        raise KeyError(key)
+
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            cache.get_or_create("a", factory)
+
+    assert calls == ["a", "a"]
+    assert "a" not in cache
+    assert not cache._loading
@@ -0,0 +1,77 @@
+import hypothesis
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _sources
+
+from ._common import valid_zone_strategy
+
+
+@pytest.fixture(autouse=True)
+def case_insensitive_lookup():
+    pds.set_case_insensitive_lookup(True)
+    try:
+        yield
+    finally:
+        pds.set_case_insensitive_lookup(False)
+
+
+def _swap_case(key):
+    return key.swapcase()
+
+
+@hypothesis.given(key=valid_zone_strategy)
+def test_case_insensitive_timezone(key):
+    hypothesis.assume(key.lower() != "utc")
+
+    zone = pds.timezone(key)
+
+    for spelling in (key.lower(), key.upper(), _swap_case(key)):
+        assert pds.timezone(spelling) is zone
+        assert pds.is_valid_key(spelling)
+
+
+def test_canonical_key_reported():
+    zone = pds.timezone("us/eastern")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        assert zone.zone == "US/Eastern"
+
+    assert str(zone) == "US/Eastern"
+
+
+def test_both_spellings_cached(monkeypatch):
+    pds.timezone("europe/amsterdam")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Zone should have been cached")
+
+    monkeypatch.setattr(pds._compat, "get_timezone", fail)
+    monkeypatch.setattr(_sources, "available_keys", fail)
+
+    assert pds.timezone("europe/amsterdam") is pds.timezone("Europe/Amsterdam")
+
+
+def test_unknown_key():
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("america/not_a_zone")
+
+    assert not pds.is_valid_key("america/not_a_zone")
+
+
+def test_mode_disabled_is_case_sensitive():
+    pds.set_case_insensitive_lookup(False)
+
+    assert pds.timezone("America/New_York")
+    if _sources.find_zone_file("america/new_york") is None:
+        with pytest.raises(pds.UnknownTimeZoneError):
+            pds.timezone("america/new_york")
+
+
+def test_available_keys():
+    keys = _sources.available_keys()
+
+    assert "America/New_York" in keys
+    assert "posixrules" not in keys
+    assert not any(key.startswith(("posix/", "right/")) for key in keys)
+    assert all(pds.is_valid_key(key) for key in keys)
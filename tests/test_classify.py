@@ -0,0 +1,136 @@
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, enfold
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    zone = pds.build_tzinfo(key, data)
+    if PY2 or not with_table:
+        assert zone._get_transition_table() is None
+
+    return zone
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "key, dt, offset", _zoneinfo_data.get_unambiguous_cases()
+)
+def test_classify_normal(key, dt, offset, with_table):
+    zone = _get_zone(key, with_table)
+
+    classification = zone.classify(dt)
+
+    assert classification == (
+        "normal",
+        offset.utcoffset,
+        offset.utcoffset,
+        offset.dst,
+        offset.dst,
+    )
+
+
+def _transition_cases():
+    return _zoneinfo_data.get_fold_cases() + _zoneinfo_data.get_gap_cases()
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_classify_transition(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    kind = "imaginary" if zt.gap else "ambiguous"
+
+    for dt in (zt.anomaly_start, zt.anomaly_end - ONE_SECOND):
+        classification = zone.classify(dt)
+        assert classification.kind == kind
+
+        if PY2 and zt.gap:
+            # dateutil.tz does not follow PEP 495 in gaps
+            continue
+
+        assert classification[1:] == (
+            zt.offset_before.utcoffset,
+            zt.offset_after.utcoffset,
+            zt.offset_before.dst,
+            zt.offset_after.dst,
+        )
+
+    for dt, offset in (
+        (zt.anomaly_start - ONE_SECOND, zt.offset_before),
+        (zt.anomaly_end, zt.offset_after),
+    ):
+        classification = zone.classify(dt)
+        assert classification.kind == "normal"
+        assert classification.utcoffset_0 == offset.utcoffset
+        assert classification.utcoffset_1 == offset.utcoffset
+
+
+@pytest.mark.parametrize(
+    "tzinfo", [None, UTC, pds.timezone("Asia/Tokyo")], ids=repr
+)
+@pytest.mark.parametrize("fold", [0, 1])
+def test_classify_ignores_tzinfo_and_fold(tzinfo, fold):
+    zone = pds.timezone("America/New_York")
+    dt = enfold(datetime(2020, 11, 1, 1, 30, tzinfo=tzinfo), fold=fold)
+
+    classification = zone.classify(dt)
+
+    assert classification == (
+        "ambiguous",
+        timedelta(hours=-4),
+        timedelta(hours=-5),
+        timedelta(hours=1),
+        timedelta(0),
+    )
+
+
+@pytest.mark.parametrize(
+    "zone",
+    [pds.UTC, pds.fixed_offset_timezone(330), pds.timezone("Etc/GMT+5")],
+    ids=str,
+)
+def test_classify_fixed_offset(zone):
+    dt = datetime(2020, 3, 8, 2, 30)
+    offset = zone.utcoffset(dt)
+
+    assert zone.classify(dt) == (
+        "normal",
+        offset,
+        offset,
+        zone.dst(dt),
+        zone.dst(dt),
+    )
+
+
+def test_classify_no_warning():
+    zone = pds.timezone("America/New_York")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        classification = zone.classify(datetime(2020, 3, 8, 2, 30))
+
+    assert classification.kind == "imaginary"
+
+
+def test_classify_out_of_table_range():
+    zone = pds.timezone("America/New_York")
+
+    assert zone.classify(datetime(2050, 3, 13, 2, 30)).kind == "imaginary"
+    assert zone.classify(datetime(2050, 11, 6, 1, 30)).kind == "ambiguous"
+    assert zone.classify(datetime(2050, 6, 1)).kind == "normal"
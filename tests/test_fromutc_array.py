@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+
+import hypothesis
+import hypothesis.strategies as hst
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _arrays
+
+from . import _zoneinfo_data
+from ._common import UTC, dt_strategy, get_fold, valid_zone_strategy
+
+np = _arrays.np
+
+pytestmark = pytest.mark.skipif(np is None, reason="Requires NumPy")
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _assert_matches_scalar(zone, dts):
+    # dts are naive UTC datetimes
+    result = zone.fromutc_array(np.array(dts, dtype="M8[us]"))
+
+    expected = [dt.replace(tzinfo=UTC).astimezone(zone) for dt in dts]
+    assert result.local.dtype == np.dtype("M8[us]")
+    assert result.local.astype(object).tolist() == [
+        dt.replace(tzinfo=None) for dt in expected
+    ]
+    assert result.utcoffset.tolist() == [
+        int(dt.utcoffset().total_seconds()) for dt in expected
+    ]
+    assert result.dst.tolist() == [bool(dt.dst()) for dt in expected]
+    assert [result.tznames[i] for i in result.tzname_index] == [
+        dt.tzname() for dt in expected
+    ]
+    assert result.fold.tolist() == [bool(get_fold(dt)) for dt in expected]
+
+
+@pytest.mark.parametrize(
+    "key, zt", _zoneinfo_data.get_fold_cases() + _zoneinfo_data.get_gap_cases()
+)
+def test_transitions(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    transition = zt.transition_utc.replace(tzinfo=None)
+    shift = zt.offset_before.utcoffset - zt.offset_after.utcoffset
+
+    dts = [
+        transition - timedelta(days=1),
+        transition - ONE_SECOND,
+        transition,
+        transition + shift - timedelta(microseconds=1),
+        transition + shift,
+        transition + timedelta(days=1),
+    ]
+
+    _assert_matches_scalar(zone, dts)
+
+
+@hypothesis.given(
+    dts=hst.lists(dt_strategy, max_size=20), key=valid_zone_strategy
+)
+def test_matches_fromutc(dts, key):
+    _assert_matches_scalar(pds.timezone(key), dts)
+
+
+def test_after_table():
+    # Instants after 2037 are resolved by the zone, one at a time
+    zone = pds.timezone("America/New_York")
+    dts = [
+        datetime(2037, 12, 31, 12),
+        datetime(2040, 1, 1),
+        datetime(2040, 7, 1),
+        datetime(2040, 11, 4, 5, 30),
+        datetime(2040, 11, 4, 6, 30),
+    ]
+
+    _assert_matches_scalar(zone, dts)
+
+
+def test_fixed_offset():
+    zone = pds.fixed_offset_timezone(-90)
+    dts = [datetime(2020, 1, 1), datetime(2040, 1, 1)]
+
+    _assert_matches_scalar(zone, dts)
+
+
+@pytest.mark.parametrize(
+    "unit, per_second", [("s", 1), ("ms", 10 ** 3), ("ns", 10 ** 9)]
+)
+def test_integer_values(unit, per_second):
+    zone = pds.timezone("America/New_York")
+    values = np.array([1604208600, 1604212200]) * per_second
+
+    result = zone.fromutc_array(values, unit=unit)
+
+    assert result.local.dtype == np.dtype("M8[%s]" % unit)
+    assert result.local.astype("M8[s]").astype(str).tolist() == [
+        "2020-11-01T01:30:00",
+        "2020-11-01T01:30:00",
+    ]
+    assert result.fold.tolist() == [False, True]
+    assert result.utcoffset.tolist() == [-4 * 3600, -5 * 3600]
+    assert result.dst.tolist() == [True, False]
+    assert [result.tznames[i] for i in result.tzname_index] == ["EDT", "EST"]
+
+
+def test_nat():
+    zone = pds.timezone("America/New_York")
+    values = np.array(
+        [["NaT", "2020-01-01"], ["2040-01-01", "NaT"]], dtype="M8[ns]"
+    )
+
+    result = zone.fromutc_array(values)
+
+    nat = np.isnat(values)
+    assert np.isnat(result.local).tolist() == nat.tolist()
+    assert result.tzname_index[nat].tolist() == [-1, -1]
+    assert result.utcoffset.tolist() == [[0, -5 * 3600], [-5 * 3600, 0]]
+
+
+@pytest.mark.parametrize("dtype", ["f8", "M8[ps]"])
+def test_invalid_values(dtype):
+    values = np.zeros(3, dtype=dtype)
+
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").fromutc_array(values)
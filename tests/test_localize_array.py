@@ -0,0 +1,210 @@
+import warnings
+from datetime import datetime, timedelta
+
+import hypothesis
+import hypothesis.strategies as hst
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _arrays
+
+from . import _zoneinfo_data
+from ._common import (
+    PY2,
+    dt_strategy,
+    enfold,
+    get_fold,
+    valid_zone_strategy,
+)
+
+np = _arrays.np
+
+pytestmark = pytest.mark.skipif(np is None, reason="Requires NumPy")
+
+ONE_SECOND = timedelta(seconds=1)
+EPOCH = datetime(1970, 1, 1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _localize_scalar(zone, dts, is_dst):
+    # The UTC instants (in microseconds) and folds that localize returns
+    utc = []
+    folds = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pds.PytzUsageWarning)
+        for dt in dts:
+            dt_local = zone.localize(dt, is_dst=is_dst)
+            instant = dt - dt_local.utcoffset() - EPOCH
+            utc.append(instant // timedelta(microseconds=1))
+            folds.append(bool(get_fold(dt_local)))
+
+    return utc, folds
+
+
+def _assert_matches_scalar(zone, dts, is_dst):
+    values = np.array(dts, dtype="M8[us]")
+    if is_dst is pds._impl.IS_DST_SENTINEL:
+        result = zone.localize_array(values)
+    else:
+        result = zone.localize_array(values, is_dst=is_dst)
+
+    utc, folds = _localize_scalar(zone, dts, is_dst)
+    assert result.utc.dtype == np.int64
+    assert result.utc.tolist() == utc
+    assert result.fold.tolist() == folds
+
+
+def _transition_cases():
+    cases = _zoneinfo_data.get_fold_cases()
+    if not PY2:
+        # dateutil.tz does not follow PEP 495 in gaps
+        cases += _zoneinfo_data.get_gap_cases()
+
+    return cases
+
+
+def _transition_inputs(zt):
+    return [
+        zt.anomaly_start - ONE_SECOND,
+        zt.anomaly_start,
+        zt.anomaly_start + (zt.anomaly_end - zt.anomaly_start) // 2,
+        zt.anomaly_end - ONE_SECOND + timedelta(microseconds=999999),
+        zt.anomaly_end,
+    ]
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+@pytest.mark.parametrize("is_dst", [True, False, pds._impl.IS_DST_SENTINEL])
+def test_transitions(key, zt, is_dst, with_table):
+    zone = _get_zone(key, with_table)
+
+    _assert_matches_scalar(zone, _transition_inputs(zt), is_dst)
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_is_dst_none(key, zt):
+    zone = _get_zone(key, True)
+    dts = _transition_inputs(zt)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        with pytest.raises(pds.InvalidTimeError) as expected:
+            zone.localize(dts[1], is_dst=None)
+
+    with pytest.raises(type(expected.value)) as actual:
+        zone.localize_array(np.array(dts, dtype="M8[us]"), is_dst=None)
+
+    assert str(actual.value) == str(expected.value)
+
+    normal = np.array([dts[0], dts[-1]], dtype="M8[us]")
+    assert zone.localize_array(normal, is_dst=None).fold.tolist() == [
+        False,
+        False,
+    ]
+
+
+@hypothesis.given(
+    dts=hst.lists(dt_strategy, max_size=20),
+    key=valid_zone_strategy,
+    is_dst=hst.booleans(),
+)
+def test_matches_localize(dts, key, is_dst):
+    # datetime64 values have no fold
+    dts = [enfold(dt, fold=0) for dt in dts]
+
+    _assert_matches_scalar(pds.timezone(key), dts, is_dst)
+
+
+def test_after_table():
+    # Times after 2037 are resolved by the zone, one at a time
+    zone = pds.timezone("America/New_York")
+    dts = [
+        datetime(2037, 12, 31, 12),
+        datetime(2040, 3, 11, 2, 30),
+        datetime(2040, 11, 4, 1, 30),
+        datetime(2040, 7, 1),
+    ]
+
+    _assert_matches_scalar(zone, dts, True)
+    _assert_matches_scalar(zone, dts, False)
+
+
+def test_fixed_offset():
+    zone = pds.fixed_offset_timezone(330)
+    values = np.array(["2020-03-08T02:30", "2020-11-01T01:30"], dtype="M8[s]")
+
+    result = zone.localize_array(values, is_dst=None)
+
+    assert result.utc.tolist() == (values.view(np.int64) - 330 * 60).tolist()
+    assert not result.fold.any()
+
+
+@pytest.mark.parametrize(
+    "unit, per_second", [("s", 1), ("ms", 10 ** 3), ("ns", 10 ** 9)]
+)
+def test_units(unit, per_second):
+    zone = pds.timezone("America/New_York")
+    values = np.array(
+        ["2020-11-01T01:30:00.5", "2020-07-01T12:00:00.25"], dtype="M8[ns]"
+    ).astype("M8[%s]" % unit)
+
+    result = zone.localize_array(values, is_dst=False)
+
+    offsets = np.array([5 * 3600, 4 * 3600]) * per_second
+    assert result.utc.tolist() == (values.view(np.int64) + offsets).tolist()
+    assert result.fold.tolist() == [True, False]
+
+
+def test_coarse_units():
+    zone = pds.timezone("America/New_York")
+    values = np.array(["2020-01-01", "2020-07-01"], dtype="M8[D]")
+
+    result = zone.localize_array(values)
+
+    assert result.utc.tolist() == [1577854800, 1593576000]
+
+
+def test_multidimensional():
+    zone = pds.timezone("America/New_York")
+    values = np.array(
+        [["2020-11-01T01:30", "2020-01-01"], ["2040-11-04T01:30", "NaT"]],
+        dtype="M8[s]",
+    )
+
+    result = zone.localize_array(values, is_dst=False)
+
+    assert result.utc.shape == result.fold.shape == (2, 2)
+    assert result.fold.tolist() == [[True, False], [True, False]]
+
+
+def test_nat():
+    zone = pds.timezone("America/New_York")
+    values = np.array(["NaT", "2020-11-01T01:30"], dtype="M8[us]")
+
+    with pytest.raises(pds.AmbiguousTimeError):
+        zone.localize_array(values, is_dst=None)
+
+    result = zone.localize_array(values[:1], is_dst=None)
+    assert np.isnat(result.utc.view("M8[us]")).all()
+    assert not result.fold.any()
+
+
+@pytest.mark.parametrize("dtype", ["i8", "M8[ps]"])
+def test_invalid_values(dtype):
+    values = np.zeros(3, dtype=dtype)
+
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").localize_array(values)
@@ -0,0 +1,187 @@
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, get_fold
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _transition_inputs(zt):
+    # Sorted wall times on either side of and inside the anomaly
+    return [
+        zt.anomaly_start - timedelta(days=1),
+        zt.anomaly_start - ONE_SECOND,
+        zt.anomaly_start,
+        zt.anomaly_end - ONE_SECOND,
+        zt.anomaly_end,
+        zt.anomaly_end + timedelta(days=1),
+    ]
+
+
+def _localize_each(zone, dts, is_dst):
+    results = []
+    with pytest.warns(pds.PytzUsageWarning):
+        for dt in dts:
+            try:
+                results.append(zone.localize(dt, is_dst=is_dst))
+            except pds.InvalidTimeError as e:
+                results.append(type(e))
+
+    return results
+
+
+def _transition_cases():
+    cases = _zoneinfo_data.get_fold_cases()
+    if not PY2:
+        # dateutil.tz does not follow PEP 495 in gaps
+        cases += _zoneinfo_data.get_gap_cases()
+
+    return cases
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+@pytest.mark.parametrize("is_dst", [True, False])
+def test_matches_localize(key, zt, is_dst, with_table):
+    zone = _get_zone(key, with_table)
+    dts = _transition_inputs(zt)
+
+    expected = _localize_each(zone, dts, is_dst)
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts, is_dst=is_dst))
+
+    assert actual == expected
+    assert [get_fold(dt) for dt in actual] == [
+        get_fold(dt) for dt in expected
+    ]
+    assert all(dt.tzinfo is zone for dt in actual)
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_is_dst_none(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    dts = _transition_inputs(zt)
+    expected = _localize_each(zone, dts, None)
+    error = expected[2]
+    assert issubclass(error, pds.InvalidTimeError)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts, is_dst=None, on_error="none"))
+
+    assert actual == [None if dt is error else dt for dt in expected]
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts, is_dst=None, on_error="skip"))
+
+    assert actual == [dt for dt in expected if dt is not error]
+
+    with pytest.warns(pds.PytzUsageWarning):
+        results = zone.localize_many(dts, is_dst=None)
+
+    assert next(results) == expected[0]
+    assert next(results) == expected[1]
+    with pytest.raises(error):
+        next(results)
+
+
+def test_default_is_dst():
+    zone = pds.timezone("America/New_York")
+    dts = [datetime(2020, 3, 8, 2, 30), datetime(2020, 11, 1, 1, 30)]
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts))
+
+    assert actual == [dt.replace(tzinfo=zone) for dt in dts]
+    assert [get_fold(dt) for dt in actual] == [0, 0]
+
+
+def test_single_warning():
+    zone = pds.timezone("America/New_York")
+    start = datetime(2020, 1, 1)
+    dts = (start + timedelta(hours=i) for i in range(24 * 366))
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        results = list(zone.localize_many(dts, is_dst=None, on_error="none"))
+
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, pds.PytzUsageWarning)
+    assert caught[0].filename == __file__
+    assert len(results) == 24 * 366
+    assert results.count(None) == 2
+
+
+def test_lazy():
+    zone = pds.timezone("America/New_York")
+
+    def dts():
+        yield datetime(2020, 1, 1)
+        raise AssertionError("Consumed too far")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        results = zone.localize_many(dts(), is_dst=None)
+
+    assert next(results) == datetime(2020, 1, 1, tzinfo=zone)
+
+
+def test_unsorted():
+    zone = pds.timezone("America/New_York")
+    dts = [
+        datetime(2020, 7, 1),
+        datetime(2020, 1, 1),
+        datetime(2020, 11, 1, 1, 30),
+        datetime(2021, 7, 1),
+        datetime(2020, 7, 2),
+    ]
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts, is_dst=False))
+
+    assert actual == _localize_each(zone, dts, False)
+    assert [dt.utcoffset() for dt in actual] == [
+        timedelta(hours=hours) for hours in (-4, -5, -5, -4, -4)
+    ]
+
+
+def test_fixed_offset():
+    zone = pds.fixed_offset_timezone(330)
+    dts = [datetime(2020, 3, 8, 2, 30), datetime(2020, 11, 1, 1, 30)]
+
+    with pytest.warns(pds.PytzUsageWarning):
+        actual = list(zone.localize_many(dts, is_dst=None))
+
+    assert actual == [dt.replace(tzinfo=zone) for dt in dts]
+
+
+def test_unknown_on_error():
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").localize_many([], on_error="ignore")
+
+
+def test_not_naive():
+    zone = pds.timezone("America/New_York")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        results = zone.localize_many([datetime(2020, 1, 1, tzinfo=UTC)])
+
+    with pytest.raises(ValueError):
+        next(results)
@@ -0,0 +1,154 @@
+import gc
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _impl
+
+from ._common import PY2
+
+KEYS = ["America/New_York", "Europe/London", "Asia/Kolkata", "Australia/Perth"]
+
+
+@pytest.mark.parametrize("workers", [None, 1, 4])
+def test_preload_fills_cache(workers):
+    pds.clear_cache(only_keys=KEYS)
+
+    result = pds.preload(KEYS, workers=workers)
+
+    assert set(result.loaded) == set(KEYS)
+    assert not result.failed
+    assert all(elapsed >= 0 for elapsed in result.loaded.values())
+
+    before = pds.cache_info()["timezone"]
+    for key in KEYS:
+        assert str(pds.timezone(key)) == key
+    after = pds.cache_info()["timezone"]
+
+    assert after.hits == before.hits + len(KEYS)
+    assert after.misses == before.misses
+
+
+def test_preload_reports_failures():
+    result = pds.preload(["Europe/Paris", "Not/A_Zone", "Europe/Paris"])
+
+    assert list(result.loaded) == ["Europe/Paris"]
+    assert list(result.failed) == ["Not/A_Zone"]
+    assert isinstance(result.failed["Not/A_Zone"], pds.UnknownTimeZoneError)
+
+
+def test_preload_all():
+    result = pds.preload(workers=2)
+
+    assert not result.failed
+    assert "America/Chicago" in result.loaded
+    assert len(result.loaded) > 100
+
+
+def test_preload_empty():
+    assert pds.preload([]) == ({}, {})
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_preload_invalid_workers(workers):
+    with pytest.raises(ValueError):
+        pds.preload(KEYS, workers=workers)
+
+
+def test_preload_from_environment():
+    environ = {
+        _impl.PRELOAD_ENV_VAR: " Asia/Tokyo, Europe/Rome ,",
+        _impl.PRELOAD_WORKERS_ENV_VAR: "2",
+    }
+
+    result = _impl._preload_from_environment(environ)
+
+    assert set(result.loaded) == {"Asia/Tokyo", "Europe/Rome"}
+
+
+def test_preload_from_environment_unset():
+    assert _impl._preload_from_environment({}) is None
+
+
+def test_preload_from_environment_warnings():
+    environ = {
+        _impl.PRELOAD_ENV_VAR: "Asia/Tokyo,Not/A_Zone",
+        _impl.PRELOAD_WORKERS_ENV_VAR: "many",
+    }
+
+    with pytest.warns(RuntimeWarning) as record:
+        result = _impl._preload_from_environment(environ)
+
+    assert len(record) == 2
+    assert list(result.failed) == ["Not/A_Zone"]
+
+
+def test_preload_at_import():
+    env = dict(os.environ)
+    env[_impl.PRELOAD_ENV_VAR] = "America/Denver"
+
+    code = (
+        "import pytz_deprecation_shim as pds; "
+        + "print(pds.cache_info()['timezone'].currsize)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], env=env)
+
+    assert int(output.decode().strip()) == 1
+
+
+@pytest.fixture
+def no_freeze(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append(True), raising=False)
+    return calls
+
+
+def test_prepare_for_fork(no_freeze):
+    pds.clear_cache(only_keys=KEYS)
+
+    result = pds.prepare_for_fork(KEYS, workers=2)
+
+    assert set(result.loaded) == set(KEYS)
+    assert no_freeze == [True]
+
+
+def test_prepare_for_fork_no_freeze(no_freeze):
+    pds.prepare_for_fork(KEYS, freeze=False)
+
+    assert no_freeze == []
+
+
+@pytest.mark.skipif(PY2, reason="ZoneInfo subclass mode requires zoneinfo")
+def test_prepare_for_fork_subclass_mode(no_freeze):
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        pds.prepare_for_fork(KEYS)
+        shims = [pds.timezone(key) for key in KEYS]
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    assert all("_unwrapped" in shim.__dict__ for shim in shims)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_prepare_for_fork_child_uses_cache(no_freeze):
+    pds.prepare_for_fork(KEYS)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: nocover
+        status = 1
+        try:
+            misses = pds.cache_info()["timezone"].misses
+            for key in KEYS:
+                pds.timezone(key)
+            if pds.cache_info()["timezone"].misses == misses:
+                status = 0
+        finally:
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status)
+    assert os.WEXITSTATUS(status) == 0
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2
+
+pytestmark = pytest.mark.skipif(
+    PY2, reason="Relies on zoneinfo.reset_tzpath to control the search path"
+)
+
+KEY = "Test/Reload_Zone"
+
+
+def _write_zone(tzpath, source_key):
+    path = os.path.join(tzpath, KEY)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_zoneinfo_data.get_zone_file_obj(source_key).read())
+
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture
+def tzpath():
+    try:
+        import zoneinfo
+    except ImportError:
+        from backports import zoneinfo
+
+    tmp_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(tmp_dir, os.path.dirname(KEY)))
+    _write_zone(tmp_dir, "Asia/Tokyo")
+
+    old_tzpath = zoneinfo.TZPATH
+    zoneinfo.reset_tzpath([tmp_dir])
+    pds.clear_cache(only_keys=[KEY])
+    zoneinfo.ZoneInfo.clear_cache(only_keys=[KEY])
+    try:
+        yield tmp_dir
+    finally:
+        pds.set_reload_interval(None)
+        zoneinfo.reset_tzpath(old_tzpath)
+        pds.clear_cache(only_keys=[KEY])
+        zoneinfo.ZoneInfo.clear_cache(only_keys=[KEY])
+        shutil.rmtree(tmp_dir)
+
+
+def _offset(zone):
+    return datetime(2020, 1, 1, tzinfo=zone).utcoffset()
+
+
+def test_reload_changed_zone(tzpath):
+    pds.set_reload_interval(3600)
+
+    zone = pds.timezone(KEY)
+    assert _offset(zone) == _offset(pds.timezone("Asia/Tokyo"))
+
+    assert pds.reload_zones() == []
+
+    _write_zone(tzpath, "America/Los_Angeles")
+    assert pds.reload_zones() == [KEY]
+
+    new_zone = pds.timezone(KEY)
+    assert new_zone is not zone
+    assert _offset(new_zone) == _offset(pds.timezone("America/Los_Angeles"))
+
+    # The stale shim keeps working with the data it was built from
+    assert _offset(zone) == _offset(pds.timezone("Asia/Tokyo"))
+
+
+def test_reload_identical_contents(tzpath):
+    pds.set_reload_interval(3600)
+    zone = pds.timezone(KEY)
+
+    _write_zone(tzpath, "Asia/Tokyo")
+
+    assert pds.reload_zones() == []
+    assert pds.timezone(KEY) is zone
+
+
+def test_automatic_reload_hook(tzpath):
+    calls = []
+    pds.add_reload_hook(calls.append)
+    try:
+        pds.set_reload_interval(0)
+        zone = pds.timezone(KEY)
+
+        _write_zone(tzpath, "America/Los_Angeles")
+        new_zone = pds.timezone(KEY)
+    finally:
+        pds.remove_reload_hook(calls.append)
+
+    assert calls == [[KEY]]
+    assert new_zone is not zone
+
+
+def test_reload_interval_limits_checks(tzpath):
+    pds.set_reload_interval(3600)
+    zone = pds.timezone(KEY)
+
+    _write_zone(tzpath, "America/Los_Angeles")
+
+    # The interval has not elapsed, so timezone() must not notice the change
+    assert pds.timezone(KEY) is zone
+
+
+def test_enable_after_load(tzpath):
+    zone = pds.timezone(KEY)
+    pds.set_reload_interval(3600)
+
+    _write_zone(tzpath, "America/Los_Angeles")
+
+    assert pds.reload_zones() == [KEY]
+    assert pds.timezone(KEY) is not zone
+
+
+def test_removed_zone_keeps_shim(tzpath):
+    pds.set_reload_interval(3600)
+    zone = pds.timezone(KEY)
+
+    os.remove(os.path.join(tzpath, KEY))
+
+    assert pds.reload_zones() == [KEY]
+    assert pds.timezone(KEY) is zone
+
+
+def test_hook_exception_warns(tzpath):
+    def bad_hook(keys):
+        raise ValueError(keys)
+
+    pds.add_reload_hook(bad_hook)
+    try:
+        pds.set_reload_interval(3600)
+        pds.timezone(KEY)
+        _write_zone(tzpath, "America/Los_Angeles")
+
+        with pytest.warns(RuntimeWarning):
+            assert pds.reload_zones() == [KEY]
+    finally:
+        pds.remove_reload_hook(bad_hook)
+
+
+def test_negative_interval():
+    with pytest.raises(ValueError):
+        pds.set_reload_interval(-1)
@@ -0,0 +1,99 @@
+import multiprocessing
+from datetime import datetime
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _shared
+
+pytestmark = pytest.mark.skipif(
+    _shared.shared_memory is None,
+    reason="Requires multiprocessing.shared_memory",
+)
+
+KEYS = ["America/Sao_Paulo", "Asia/Kathmandu", "Europe/Moscow"]
+
+
+@pytest.fixture
+def segment():
+    name = pds.publish_shared_zones(KEYS)
+    try:
+        yield name
+    finally:
+        pds.use_bundle(None)
+        pds.unpublish_shared_zones(name)
+
+
+def _worker_offsets(args):
+    key, dt = args
+    zone = pds.timezone(key)
+    return str(zone), dt.replace(tzinfo=zone).utcoffset()
+
+
+def test_attach_in_same_process(segment):
+    expected = [_worker_offsets((key, datetime(2010, 1, 1))) for key in KEYS]
+
+    assert pds.attach_shared_zones(segment) == sorted(KEYS)
+
+    actual = [_worker_offsets((key, datetime(2010, 1, 1))) for key in KEYS]
+    assert actual == expected
+
+
+def test_attach_exclusive(segment):
+    pds.attach_shared_zones(segment, exclusive=True)
+
+    assert pds.is_valid_key("Asia/Kathmandu")
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Asia/Tokyo")
+
+
+def test_attach_in_worker_processes(segment):
+    cases = [
+        (key, datetime(year, 7, 1)) for key in KEYS for year in (1990, 2020)
+    ]
+    expected = [_worker_offsets(case) for case in cases]
+
+    context = multiprocessing.get_context("spawn")
+    pool = context.Pool(
+        2, initializer=pds.attach_shared_zones, initargs=(segment, True)
+    )
+    try:
+        actual = pool.map(_worker_offsets, cases)
+    finally:
+        pool.close()
+        pool.join()
+
+    assert actual == expected
+
+
+def test_publish_cached_zones():
+    pds.clear_cache()
+    pds.timezone("Africa/Nairobi")
+    pds.timezone("UTC")
+
+    name = pds.publish_shared_zones()
+    try:
+        assert pds.attach_shared_zones(name) == ["Africa/Nairobi"]
+    finally:
+        pds.use_bundle(None)
+        pds.unpublish_shared_zones(name)
+
+
+def test_republish_from_bundle(segment):
+    pds.attach_shared_zones(segment, exclusive=True)
+
+    name = pds.publish_shared_zones(["Europe/Moscow", "Europe/Paris"])
+    try:
+        assert pds.attach_shared_zones(name) == ["Europe/Moscow"]
+    finally:
+        pds.unpublish_shared_zones(name)
+
+
+def test_attach_missing_segment():
+    with pytest.raises(OSError):
+        pds.attach_shared_zones("pds_no_such_segment")
+
+
+def test_unpublish_unknown_segment():
+    with pytest.raises(KeyError):
+        pds.unpublish_shared_zones("pds_no_such_segment")
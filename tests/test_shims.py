@@ -14,6 +14,7 @@ from ._common import (
     MAX_DATETIME,
     MIN_DATETIME,
     PY2,
+    UTC,
     assert_dt_equivalent,
     assert_dt_offset,
     conditional_examples,
@@ -394,3 +395,56 @@ def test_pickle_returns_same_object(key):
 
 def test_utc_alias():
     assert pds.utc is pds.UTC
+
+
+@hypothesis.given(minutes=offset_minute_strategy, dt=dt_strategy)
+def test_fixed_offset_tzinfo_methods(minutes, dt):
+    """Tests that the fixed offset shims agree with the zones they wrap."""
+    shim_zone = pds.fixed_offset_timezone(minutes)
+    zone = shim_zone.unwrap_shim()
+
+    dt_shim = dt.replace(tzinfo=shim_zone)
+    dt_zone = dt.replace(tzinfo=zone)
+
+    assert dt_shim.utcoffset() == dt_zone.utcoffset()
+    assert dt_shim.dst() == dt_zone.dst()
+    assert dt_shim.tzname() == dt_zone.tzname()
+
+    dt_utc = dt.replace(tzinfo=UTC)
+    dt_shim_from_utc = dt_utc.astimezone(shim_zone)
+    assert dt_shim_from_utc.tzinfo is shim_zone
+    assert dt_shim_from_utc.replace(tzinfo=None) == dt_utc.astimezone(
+        zone
+    ).replace(tzinfo=None)
+
+
+@hypothesis.given(
+    minutes=offset_minute_strategy,
+    dt=dt_strategy,
+    is_dst=hst.sampled_from([True, False, None]),
+)
+def test_fixed_offset_localize(minutes, dt, is_dst):
+    shim_zone = pds.fixed_offset_timezone(minutes)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        dt_localized = shim_zone.localize(dt, is_dst=is_dst)
+
+    assert dt_localized == dt.replace(tzinfo=shim_zone)
+    assert dt_localized.tzinfo is shim_zone
+
+
+def test_utc_fromutc():
+    dt = datetime(2020, 1, 1, 12, tzinfo=pds.UTC)
+
+    assert pds.UTC.fromutc(dt) is dt
+    assert datetime(2020, 1, 1, 12, tzinfo=UTC).astimezone(pds.UTC) == dt
+
+
+@hypothesis.given(minutes=offset_minute_strategy)
+def test_fixed_offset_pickle_round_trip(minutes):
+    shim_zone = pds.fixed_offset_timezone(minutes)
+
+    shim_copy = pickle.loads(pickle.dumps(shim_zone))
+
+    assert type(shim_copy) is type(shim_zone)
+    assert shim_copy.utcoffset(None) == shim_zone.utcoffset(None)
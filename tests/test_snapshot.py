@@ -0,0 +1,200 @@
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _bundle, _impl, _sources
+
+from . import _zoneinfo_data
+from ._common import PY2
+
+KEYS = ["America/New_York", "Europe/London", "Australia/Lord_Howe"]
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot(monkeypatch):
+    monkeypatch.setattr(_impl, "_SNAPSHOT", None)
+    pds.clear_cache()
+    yield
+    pds.clear_cache()
+
+
+@pytest.fixture
+def tmp_dir():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        yield tmp_dir
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def _offsets(zone):
+    dt = datetime(1970, 1, 1)
+    offsets = []
+    while dt.year < 2040:
+        offsets.append(dt.replace(tzinfo=zone).utcoffset())
+        dt += timedelta(days=17, hours=5)
+    return offsets
+
+
+def test_snapshot_round_trip(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.snapshot")
+    expected = {key: _offsets(pds.timezone(key)) for key in KEYS}
+
+    assert pds.save_snapshot(path) == sorted(KEYS)
+
+    pds.clear_cache()
+    assert pds.load_snapshot(path) == sorted(KEYS)
+
+    for key in KEYS:
+        zone = pds.timezone(key)
+        assert str(zone) == key
+        assert _offsets(zone) == expected[key]
+
+        # Zones built from files cannot normally be pickled, but these are
+        # pickled by key.
+        assert pickle.loads(pickle.dumps(zone)) is zone
+
+
+def test_snapshot_explicit_keys(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.snapshot")
+
+    keys = pds.save_snapshot(path, keys=["Asia/Tokyo", "Not/A_Zone"])
+    assert keys == ["Asia/Tokyo"]
+    assert pds.load_snapshot(path) == ["Asia/Tokyo"]
+
+    # Keys that are not in the snapshot are loaded from the provider
+    assert str(pds.timezone("Asia/Kolkata")) == "Asia/Kolkata"
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Not/A_Zone")
+
+
+@pytest.mark.skipif(PY2, reason="ZoneInfo subclass mode requires zoneinfo")
+def test_snapshot_subclass_mode(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.snapshot")
+    pds.save_snapshot(path, keys=KEYS)
+    pds.load_snapshot(path)
+
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        zone = pds.timezone(KEYS[0])
+        assert isinstance(zone, _impl._ZoneInfoShimTimezone)
+        assert zone.unwrap_shim().key == KEYS[0]
+        assert pickle.loads(pickle.dumps(zone)) is zone
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"PDSZ",
+        b"Not a snapshot at all",
+        b"PDSZ\x00\x63\x00\x00\x00\x00",
+        b"PDSZ\x00\x01\x00\x00\x00\x10{}",
+        b"PDSZ\x00\x01\x00\x00\x00\x02[]",
+    ],
+)
+def test_invalid_snapshot_ignored(tmp_dir, contents):
+    path = os.path.join(tmp_dir, "zones.snapshot")
+    with open(path, "wb") as f:
+        f.write(contents)
+
+    assert pds.load_snapshot(path) == []
+    assert _impl._SNAPSHOT is None
+
+
+def test_missing_snapshot_ignored(tmp_dir):
+    assert pds.load_snapshot(os.path.join(tmp_dir, "missing")) == []
+
+
+def test_snapshot_other_data_version(tmp_dir, monkeypatch):
+    path = os.path.join(tmp_dir, "zones.snapshot")
+    pds.save_snapshot(path, keys=KEYS)
+
+    identity = _sources.get_data_identity() + [["elsewhere", "1970a"]]
+    monkeypatch.setattr(_sources, "get_data_identity", lambda: identity)
+
+    assert pds.load_snapshot(path) == []
+
+
+def test_bundle_deduplicates_data(tmp_dir):
+    path = os.path.join(tmp_dir, "zones.bundle")
+    data = _zoneinfo_data.get_zone_file_obj("Asia/Tokyo").read()
+
+    _bundle.write_bundle_file(
+        path, [("Asia/Tokyo", data), ("Japan", data)], metadata={"a": 1}
+    )
+    bundle = _bundle.Bundle.open(path)
+    try:
+        assert sorted(bundle.keys()) == ["Asia/Tokyo", "Japan"]
+        assert bundle.metadata == {"a": 1}
+        assert bytes(bundle.get("Japan")) == data
+        assert bundle.get("Europe/Paris") is None
+    finally:
+        bundle.close()
+
+    assert os.path.getsize(path) < 2 * len(data)
+
+
+@pytest.mark.skipif(
+    PY2, reason="Relies on zoneinfo.reset_tzpath to control the search path"
+)
+class TestStaleZones(object):
+    KEY = "Test/Snapshot_Zone"
+
+    @pytest.fixture
+    def tzpath(self, tmp_dir):
+        try:
+            import zoneinfo
+        except ImportError:
+            from backports import zoneinfo
+
+        tzpath = os.path.join(tmp_dir, "zoneinfo")
+        os.makedirs(os.path.join(tzpath, os.path.dirname(self.KEY)))
+        self._write_zone(tzpath, "Asia/Tokyo")
+
+        old_tzpath = zoneinfo.TZPATH
+        zoneinfo.reset_tzpath([tzpath])
+        try:
+            yield tzpath
+        finally:
+            zoneinfo.reset_tzpath(old_tzpath)
+            zoneinfo.ZoneInfo.clear_cache(only_keys=[self.KEY])
+
+    def _write_zone(self, tzpath, source_key):
+        with open(os.path.join(tzpath, self.KEY), "wb") as f:
+            f.write(_zoneinfo_data.get_zone_file_obj(source_key).read())
+
+    def test_changed_zone_ignored(self, tmp_dir, tzpath):
+        path = os.path.join(tmp_dir, "zones.snapshot")
+        assert pds.save_snapshot(path, keys=[self.KEY, "Not/A_Zone"]) == [
+            self.KEY
+        ]
+
+        self._write_zone(tzpath, "America/Los_Angeles")
+        assert pds.load_snapshot(path) == []
+
+    def test_touched_zone_used(self, tmp_dir, tzpath):
+        path = os.path.join(tmp_dir, "zones.snapshot")
+        pds.save_snapshot(path, keys=[self.KEY])
+
+        os.utime(os.path.join(tzpath, self.KEY), (0, 0))
+        assert pds.load_snapshot(path) == [self.KEY]
+
+    def test_search_path_changed(self, tmp_dir, tzpath):
+        try:
+            import zoneinfo
+        except ImportError:
+            from backports import zoneinfo
+
+        path = os.path.join(tmp_dir, "zones.snapshot")
+        pds.save_snapshot(path, keys=[self.KEY])
+
+        zoneinfo.reset_tzpath([tzpath, tmp_dir])
+        assert pds.load_snapshot(path) == []
@@ -0,0 +1,242 @@
+from datetime import timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+from pytz_deprecation_shim import _transitions
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, enfold, get_fold
+
+pytestmark = pytest.mark.skipif(
+    PY2,
+    reason="dateutil.tz resolves times in gaps differently, so no tables are "
+    + "built for zones with gaps",
+)
+
+ONE_SECOND = timedelta(seconds=1)
+
+
+def _zone_data(key):
+    return _zoneinfo_data.get_zone_file_obj(key).read()
+
+
+def _get_table(key):
+    table = pds.build_tzinfo(key, _zone_data(key))._get_transition_table()
+    assert table is not None
+
+    return table
+
+
+def _assert_ttinfo(ttinfo, offset):
+    assert ttinfo == (offset.utcoffset, offset.dst, offset.tzname)
+
+
+def _timestamp(dt):
+    return _transitions.to_timestamp(dt)
+
+
+def _covered(dt):
+    return dt.year < 2037
+
+
+@pytest.mark.parametrize(
+    "key, dt, offset",
+    [
+        case
+        for case in _zoneinfo_data.get_unambiguous_cases()
+        if case[0] != "UTC" and _covered(case[1])
+    ],
+)
+def test_unambiguous(key, dt, offset):
+    table = _get_table(key)
+
+    interval_0, interval_1 = table.find_local(_timestamp(dt))
+    assert interval_0 == interval_1
+    _assert_ttinfo(table.ttinfo(interval_0), offset)
+
+
+def _transition_cases():
+    return [
+        (key, zt)
+        for key, zt in _zoneinfo_data.get_fold_cases()
+        + _zoneinfo_data.get_gap_cases()
+        if _covered(zt.transition)
+    ]
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_local_transitions(key, zt):
+    table = _get_table(key)
+
+    for dt in (zt.anomaly_start, zt.anomaly_end - ONE_SECOND):
+        interval_0, interval_1 = table.find_local(_timestamp(dt))
+        assert interval_1 == interval_0 + 1
+        assert table.is_gap(interval_0) == zt.gap
+        _assert_ttinfo(table.ttinfo(interval_0), zt.offset_before)
+        _assert_ttinfo(table.ttinfo(interval_1), zt.offset_after)
+
+    for dt, offset in (
+        (zt.anomaly_start - ONE_SECOND, zt.offset_before),
+        (zt.anomaly_end, zt.offset_after),
+    ):
+        interval_0, interval_1 = table.find_local(_timestamp(dt))
+        assert interval_0 == interval_1
+        _assert_ttinfo(table.ttinfo(interval_0), offset)
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_utc_transitions(key, zt):
+    table = _get_table(key)
+    timestamp = _timestamp(zt.transition_utc)
+
+    interval = table.find_utc(timestamp - 1)
+    _assert_ttinfo(table.ttinfo(interval), zt.offset_before)
+    assert table.fold_from_utc(timestamp - 1, interval) == 0
+
+    interval = table.find_utc(timestamp)
+    _assert_ttinfo(table.ttinfo(interval), zt.offset_after)
+    assert table.fold_from_utc(timestamp, interval) == int(zt.fold)
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_utc_window(key, zt):
+    table = _get_table(key)
+    timestamp = _timestamp(zt.transition_utc)
+
+    low, high, interval, fold = table.utc_window(timestamp - 1)
+    assert low < timestamp - 1
+    assert high == timestamp
+    _assert_ttinfo(table.ttinfo(interval), zt.offset_before)
+    assert fold == 0
+
+    low, high, interval, fold = table.utc_window(timestamp)
+    assert low == timestamp
+    _assert_ttinfo(table.ttinfo(interval), zt.offset_after)
+    assert fold == int(zt.fold)
+    if zt.fold:
+        shift = zt.offset_before.utcoffset - zt.offset_after.utcoffset
+        assert high == timestamp + shift.total_seconds()
+
+        low, _, _, fold = table.utc_window(high)
+        assert low == high
+        assert fold == 0
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+def test_normal_window(key, zt):
+    table = _get_table(key)
+    start = _timestamp(zt.anomaly_start)
+    end = _timestamp(zt.anomaly_end)
+
+    assert table.normal_window(start) is None
+    assert table.normal_window(end - 1) is None
+
+    low, high = table.normal_window(start - 1)
+    assert low < start - 1
+    assert high == start
+
+    low, high = table.normal_window(end)
+    assert low == end
+    assert high > end
+
+
+@pytest.mark.parametrize("key, zt", _transition_cases())
+@pytest.mark.parametrize("is_dst", [True, False, None])
+def test_localize_matches_zone(key, zt, is_dst):
+    # Shims built from file objects do not keep the data for a table
+    zone = pds.build_tzinfo(key, _zone_data(key))
+    zone_no_table = pds.build_tzinfo(key, _zoneinfo_data.get_zone_file_obj(key))
+    assert zone_no_table._get_transition_table() is None
+
+    def localize(zone, dt):
+        with pytest.warns(pds.PytzUsageWarning):
+            try:
+                dt = zone.localize(dt, is_dst=is_dst)
+            except pds.InvalidTimeError as e:
+                return type(e)
+
+        return dt.replace(tzinfo=None), get_fold(dt), dt.utcoffset()
+
+    for dt in (zt.anomaly_start, zt.anomaly_end - ONE_SECOND):
+        for fold in (0, 1):
+            dt = enfold(dt, fold=fold)
+            assert localize(zone, dt) == localize(zone_no_table, dt)
+
+
+def test_out_of_range():
+    zone = pds.timezone("America/New_York")
+    table = zone._get_transition_table()
+
+    assert table.find_utc(_timestamp(_transitions.EPOCH.replace(2038))) is None
+    assert (
+        table.find_local(_timestamp(_transitions.EPOCH.replace(2040))) is None
+    )
+
+
+def test_timezone_table():
+    zone = pds.timezone("America/New_York")
+    table = zone._get_transition_table()
+
+    assert table is not None
+    assert zone._get_transition_table() is table
+
+    dt = _transitions.EPOCH.replace(2020, 6, 1)
+    interval = table.find_utc(_timestamp(dt))
+    expected = dt.replace(tzinfo=UTC).astimezone(zone)
+    assert table.ttinfo(interval) == (
+        expected.utcoffset(),
+        expected.dst(),
+        expected.tzname(),
+    )
+
+
+def test_mismatched_data():
+    zone = pds.build_tzinfo("Europe/London", _zone_data("Europe/London"))
+
+    table = _transitions.build_table(zone, _zone_data("America/Los_Angeles"))
+    assert table is None
+
+
+def test_invalid_data():
+    zone = pds.build_tzinfo("Europe/London", _zone_data("Europe/London"))
+
+    assert _transitions.build_table(zone, b"Not a zone file") is None
+    assert (
+        _transitions.build_table(zone, _zone_data("Europe/London")[:60]) is None
+    )
+
+
+@pytest.mark.parametrize(
+    "footer, year, expected",
+    [
+        # Northern hemisphere, with the default transition time
+        ("EST5EDT,M3.2.0,M11.1.0", 2020, [(3, 8, 7), (11, 1, 6)]),
+        # Southern hemisphere, with an explicit transition time
+        ("AEST-10AEDT,M10.1.0,M4.1.0/3", 2020, [(4, 4, 16), (10, 3, 16)]),
+        # Negative DST, as in Europe/Dublin
+        ("IST-1GMT0,M10.5.0,M3.5.0/1", 2021, [(3, 28, 1), (10, 31, 1)]),
+        # Negative transition times
+        ("<-02>2<-01>,M3.5.0/-1,M10.5.0/0", 2024, [(3, 31, 1), (10, 27, 1)]),
+        # Julian days, not counting February 29th
+        ("XST3XDT,J60/0,J300/0", 2020, [(3, 1, 3), (10, 27, 2)]),
+        # Zero-based days, counting February 29th
+        ("XST3XDT,59/0,299/0", 2020, [(2, 29, 3), (10, 26, 2)]),
+    ],
+)
+def test_footer_transitions(footer, year, expected):
+    start = _timestamp(_transitions.EPOCH.replace(year))
+    end = _timestamp(_transitions.EPOCH.replace(year + 1))
+
+    transitions = _transitions._footer_transitions(footer, start, end)
+
+    assert [
+        _transitions.EPOCH + timedelta(seconds=t) for t, _ in transitions
+    ] == [_transitions.EPOCH.replace(year, *dt) for dt in expected]
+
+
+@pytest.mark.parametrize("footer", ["<+0330>-3:30", "", "Not a TZ string"])
+def test_footer_without_transitions(footer):
+    transitions = _transitions._footer_transitions(footer, 0, 10**9)
+
+    assert transitions == ([] if footer == "<+0330>-3:30" else None)
@@ -0,0 +1,145 @@
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import PY2, UTC, get_fold
+
+ONE_SECOND = timedelta(seconds=1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+POLICIES = ["none", "earliest", "latest", "shift_forward", "shift_backward"]
+
+
+def _get_zone(key, with_table):
+    # Shims built from file objects do not keep the data for a table
+    if with_table:
+        data = _zoneinfo_data.get_zone_file_obj(key).read()
+    else:
+        data = _zoneinfo_data.get_zone_file_obj(key)
+
+    return pds.build_tzinfo(key, data)
+
+
+@pytest.fixture(params=[True, False], ids=["table", "no_table"])
+def with_table(request):
+    return request.param
+
+
+def _instant(dt):
+    return dt.replace(tzinfo=None) - dt.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "key, dt, offset", _zoneinfo_data.get_unambiguous_cases()
+)
+@pytest.mark.parametrize("policy", POLICIES)
+def test_normal(key, dt, offset, policy):
+    zone = _get_zone(key, True)
+
+    dt_out, status = zone.try_localize(dt, policy)
+
+    assert status == "normal"
+    assert dt_out == dt.replace(tzinfo=zone)
+    assert dt_out.tzinfo is zone
+    assert dt_out.utcoffset() == offset.utcoffset
+
+
+@pytest.mark.parametrize("key, zt", _zoneinfo_data.get_fold_cases())
+def test_fold(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    dt = zt.anomaly_start + (zt.anomaly_end - zt.anomaly_start) // 2
+
+    assert zone.try_localize(dt) == (None, "ambiguous")
+
+    earliest, status = zone.try_localize(dt, "earliest")
+    assert status == "ambiguous"
+    latest, status = zone.try_localize(dt, "latest")
+    assert status == "ambiguous"
+
+    assert earliest.replace(tzinfo=None) == latest.replace(tzinfo=None) == dt
+    assert _instant(earliest) < _instant(latest)
+    assert (get_fold(earliest), get_fold(latest)) == (0, 1)
+
+    assert zone.try_localize(dt, "shift_backward") == (earliest, "ambiguous")
+    assert zone.try_localize(dt, "shift_forward") == (latest, "ambiguous")
+
+
+@pytest.mark.skipif(PY2, reason="dateutil.tz does not follow PEP 495 in gaps")
+@pytest.mark.parametrize("key, zt", _zoneinfo_data.get_gap_cases())
+def test_gap(key, zt, with_table):
+    zone = _get_zone(key, with_table)
+    dt = zt.anomaly_start + (zt.anomaly_end - zt.anomaly_start) // 2
+
+    assert zone.try_localize(dt) == (None, "imaginary")
+
+    earliest, _ = zone.try_localize(dt, "earliest")
+    latest, _ = zone.try_localize(dt, "latest")
+    assert earliest.replace(tzinfo=None) == latest.replace(tzinfo=None) == dt
+    assert earliest.utcoffset() == zt.offset_after.utcoffset
+    assert latest.utcoffset() == zt.offset_before.utcoffset
+
+    dt_out, status = zone.try_localize(dt, "shift_forward")
+    assert status == "imaginary"
+    assert dt_out.replace(tzinfo=None) == zt.anomaly_end
+    assert dt_out.utcoffset() == zt.offset_after.utcoffset
+    assert _instant(dt_out) == zt.transition_utc.replace(tzinfo=None)
+
+    dt_out, status = zone.try_localize(dt, "shift_backward")
+    assert status == "imaginary"
+    assert dt_out.replace(tzinfo=None) == zt.anomaly_start - ONE_MICROSECOND
+    assert dt_out.utcoffset() == zt.offset_before.utcoffset
+    assert (
+        _instant(dt_out)
+        == zt.transition_utc.replace(tzinfo=None) - ONE_MICROSECOND
+    )
+
+
+@pytest.mark.parametrize(
+    "is_dst, policy", [(True, "earliest"), (False, "latest")]
+)
+def test_matches_localize(is_dst, policy):
+    # In zones with ordinary (positive) DST, the earliest side of a fold is
+    # the DST side
+    zone = pds.timezone("America/New_York")
+    dt = datetime(2020, 11, 1, 1, 30)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        expected = zone.localize(dt, is_dst=is_dst)
+
+    assert zone.try_localize(dt, policy) == (expected, "ambiguous")
+
+
+def test_no_warning():
+    zone = pds.timezone("America/New_York")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = zone.try_localize(datetime(2020, 3, 8, 2, 30))
+
+    assert result.dt is None
+    assert result.status == "imaginary"
+
+
+def test_fixed_offset():
+    zone = pds.fixed_offset_timezone(330)
+    dt = datetime(2020, 3, 8, 2, 30)
+
+    assert zone.try_localize(dt) == (dt.replace(tzinfo=zone), "normal")
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").try_localize(
+            datetime(2020, 1, 1), "raise"
+        )
+
+
+def test_not_naive():
+    with pytest.raises(ValueError):
+        pds.timezone("America/New_York").try_localize(
+            datetime(2020, 1, 1, tzinfo=UTC)
+        )
@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta
+
+import hypothesis
+import pytest
+
+import pytz_deprecation_shim as pds
+
+from . import _zoneinfo_data
+from ._common import (
+    PY2,
+    assert_dt_equivalent,
+    assert_dt_offset,
+    dt_strategy,
+    enfold,
+    valid_zone_strategy,
+)
+
+pytestmark = pytest.mark.skipif(
+    PY2, reason="zoneinfo is not available on Python 2"
+)
+
+
+@pytest.fixture
+def zoneinfo_subclass_mode():
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        yield
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_timezone_is_zoneinfo():
+    zone = pds.timezone("America/New_York")
+
+    assert isinstance(zone, pds._compat.ZoneInfo)
+    assert zone is pds.timezone("America/New_York")
+    assert str(zone) == "America/New_York"
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+@pytest.mark.parametrize("key", ["utc", "UTC"])
+def test_timezone_utc_singleton(key):
+    assert pds.timezone(key) is pds.UTC
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_unknown_timezone():
+    with pytest.raises(pds.UnknownTimeZoneError):
+        pds.timezone("Not/A_Zone")
+
+
+def test_mode_switch_keeps_old_shims():
+    wrapper_zone = pds.timezone("Europe/London")
+
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        subclass_zone = pds.timezone("Europe/London")
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    assert not isinstance(wrapper_zone, pds._compat.ZoneInfo)
+    assert isinstance(subclass_zone, pds._compat.ZoneInfo)
+    assert pds.timezone("Europe/London") is wrapper_zone
+
+    dt = datetime(2020, 7, 1, 12)
+    assert_dt_equivalent(
+        dt.replace(tzinfo=subclass_zone), dt.replace(tzinfo=wrapper_zone)
+    )
+
+
+@hypothesis.given(dt=dt_strategy, key=valid_zone_strategy)
+@hypothesis.example(dt=datetime(2020, 11, 1, 1, 30), key="America/New_York")
+@hypothesis.example(dt=datetime(2020, 3, 8, 2, 30), key="America/New_York")
+@pytest.mark.parametrize("is_dst", [True, False])
+def test_localize_matches_wrapper(dt, key, is_dst):
+    wrapper_zone = pds.timezone(key)
+
+    pds.set_zoneinfo_subclass_mode(True)
+    try:
+        subclass_zone = pds.timezone(key)
+    finally:
+        pds.set_zoneinfo_subclass_mode(False)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        dt_wrapper = wrapper_zone.localize(dt, is_dst=is_dst)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        dt_subclass = subclass_zone.localize(dt, is_dst=is_dst)
+
+    assert dt_subclass.tzinfo is subclass_zone
+    assert_dt_equivalent(dt_subclass, dt_wrapper)
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_localize_is_dst_none():
+    zone = pds.timezone("America/New_York")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        with pytest.raises(pds.AmbiguousTimeError):
+            zone.localize(datetime(2020, 11, 1, 1, 30), is_dst=None)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        with pytest.raises(pds.NonExistentTimeError):
+            zone.localize(datetime(2020, 3, 8, 2, 30), is_dst=None)
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_normalize():
+    zone = pds.timezone("America/New_York")
+    dt = datetime(2020, 3, 8, 6, 30, tzinfo=pds.UTC) + timedelta(hours=1)
+
+    with pytest.warns(pds.PytzUsageWarning):
+        dt_normalized = zone.normalize(dt)
+
+    assert dt_normalized.replace(tzinfo=None) == datetime(2020, 3, 8, 3, 30)
+    assert dt_normalized.tzinfo is zone
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_zone_attribute():
+    zone = pds.timezone("Asia/Tokyo")
+
+    with pytest.warns(pds.PytzUsageWarning):
+        assert zone.zone == "Asia/Tokyo"
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+def test_unwrap_shim():
+    zone = pds.timezone("Australia/Sydney")
+    unwrapped = zone.unwrap_shim()
+
+    assert type(unwrapped) is pds._compat.ZoneInfo
+    assert unwrapped is pds.helpers.upgrade_tzinfo(zone)
+    assert not pds.helpers.is_pytz_zone(zone)
+
+
+@pytest.mark.usefixtures("zoneinfo_subclass_mode")
+@pytest.mark.parametrize(
+    "key, dt, offset", _zoneinfo_data.get_unambiguous_cases()
+)
+def test_build_tzinfo(key, dt, offset):
+    zone = pds.build_tzinfo(key, _zoneinfo_data.get_zone_file_obj(key))
+
+    assert isinstance(zone, pds._compat.ZoneInfo)
+    assert type(zone.unwrap_shim()) is pds._compat.ZoneInfo
+
+    with pytest.warns(pds.PytzUsageWarning):
+        dt_localized = zone.localize(dt)
+
+    assert_dt_offset(dt_localized, offset)
+    assert_dt_offset(enfold(dt, fold=0).replace(tzinfo=zone), offset)